@@ -0,0 +1,65 @@
+from typing import List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+
+from app.db.database import get_db
+from app.db.models import AnalysisJob
+from app.schemas.news import AnalysisJobCreate, AnalysisJobResponse
+from app.services.jobs import job_queue
+
+router = APIRouter()
+
+@router.post("", response_model=List[AnalysisJobResponse], status_code=202)
+async def enqueue_analysis_jobs(
+    request: AnalysisJobCreate,
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    뉴스 분석 작업을 큐에 등록하고 즉시 반환합니다. (이미 대기 중인 작업은 재사용)
+    """
+    return await job_queue.enqueue(db, request.news_ids)
+
+@router.get("", response_model=List[AnalysisJobResponse])
+async def read_analysis_jobs(
+    status: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    최근 분석 작업 목록을 조회합니다. (status=dead 로 dead-letter 확인)
+    """
+    query = select(AnalysisJob).order_by(AnalysisJob.id.desc()).limit(limit)
+    if status:
+        query = query.where(AnalysisJob.status == status)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+@router.get("/{job_id}", response_model=AnalysisJobResponse)
+async def read_analysis_job(
+    job_id: int,
+    wait: float = Query(0, ge=0, le=30, description="작업 완료까지 대기할 최대 시간(초), long-poll"),
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    분석 작업 상태를 조회합니다. wait를 지정하면 완료될 때까지(최대 wait초) 기다립니다.
+    """
+    job = await job_queue.wait_for(db, job_id, timeout=wait)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.post("/{job_id}/retry", response_model=AnalysisJobResponse, status_code=202)
+async def retry_analysis_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    dead 상태의 작업을 다시 대기열에 넣습니다.
+    """
+    job = await db.get(AnalysisJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != "dead":
+        raise HTTPException(status_code=409, detail="Only dead jobs can be retried")
+    return await job_queue.retry(db, job)
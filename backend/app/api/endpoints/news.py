@@ -1,97 +1,213 @@
 import json
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, Response
+import logging
+from datetime import datetime, timedelta
+from typing import List, Any, Literal, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.db.database import get_db
-from app.db.models import News
-from app.schemas.news import NewsResponse, NewsCreate
-from app.services.crawler import crawler
-from app.services.analyzer import analyzer
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, get_db
+from app.db.models import AnalysisJob, CorpusStats, KeywordHourlyRollup, News, NewsKeyword, NewsMinhashBand, SentimentRollup, TermDocumentFrequency
+from app.schemas.news import NewsResponse, NewsCreate, NewsBatchAnalysisRequest, AnalysisJobResponse, NewsSearchResult, SentimentBucket, TrendingKeyword
+from app.services.crawl_cache import crawl_news
+from app.services.export import ExportUnavailable, check_available, export_filename, export_media_type, export_news
+from app.services.analysis import analyze_news_once, analyze_news_stream, analyze_batch, select_unanalyzed_ids
+from app.services.ingestion import bulk_upsert_news
+from app.services.jobs import job_queue
+from app.services.keyword_engine import keyword_engine
+from app.services.keyword_index import normalize_keywords, trending_keywords
+from app.services.listing import fetch_news_page, parse_fields
+from app.services.response_cache import is_not_modified, response_cache, validator_headers
+from app.services.search import search_stored_news
+from app.services.sentiment_rollup import sentiment_timeseries
+from app.services.table_versions import bump_version, get_version
+from app.utils.dates import as_naive_utc, utcnow
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 @router.post("/search", response_model=List[NewsResponse])
 async def search_and_save_news(
-    query: str,
+    query: List[str] = Query(...),
+    pages: int = Query(1, ge=1, le=settings.NEWS_API_MAX_PAGES),
     db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
-    1. 외부 API(NewsAPI)를 통해 뉴스를 검색합니다.
+    1. 외부 API(NewsAPI)를 통해 뉴스를 검색합니다. (여러 키워드/페이지는 병렬 조회)
+       같은 검색이 동시에 들어오면 한 번만 수집하고, CRAWL_CACHE_TTL_SECONDS 동안은 수집 결과를 재사용합니다.
     2. 중복되지 않은 뉴스를 DB에 저장합니다.
     3. 저장된 뉴스 목록을 반환합니다.
     """
     # 1. 크롤링 (Mock or Real)
     try:
-        scraped_news_list = await crawler.search_news(query)
+        scraped_news_list = await crawl_news(query, pages=pages)
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"News API connection failed: {str(e)}")
     
-    saved_news = []
-    
-    for news_data in scraped_news_list:
-        # 2. 중복 확인 (URL 기준)
-        result = await db.execute(select(News).where(News.url == news_data.url))
-        existing_news = result.scalars().first()
-        
-        if not existing_news:
-            # 3. 신규 저장
-            new_news = News(
-                title=news_data.title,
-                url=news_data.url,
-                content=news_data.content,
-                image_url=news_data.image_url,
-                published_at=news_data.published_at,
-                # Optional fields (if provided by Crawler/Mock)
-                summary=news_data.summary,
-                sentiment_label=news_data.sentiment_label,
-                sentiment_score=news_data.sentiment_score,
-                keywords=json.dumps(news_data.keywords) if news_data.keywords else None
-            )
-            db.add(new_news)
-            await db.commit() 
-            await db.refresh(new_news)
-            saved_news.append(new_news)
-        else:
-            saved_news.append(existing_news)
-            
-    # 응답 모델 변환 시 keywords 처리
-    responses = []
-    for n in saved_news:
-        # DB 객체를 딕셔너리로 변환 후 keywords 처리하여 검증
-        news_dict = {c.name: getattr(n, c.name) for c in n.__table__.columns}
-        news_dict['keywords'] = json.loads(n.keywords) if n.keywords else []
-        responses.append(NewsResponse.model_validate(news_dict))
-    return responses
-
-@router.get("", response_model=List[NewsResponse])
+    # 2~3. 중복 제거 후 신규 뉴스만 일괄 저장 (단일 트랜잭션)
+    saved_news = await bulk_upsert_news(db, scraped_news_list)
+
+    # 4. 미분석 뉴스 자동 분석 등록 (설정 시)
+    if settings.JOB_AUTO_ENQUEUE:
+        await job_queue.enqueue_unanalyzed(db, saved_news)
+
+    return [NewsResponse.from_model(n) for n in saved_news]
+
+@router.get("/search", response_model=List[NewsSearchResult])
+async def search_stored_news_list(
+    q: str = Query(..., min_length=1),
+    sentiment: Optional[Literal["positive", "negative", "neutral"]] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    DB에 저장된 뉴스를 전문 검색(FTS5, BM25 순위)합니다. 외부 API를 호출하지 않습니다.
+    제목/본문/요약/키워드를 대상으로 하며 감성 라벨과 발행일 범위로 필터링할 수 있습니다.
+    """
+    results = await search_stored_news(db, q, sentiment, date_from, date_to, limit, offset)
+    return [
+        NewsSearchResult(**NewsResponse.from_model(n).model_dump(), score=score, snippet=snippet)
+        for n, score, snippet in results
+    ]
+
+@router.get("/keywords/trending", response_model=List[TrendingKeyword])
+async def read_trending_keywords(
+    hours: int = Query(24, ge=1, le=24 * 90),
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    최근 hours 시간 동안 가장 많이 등장한 키워드와 평균 감성 점수를 조회합니다.
+    시간별 집계 테이블만 조회하므로 전체 뉴스 수와 무관하게 빠릅니다.
+    """
+    return await trending_keywords(db, hours, limit)
+
+# 버킷 단위별 (기본 조회 기간, 최대 버킷 수)
+TIMESERIES_WINDOWS = {"hour": (timedelta(hours=48), 24 * 90), "day": (timedelta(days=30), 366 * 5)}
+
+@router.get("/sentiment/timeseries", response_model=List[SentimentBucket])
+async def read_sentiment_timeseries(
+    keyword: str = "",
+    bucket: Literal["hour", "day"] = "day",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    버킷(시간/일, UTC)별 감성 라벨 수와 평균/백분위 감성 점수를 조회합니다.
+    keyword: 분석 시 추출된 기사 키워드(상위 5개, trending과 같은 값) 중 하나와 일치하는 기사만 집계
+      (수집 검색어가 아님, 비우면 전체 기사). 분석 시 증분 갱신되는 집계 테이블만 조회합니다.
+    기간 기본값: 최근 48시간(hour) / 30일(day)
+    """
+    default_span, max_buckets = TIMESERIES_WINDOWS[bucket]
+    end = as_naive_utc(end) if end else utcnow()
+    start = as_naive_utc(start) if start else end - default_span
+    step = timedelta(hours=1) if bucket == "hour" else timedelta(days=1)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    if (end - start) / step >= max_buckets:
+        raise HTTPException(status_code=400, detail=f"Range too large for bucket={bucket} (max {max_buckets} buckets)")
+    keyword = next(iter(normalize_keywords([keyword])), "")
+    return await sentiment_timeseries(db, keyword, bucket, start, end)
+
+@router.get("", response_model=None, responses={200: {"model": List[NewsResponse]}})
 async def read_news_list(
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: id,title,summary)"),
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db)
-) -> Any:
+) -> Response:
     """
     DB에 저장된 뉴스 목록을 최신순으로 조회합니다.
+    - cursor: (created_at, id) 기준 keyset 페이지네이션. 다음 페이지 cursor는 X-Next-Cursor 헤더로 반환
+      (skip은 하위 호환용이며 깊은 페이지일수록 느려집니다)
+    - fields: 필요한 컬럼만 조회 (예: 본문(content) 제외)
+    - ETag/Last-Modified는 뉴스 테이블 버전(수집/분석 시 증가)으로 계산하며,
+      If-None-Match/If-Modified-Since가 일치하면 뉴스 행을 조회하지 않고 304를 반환합니다.
+    - 같은 파라미터의 반복 요청은 버전이 같은 동안 직렬화된 응답 캐시에서 반환합니다.
     """
-    query = select(News).order_by(News.created_at.desc()).offset(skip).limit(limit)
-    result = await db.execute(query)
-    news_list = result.scalars().all()
-    
-    responses = []
-    for n in news_list:
-        news_dict = {c.name: getattr(n, c.name) for c in n.__table__.columns}
-        news_dict['keywords'] = json.loads(n.keywords) if n.keywords else []
-        responses.append(NewsResponse.model_validate(news_dict))
-    return responses
-
-@router.post("/analysis/{news_id}", response_model=NewsResponse)
+    try:
+        selected = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    version, updated_at = await get_version(db)
+    validators = validator_headers(version, updated_at)
+    if is_not_modified(if_none_match, if_modified_since, version, updated_at):
+        return Response(status_code=304, headers=validators)
+
+    cache_key = (tuple(selected), limit, cursor, skip)
+    cached = response_cache.get(cache_key, version) if settings.RESPONSE_CACHE_ENABLED else None
+    if cached is not None:
+        return Response(content=cached.body, media_type="application/json", headers={**cached.headers, **validators})
+
+    try:
+        items, next_cursor = await fetch_news_page(db, selected, limit, cursor, skip)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    body = json.dumps(items, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode()
+    if settings.RESPONSE_CACHE_ENABLED:
+        response_cache.set(cache_key, version, body, headers)
+    return Response(content=body, media_type="application/json", headers={**headers, **validators})
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_news_list(
+    format: Literal["ndjson", "csv", "parquet"] = "ndjson",
+    since: Optional[datetime] = Query(None, description="이 시각 이후 수집된 뉴스만 (created_at 기준)"),
+    fields: Optional[str] = Query(None, description="내보낼 필드 (쉼표 구분, 예: id,title,summary)"),
+    compression: Literal["none", "gzip", "zstd"] = "none",
+) -> StreamingResponse:
+    """
+    저장된 뉴스를 수집 순서(created_at, id 오름차순)로 내보냅니다. (오프라인 분석용)
+    DB 커서에서 EXPORT_CHUNK_SIZE행씩 읽어 바로 전송하므로 행 수와 무관하게 메모리 사용량이 일정합니다.
+    - ndjson/csv는 compression으로 파일 전체를 gzip/zstd 압축 (zstd는 zstandard 패키지 필요)
+    - parquet(pyarrow 패키지 필요)은 청크마다 row group을 쓰며 compression은 컬럼 압축 코덱으로 적용
+    """
+    try:
+        selected = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        check_available(format, compression)
+    except ExportUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    return StreamingResponse(
+        export_news(format, selected, since, compression),
+        media_type=export_media_type(format, compression),
+        headers={"Content-Disposition": f'attachment; filename="{export_filename(format, compression)}"'},
+    )
+
+@router.post(
+    "/analysis/{news_id}",
+    response_model=NewsResponse,
+    responses={202: {"model": AnalysisJobResponse, "description": "background=true: 분석 작업 등록됨"}},
+)
 async def analyze_news_item(
     news_id: int,
+    background: bool = False,
     db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     특정 ID의 뉴스를 AI로 분석(요약/감성)하고 DB를 업데이트합니다.
+    background=true 이면 분석 작업을 큐에 등록하고 202와 작업 정보를 즉시 반환합니다.
+    (상태 조회: GET /jobs/{job_id})
     """
     # 1. DB 조회
     result = await db.execute(select(News).where(News.id == news_id))
@@ -99,24 +215,88 @@ async def analyze_news_item(
     
     if not news_item:
         raise HTTPException(status_code=404, detail="News not found")
+
+    if background:
+        [job] = await job_queue.enqueue(db, [news_id])
+        return JSONResponse(
+            status_code=202,
+            content=AnalysisJobResponse.model_validate(job).model_dump(mode="json"),
+        )
         
-    # 2. AI 분석 수행 (Mock or Real)
-    text_to_analyze = news_item.content if news_item.content else news_item.title
-    analysis_result = await analyzer.analyze_content(news_item.title, text_to_analyze)
-    
-    # 3. 결과 업데이트 (키워드 포함)
-    news_item.summary = analysis_result.summary
-    news_item.sentiment_label = analysis_result.sentiment_label
-    news_item.sentiment_score = analysis_result.sentiment_score
-    news_item.keywords = json.dumps(analysis_result.keywords)
-    
-    await db.commit()
-    await db.refresh(news_item)
-    
-    news_dict = {c.name: getattr(news_item, c.name) for c in news_item.__table__.columns}
-    news_dict['keywords'] = analysis_result.keywords
-    
-    return NewsResponse.model_validate(news_dict)
+    # 2~3. AI 분석 수행 (Mock or Real) 및 결과 업데이트 (키워드 포함, 같은 기사 동시 요청은 한 번만 분석)
+    news_item = await analyze_news_once(db, news_item)
+
+    return NewsResponse.from_model(news_item)
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=_json_default)}\n\n"
+
+@router.get("/analysis/{news_id}/stream")
+async def stream_news_analysis(
+    news_id: int,
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """
+    특정 ID의 뉴스를 AI로 분석하며 요약을 생성되는 대로 SSE(text/event-stream)로 전송합니다.
+    이벤트: summary({"delta"}) 반복 -> sentiment -> done(NewsResponse), 실패 시 error
+    분석이 끝나면 결과는 POST /analysis/{news_id}와 동일하게 저장됩니다.
+    """
+    result = await db.execute(select(News.id).where(News.id == news_id))
+    if result.scalar() is None:
+        raise HTTPException(status_code=404, detail="News not found")
+
+    async def event_stream():
+        # 응답 전송 중에도 유지되도록 스트림 전용 세션 사용
+        async with AsyncSessionLocal() as session:
+            try:
+                result = await session.execute(select(News).where(News.id == news_id))
+                news_item = result.scalars().first()
+                if news_item is None:
+                    yield _sse("error", {"detail": "News not found"})
+                    return
+                async for part in analyze_news_stream(session, news_item):
+                    if isinstance(part, str):
+                        yield _sse("summary", {"delta": part})
+                    else:
+                        news_item = part
+            except Exception as e:
+                logger.error("Streaming analysis failed for news %s: %s", news_id, e)
+                await session.rollback()
+                yield _sse("error", {"detail": str(e)})
+                return
+        yield _sse("sentiment", {
+            "sentiment_label": news_item.sentiment_label,
+            "sentiment_score": news_item.sentiment_score,
+        })
+        yield _sse("done", NewsResponse.from_model(news_item).model_dump(mode="json"))
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.post("/analysis")
+async def analyze_news_batch(
+    request: NewsBatchAnalysisRequest,
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """
+    여러 뉴스를 동시에 AI 분석합니다. (ID 목록 또는 미분석 뉴스 전체)
+    결과는 완료되는 순서대로 NDJSON(한 줄에 하나의 결과)으로 스트리밍됩니다.
+    """
+    if request.all_unanalyzed:
+        news_ids = await select_unanalyzed_ids(db, request.limit)
+    else:
+        news_ids = request.ids[:request.limit]
+    if not news_ids and not request.all_unanalyzed:
+        raise HTTPException(status_code=400, detail="Either 'ids' or 'all_unanalyzed' must be provided")
+
+    async def ndjson_stream():
+        async for item in analyze_batch(news_ids):
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
 
 @router.delete("/reset", status_code=204)
 async def reset_db(
@@ -126,7 +306,16 @@ async def reset_db(
     DB의 모든 뉴스 데이터를 삭제합니다. (개발 및 테스트용)
     """
     from sqlalchemy import delete
+    await db.execute(delete(AnalysisJob))
+    await db.execute(delete(NewsKeyword))
+    await db.execute(delete(KeywordHourlyRollup))
+    await db.execute(delete(SentimentRollup))
+    await db.execute(delete(TermDocumentFrequency))
+    await db.execute(delete(CorpusStats))
+    await db.execute(delete(NewsMinhashBand))
     await db.execute(delete(News))
+    await bump_version(db)
     await db.commit()
+    keyword_engine.reset()
     return
 
@@ -0,0 +1,113 @@
+from typing import List, Any
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.db.database import get_db
+from app.db.models import WatchQuery
+from app.schemas.watchlist import WatchQueryCreate, WatchQueryUpdate, WatchQueryResponse, SchedulerStatus
+from app.services.scheduler import scheduler
+
+router = APIRouter()
+
+async def _get_watch_or_404(db: AsyncSession, watch_id: int) -> WatchQuery:
+    watch = await db.get(WatchQuery, watch_id)
+    if not watch:
+        raise HTTPException(status_code=404, detail="Watch query not found")
+    return watch
+
+@router.get("", response_model=List[WatchQueryResponse])
+async def read_watch_list(
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    등록된 관심 키워드 목록과 최근 실행 상태를 조회합니다.
+    """
+    result = await db.execute(select(WatchQuery).order_by(WatchQuery.id))
+    return result.scalars().all()
+
+@router.post("", response_model=WatchQueryResponse, status_code=201)
+async def create_watch_query(
+    request: WatchQueryCreate,
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    관심 키워드를 등록합니다. 다음 스케줄러 주기에 첫 수집이 실행됩니다.
+    이미 등록된 키워드면 409 (동시 등록도 query 유니크 제약으로 판정)
+    """
+    watch = WatchQuery(
+        query=request.query.strip(),
+        pages=request.pages,
+        interval_seconds=request.interval_seconds or settings.SCHEDULER_DEFAULT_INTERVAL_SECONDS,
+        enabled=request.enabled,
+    )
+    db.add(watch)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Watch query already exists")
+    await db.refresh(watch)
+    return watch
+
+@router.get("/status", response_model=SchedulerStatus)
+async def read_scheduler_status(
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    스케줄러 실행 여부와 키워드별 최근 수집 지연시간/기사 수를 조회합니다.
+    """
+    result = await db.execute(select(WatchQuery).order_by(WatchQuery.id))
+    return SchedulerStatus(
+        enabled=settings.SCHEDULER_ENABLED,
+        running=scheduler.running,
+        tick_seconds=settings.SCHEDULER_TICK_SECONDS,
+        last_tick_at=scheduler.last_tick_at,
+        total_runs=scheduler.total_runs,
+        total_failures=scheduler.total_failures,
+        watches=[WatchQueryResponse.model_validate(w) for w in result.scalars()],
+    )
+
+@router.patch("/{watch_id}", response_model=WatchQueryResponse)
+async def update_watch_query(
+    watch_id: int,
+    request: WatchQueryUpdate,
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    관심 키워드의 수집 설정(페이지 수, 주기, 활성화)을 수정합니다.
+    """
+    watch = await _get_watch_or_404(db, watch_id)
+    for field, value in request.model_dump(exclude_unset=True, exclude_none=True).items():
+        setattr(watch, field, value)
+    await db.commit()
+    await db.refresh(watch)
+    return watch
+
+@router.delete("/{watch_id}", status_code=204)
+async def delete_watch_query(
+    watch_id: int,
+    db: AsyncSession = Depends(get_db)
+) -> None:
+    """
+    관심 키워드를 삭제합니다. (이미 수집된 뉴스는 유지)
+    """
+    watch = await _get_watch_or_404(db, watch_id)
+    await db.delete(watch)
+    await db.commit()
+    return
+
+@router.post("/{watch_id}/run", response_model=WatchQueryResponse)
+async def run_watch_query(
+    watch_id: int,
+    db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    관심 키워드를 즉시 수집합니다. (다음 실행 시각도 다시 계산)
+    """
+    await _get_watch_or_404(db, watch_id)
+    # 수집하는 동안 읽기 트랜잭션/커넥션을 반환 (run_query는 전용 세션 사용)
+    await db.commit()
+    return await scheduler.run_query(watch_id)
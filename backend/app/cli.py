@@ -0,0 +1,111 @@
+"""
+관리용 명령줄 도구
+
+실행: (backend 디렉터리에서) python -m app.cli <command>
+  migrate            스키마를 최신 리비전으로 업그레이드 (migrations/versions, 이전 방식 DB는 baseline으로 표시)
+  fts-rebuild        전문 검색 인덱스(news_fts)를 기존 뉴스 전체로 다시 생성
+  backfill-keywords  News.keywords(JSON)로 news_keywords 테이블과 시간별 키워드/감성 집계를 다시 생성
+  rebuild-df         저장된 뉴스 전체로 키워드 엔진의 문서 빈도(DF)를 다시 계산
+  rescore-keywords   현재 DF와 KEYWORD_ENGINE으로 모든 뉴스의 키워드를 다시 계산 (색인/집계 포함)
+  rebuild-clusters   모든 뉴스의 MinHash 서명와 유사 중복 묶음(cluster_id)을 다시 계산
+  fetch-bodies       본문을 수집하지 않은 기사의 원문 본문을 수집 (중단 후 다시 실행하면 이어서 수집)
+"""
+import argparse
+import asyncio
+import time
+
+from app.db.database import AsyncSessionLocal, engine
+from app.db.fts import rebuild_fts
+from app.db.migrations import head_revision, upgrade_database
+from app.services.body_fetcher import body_fetcher
+from app.services.dedup import rebuild_clusters
+from app.services.keyword_engine import keyword_engine
+from app.services.keyword_index import rebuild_keyword_index
+
+
+async def migrate() -> None:
+    async with engine.begin() as conn:
+        before = await conn.run_sync(upgrade_database)
+    await engine.dispose()
+    print(f"[INFO] Schema upgraded: {before or '(none)'} -> {head_revision()}")
+
+
+async def fts_rebuild() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(rebuild_fts)
+    await engine.dispose()
+    print("[INFO] news_fts index rebuilt")
+
+
+async def backfill_keywords() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_database)  # 신규 테이블 생성
+    async with AsyncSessionLocal() as db:
+        processed = await rebuild_keyword_index(db)
+    await engine.dispose()
+    print(f"[INFO] Keyword index rebuilt from {processed} news rows")
+
+
+async def rebuild_df() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_database)
+    async with AsyncSessionLocal() as db:
+        processed = await keyword_engine.rebuild(db)
+    await engine.dispose()
+    print(f"[INFO] Document frequencies rebuilt from {processed} news rows")
+
+
+async def rescore_keywords() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_database)
+    async with AsyncSessionLocal() as db:
+        start = time.perf_counter()
+        processed = await keyword_engine.rescore_all(db)
+        elapsed = time.perf_counter() - start
+        await rebuild_keyword_index(db)
+    await engine.dispose()
+    print(f"[INFO] Rescored keywords of {processed} news rows in {elapsed:.1f}s")
+
+
+async def rebuild_clusters_command() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_database)
+    async with AsyncSessionLocal() as db:
+        linked = await rebuild_clusters(db)
+    await engine.dispose()
+    print(f"[INFO] Clusters rebuilt, {linked} news rows linked to an earlier article")
+
+
+async def fetch_bodies() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_database)
+    totals: dict = {}
+    while counts := await body_fetcher.run_pending():
+        for status, count in counts.items():
+            totals[status] = totals.get(status, 0) + count
+        print(f"[INFO] {sum(totals.values())} articles processed: {totals}")
+    await body_fetcher.shutdown()
+    await engine.dispose()
+    print(f"[INFO] Article bodies up to date: {totals or 'nothing to fetch'}")
+
+
+COMMANDS = {
+    "migrate": migrate,
+    "fts-rebuild": fts_rebuild,
+    "backfill-keywords": backfill_keywords,
+    "rebuild-df": rebuild_df,
+    "rescore-keywords": rescore_keywords,
+    "rebuild-clusters": rebuild_clusters_command,
+    "fetch-bodies": fetch_bodies,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="News Insight Pro admin commands")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+    asyncio.run(COMMANDS[args.command]())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import os
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -12,13 +13,127 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     
     # [Database]
-    DATABASE_URL: str = "sqlite+aiosqlite:///./news_insight.db"
+    DATABASE_URL: str = "sqlite+aiosqlite:///./news_insight.db" # PostgreSQL: postgresql+asyncpg://user:pw@host/db
+    # development: SQL 로그 출력, 기본 저널 / production: 로그 끔, SQLite WAL 및 아래 PRAGMA 적용
+    DB_PROFILE: Literal["development", "production"] = "production"
+    DB_ECHO: Optional[bool] = None # 지정 시 프로필의 SQL 로그 설정 대신 사용
+    # 커넥션 풀 (SQLite 메모리 DB 제외)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE_SECONDS: int = 1800 # 이 시간보다 오래된 커넥션은 재연결
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0 # 풀이 가득 찼을 때 커넥션 대기 시간
+    # SQLite PRAGMA (production 프로필, 커넥션마다 적용)
+    SQLITE_SYNCHRONOUS: str = "NORMAL" # WAL에서는 NORMAL도 커밋 손상 없음 (전원 장애 시 마지막 트랜잭션만 유실 가능)
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024 # 메모리 매핑 I/O 크기 (bytes)
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024 # 커넥션별 페이지 캐시 크기
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000 # 쓰기 잠금 대기 시간 (모든 프로필)
+    # 앱 시작 시 스키마 마이그레이션 적용 (False: 배포 단계에서 python -m app.cli migrate 실행)
+    DB_MIGRATE_ON_STARTUP: bool = True
     
     # [External APIs]
     OPENAI_API_KEY: str = ""
     NEWS_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-4o-mini"
+    OPENAI_BASE_URL: str = "" # OpenAI 호환 서버 주소 (비우면 기본 API)
+    NEWS_API_BASE_URL: str = "https://newsapi.org/v2/everything" # 부하 테스트 시 가짜 서버 주소로 변경
+
+    # [Analysis]
+    # 일괄 분석 시 동시에 진행할 LLM 호출 수
+    ANALYSIS_CONCURRENCY: int = 5
+    # 동일 기사(제목+본문 해시) 재분석 시 LLM 호출을 생략하는 캐시
+    ANALYSIS_CACHE_ENABLED: bool = True
+    ANALYSIS_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    ANALYSIS_CACHE_MAX_SIZE: int = 1024 # 메모리(LRU) 계층 최대 항목 수
+    ANALYSIS_CACHE_PERSISTENT: bool = True # SQLite 테이블 계층 사용 여부
+    # 여러 기사를 한 번의 LLM 요청으로 묶어 분석 (기본값 1: 기사별 요청, 2 이상으로 설정 시 사용)
+    ANALYSIS_PACK_SIZE: int = 1 # 요청당 최대 기사 수
+    ANALYSIS_PACK_TOKEN_BUDGET: int = 3000 # 요청당 입력 토큰 예산 (추정치)
+    ANALYSIS_PACK_WAIT_MS: int = 20 # 묶음을 채우기 위해 기다리는 최대 시간
     
+    # [Response Cache] GET /news 목록 응답 캐시 (ETag/조건부 GET은 항상 사용)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_SIZE: int = 256 # 캐시할 목록 응답(파라미터 조합) 수
+
+    # [Export] GET /news/export 대량 내보내기
+    EXPORT_CHUNK_SIZE: int = 1000 # DB 커서에서 한 번에 읽는 행 수 (Parquet row group 크기)
+
+    # [Sentiment] 로컬 감성 모델 (사전 기반, CPU 전용)
+    # llm: LLM 결과만 사용, primary: 항상 로컬 모델 사용 (LLM은 요약 전용 프롬프트로 요약만 담당),
+    # fallback: LLM 실패/미설정 시 로컬 모델 사용, prefilter: 로컬 점수가 확실하면 로컬(요약 전용 프롬프트), 애매하면 LLM
+    SENTIMENT_MODE: Literal["llm", "primary", "fallback", "prefilter"] = "fallback"
+    SENTIMENT_PREFILTER_THRESHOLD: float = 0.5 # prefilter에서 로컬 결과를 채택할 최소 |점수|
+    SENTIMENT_MODEL_PATH: str = "" # 가중치 파일(.npz) 경로 (비우면 기본 사전)
+
+    # [HTTP Client] NewsAPI 호출용 공유 커넥션 풀
+    HTTP_MAX_CONNECTIONS: int = 20
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_TIMEOUT_SECONDS: float = 10.0
+    HTTP2_ENABLED: bool = False # h2 패키지 필요 (pip install httpx[http2])
+    # 429/5xx 응답 재시도 (지수 백오프, Retry-After 헤더 우선)
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_BACKOFF_BASE_SECONDS: float = 0.5
+    HTTP_BACKOFF_MAX_SECONDS: float = 30.0
+    # NewsAPI 호출 속도 제한 (토큰 버킷, 0 이하이면 제한 없음)
+    NEWS_API_RATE_PER_SECOND: float = 1.0
+    NEWS_API_BURST: int = 5
+    # 페이지 단위 병렬 수집
+    NEWS_API_PAGE_SIZE: int = 10
+    NEWS_API_MAX_PAGES: int = 10 # 키워드당 최대 페이지 수
+    NEWS_API_CONCURRENCY: int = 4 # 동시에 요청할 페이지 수
+    # 검색(POST /news/search) 수집 결과 캐시 (같은 키워드/페이지 수, 0이면 사용 안 함)
+    # 동시에 들어온 같은 검색은 캐시와 별개로 항상 한 번의 수집으로 합쳐집니다.
+    CRAWL_CACHE_TTL_SECONDS: int = 60
+    CRAWL_CACHE_MAX_SIZE: int = 256
+
+    # [Scheduler] 관심 키워드(watch-list) 백그라운드 수집
+    SCHEDULER_ENABLED: bool = False
+    SCHEDULER_TICK_SECONDS: float = 30.0 # 실행 대상 확인 주기
+    SCHEDULER_DEFAULT_INTERVAL_SECONDS: int = 900
+    SCHEDULER_JITTER_RATIO: float = 0.1 # 실행 간격을 ±10% 무작위 분산
+    SCHEDULER_MAX_BACKOFF_SECONDS: int = 6 * 3600 # 연속 실패 시 최대 대기
+
+    # [Article Body] 기사 원문 본문 수집 (NewsAPI content는 약 200자로 잘려 있음)
+    BODY_FETCH_ENABLED: bool = False # API 프로세스에서 백그라운드 수집 (python -m app.cli fetch-bodies로도 실행)
+    BODY_FETCH_POLL_SECONDS: float = 30.0 # 수집 대상 확인 주기
+    BODY_FETCH_BATCH_SIZE: int = 50
+    BODY_FETCH_CONCURRENCY: int = 8 # 전체 동시 요청 수
+    BODY_FETCH_PER_HOST: int = 2 # 같은 호스트에 대한 동시 요청 수
+    BODY_FETCH_HOST_DELAY_SECONDS: float = 1.0 # 같은 호스트 요청 시작 간 최소 간격 (robots.txt Crawl-delay가 더 길면 그 값)
+    BODY_FETCH_TIMEOUT_SECONDS: float = 15.0
+    BODY_FETCH_MAX_BYTES: int = 2 * 1024 * 1024 # 이보다 큰 문서는 앞부분만 사용
+    BODY_FETCH_MAX_REDIRECTS: int = 5 # hop마다 robots.txt/호스트별 제한 재적용
+    BODY_FETCH_ALLOW_PRIVATE_ADDRESSES: bool = False # 사설/루프백 주소 요청 허용 (로컬 테스트 전용)
+    BODY_FETCH_MAX_ATTEMPTS: int = 3 # 초과 시 더 이상 재시도하지 않음
+    BODY_FETCH_RETRY_BACKOFF_SECONDS: float = 600.0 # 재시도 지연 (시도마다 2배)
+    BODY_FETCH_ROBOTS_TTL_SECONDS: int = 3600 # 호스트별 robots.txt 캐시 시간
+    BODY_FETCH_USER_AGENT: str = "NewsInsightBot/1.0" # robots.txt 규칙 대조에도 사용
+
+    # [Jobs] 비동기 분석 작업 큐
+    JOB_WORKERS: int = 2 # API 프로세스에서 실행할 워커 수 (0: 별도 워커 프로세스 사용)
+    JOB_MAX_ATTEMPTS: int = 3 # 초과 시 dead 상태로 이동
+    JOB_RETRY_BACKOFF_SECONDS: float = 10.0 # 재시도 지연 (시도마다 2배)
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_STALE_SECONDS: int = 300 # 이 시간 이상 running인 작업은 워커 중단으로 보고 재대기
+    JOB_AUTO_ENQUEUE: bool = False # 수집된 미분석 뉴스 자동 분석
+
+    # [Keywords] 키워드 추출 엔진
+    # frequency: 문서 내 빈도(기존 방식), tfidf / bm25: 저장된 뉴스 전체의 문서 빈도(DF)로 가중
+    KEYWORD_ENGINE: Literal["frequency", "tfidf", "bm25"] = "bm25"
+    KEYWORD_BIGRAMS: bool = True # 두 단어 키워드(바이그램) 후보 포함
+    KEYWORD_DF_REFRESH_SECONDS: int = 300 # 메모리 DF 사본 백그라운드 재적재 주기 (다른 프로세스의 수집 반영)
+
+    # [Dedup] 유사 중복 기사(MinHash) 묶음
+    DEDUP_ENABLED: bool = True
+    DEDUP_MIN_SIMILARITY: float = 0.8 # 같은 기사로 볼 최소 자카드 유사도 (단어 3-gram 기준)
+    DEDUP_MIN_TOKENS: int = 8 # 단어 수가 이보다 적으면 중복 판정 안 함
+    DEDUP_REUSE_ANALYSIS: bool = True # 같은 묶음의 분석 결과를 재사용하여 LLM 호출 생략
+
+    # [Observability]
+    METRICS_ENABLED: bool = True # GET /metrics (Prometheus 텍스트 형식) 및 요청/DB 쿼리 시간 측정
+    LOG_FORMAT: str = "text" # text: "[LEVEL] message" / json: 요청 ID를 포함한 한 줄 JSON
+    LOG_LEVEL: str = "INFO"
+
     # [Mode]
     # True: 가짜 데이터 사용, False: 실제 API 사용
     USE_MOCK_DATA: bool = False 
@@ -0,0 +1,52 @@
+"""
+애플리케이션 로그 설정
+
+- 모듈별로 logging.getLogger(__name__)을 사용하며 "app" 로거 아래로 모입니다. (uvicorn 로그 설정과 분리)
+- LOG_FORMAT=text: 기존 출력과 같은 "[LEVEL] message" / json: 한 줄 JSON (요청 ID 포함)
+- 요청 ID는 RequestContextMiddleware가 요청마다 request_id_var에 설정합니다.
+"""
+import json
+import logging
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.core.config import settings
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+TEXT_FORMAT = "[%(levelname)s] %(message)s"
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def configure_logging(log_format: Optional[str] = None, level: Optional[str] = None) -> logging.Logger:
+    logger = logging.getLogger("app")
+    handler = logging.StreamHandler(sys.stdout)
+    handler.addFilter(RequestIdFilter())
+    handler.setFormatter(JsonFormatter() if (log_format or settings.LOG_FORMAT) == "json" else logging.Formatter(TEXT_FORMAT))
+    logger.handlers[:] = [handler]
+    logger.setLevel(level or settings.LOG_LEVEL)
+    logger.propagate = False
+    return logger
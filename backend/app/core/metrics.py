@@ -0,0 +1,191 @@
+"""
+Prometheus 텍스트 형식 지표 (외부 의존성 없음)
+
+- Counter / Histogram은 라벨 값 조합별로 누적하며, GET /metrics에서 REGISTRY.render()로 노출합니다.
+- 프로세스별 값입니다. (별도 분석 워커 프로세스(app.worker)의 지표는 API 서버에 포함되지 않음)
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# 초 단위 (외부 API/LLM 호출까지 포함하도록 30초까지)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+            *self._samples(),
+        ]
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> Iterator[str]:
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(list(zip(self.labelnames, key)))} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 조합 -> [구간별 관측 수(마지막은 +Inf), 합계]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)  # value <= le 인 첫 구간
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """블록 실행 시간을 관측합니다. outcome 라벨이 있고 지정하지 않았으면 예외 여부로 ok/error를 채웁니다."""
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            yield
+        except BaseException:
+            outcome = "error"
+            raise
+        finally:
+            if "outcome" in self.labelnames:
+                labels.setdefault("outcome", outcome)
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def _samples(self) -> Iterator[str]:
+        for key, (counts, total) in sorted(self._values.items()):
+            pairs = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                yield f"{self.name}_bucket{_format_labels(pairs + [('le', le)])} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(pairs)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(pairs)} {cumulative}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), **kwargs) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, **kwargs))
+
+    def render(self) -> str:
+        lines = [line for metric in self._metrics.values() for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# [HTTP]
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status"))
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP request latency (streaming responses until the last chunk).",
+    ("method", "route"))
+
+# [External calls]
+NEWSAPI_REQUEST_DURATION = REGISTRY.histogram(
+    "newsapi_request_duration_seconds", "NewsAPI page fetch latency including retries.", ("outcome",))
+LLM_REQUEST_DURATION = REGISTRY.histogram(
+    "llm_request_duration_seconds", "OpenAI chat completion latency.", ("mode", "outcome"))
+LLM_TOKENS = REGISTRY.counter(
+    "llm_tokens_total", "LLM token usage reported in the response usage field.", ("mode", "type"))
+BODY_FETCH_DURATION = REGISTRY.histogram(
+    "article_body_fetch_duration_seconds", "Article page fetch latency including politeness waits.", ("status",))
+
+# [Pipeline]
+STAGE_DURATION = REGISTRY.histogram(
+    "pipeline_stage_duration_seconds", "Ingestion pipeline stage latency.", ("stage",))
+NEWS_INGESTED = REGISTRY.counter("news_ingested_total", "Newly stored articles.")
+NEWS_DEDUPLICATED = REGISTRY.counter(
+    "news_deduplicated_total",
+    "Articles deduplicated: url = already stored or repeated in the batch, near_duplicate = linked to a cluster.",
+    ("kind",))
+NEWS_ANALYZED = REGISTRY.counter("news_analyzed_total", "Analysis results saved.")
+COALESCED_CALLS = REGISTRY.counter(
+    "coalesced_calls_total", "Calls that joined an in-flight crawl/analysis instead of starting one.", ("operation",))
+CRAWL_CACHE_LOOKUPS = REGISTRY.counter(
+    "crawl_cache_lookups_total", "Crawl result cache lookups (POST /news/search).", ("result",))
+
+# [Database]
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "db_query_duration_seconds", "SQL statement execution latency.", ("operation",))
+DB_SESSION_DURATION = REGISTRY.histogram(
+    "db_session_duration_seconds", "Request-scoped DB session lifetime (get_db).")
@@ -0,0 +1,69 @@
+import re
+import time
+import uuid
+
+from app.core.config import settings
+from app.core.logs import request_id_var
+from app.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+
+# 클라이언트가 보낸 X-Request-ID는 이 형식일 때만 사용 (로그 주입 방지)
+_REQUEST_ID = re.compile(r"[\w.:-]{1,128}")
+
+
+def route_template(scope) -> str:
+    """
+    매칭된 라우트의 경로 템플릿 (없으면 <unmatched>)
+    FastAPI 버전에 따라 하위 라우터 라우트의 path에 prefix가 빠져 있으므로,
+    실제 경로에서 라우트 패턴과 일치하는 뒷부분을 찾아 그 앞부분을 prefix로 붙입니다.
+    """
+    route = scope.get("route")
+    path_regex = getattr(route, "path_regex", None)
+    if path_regex is None:
+        return "<unmatched>"
+    path = scope["path"]
+    for i in range(len(path) + 1):
+        if (i == len(path) or path[i] == "/") and path_regex.match(path[i:]):
+            return path[:i] + route.path
+    return route.path
+
+
+class RequestContextMiddleware:
+    """
+    요청 ID 부여(X-Request-ID 요청/응답 헤더)와 라우트별 요청 수/처리 시간 측정 (순수 ASGI, 스트리밍 응답 유지)
+    라우트 라벨은 경로 템플릿(예: /api/v1/news/analysis/{news_id})이며, 일치하는 라우트가 없으면 <unmatched>입니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                candidate = value.decode("latin-1")
+                request_id = candidate if _REQUEST_ID.fullmatch(candidate) else None
+                break
+        request_id = request_id or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_request_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message = {**message, "headers": [*message.get("headers", ()), (b"x-request-id", request_id.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            if settings.METRICS_ENABLED:
+                route = route_template(scope)
+                HTTP_REQUEST_DURATION.observe(time.perf_counter() - start, method=scope["method"], route=route)
+                HTTP_REQUESTS.inc(method=scope["method"], route=route, status=status)
+            request_id_var.reset(token)
@@ -1,14 +1,89 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
+from app.core.metrics import DB_QUERY_DURATION, DB_SESSION_DURATION
+
+# 프로필별 기본값: (SQL 로그 출력, SQLite WAL 및 PRAGMA 튜닝)
+DB_PROFILES = {
+    "development": {"echo": True, "tuned": False},
+    "production": {"echo": False, "tuned": True},
+}
+
+
+def database_url(url: str) -> str:
+    """postgres:// 또는 드라이버 없는 postgresql:// URL은 asyncpg 드라이버로 연결"""
+    parsed = make_url(url)
+    if parsed.drivername in ("postgres", "postgresql"):
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    return parsed.render_as_string(hide_password=False)
+
+
+def engine_options(url: str) -> dict:
+    """DB_PROFILE과 백엔드(SQLite/PostgreSQL)에 맞는 create_async_engine 인자"""
+    profile = DB_PROFILES[settings.DB_PROFILE]
+    options = {"echo": profile["echo"] if settings.DB_ECHO is None else settings.DB_ECHO}
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        # check_same_thread=False는 SQLite에서만 필요 (비동기 처리 시 스레드 체크 우회)
+        options["connect_args"] = {"check_same_thread": False}
+        if parsed.database in (None, "", ":memory:"):
+            return options  # 메모리 DB는 단일 커넥션 풀 사용
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_pre_ping=parsed.get_backend_name() != "sqlite",
+    )
+    return options
+
+
+def sqlite_pragmas(tuned: bool) -> list:
+    pragmas = [f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}"]
+    if tuned:
+        # WAL: 쓰기 중에도 읽기가 막히지 않음
+        pragmas += [
+            "PRAGMA journal_mode=WAL",
+            f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+            f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}",
+            f"PRAGMA cache_size={-int(settings.SQLITE_CACHE_SIZE_KB)}",  # 음수: KiB 단위
+        ]
+    return pragmas
+
 
 # 비동기 엔진 생성
-# check_same_thread=False는 SQLite에서만 필요 (비동기 처리 시 스레드 체크 우회)
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=True, # 개발 중 쿼리 로그 확인용
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-)
+_url = database_url(settings.DATABASE_URL)
+engine = create_async_engine(_url, **engine_options(_url))
+
+if engine.dialect.name == "sqlite":
+    _pragmas = sqlite_pragmas(DB_PROFILES[settings.DB_PROFILE]["tuned"])
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in _pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+if settings.METRICS_ENABLED:
+    _OPERATIONS = {"select", "insert", "update", "delete"}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _observe_query(conn, cursor, statement, parameters, context, executemany):
+        operation = statement.lstrip()[:6].lower()
+        DB_QUERY_DURATION.observe(
+            time.perf_counter() - context._query_started,
+            operation=operation if operation in _OPERATIONS else "other",
+        )
 
 # 비동기 세션 팩토리
 AsyncSessionLocal = async_sessionmaker(
@@ -25,8 +100,16 @@ class Base(DeclarativeBase):
 
 # Dependency Injection용 함수
 async def get_db() -> AsyncSession:
+    started = time.perf_counter()
     async with AsyncSessionLocal() as session:
         try:
             yield session
         finally:
             await session.close()
+            DB_SESSION_DURATION.observe(time.perf_counter() - started)
+
+# 방언별 INSERT 생성자 (ON CONFLICT 절 지원)
+def dialect_insert(db: AsyncSession):
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
@@ -0,0 +1,95 @@
+"""
+전문 검색 인덱스
+
+- SQLite: `news` 테이블을 외부 콘텐츠(content='news')로 사용하는 FTS5 가상 테이블(news_fts)이며,
+  INSERT/UPDATE/DELETE 트리거로 자동 동기화됩니다.
+- PostgreSQL: 컬럼별 가중치를 준 tsvector 식(PG_DOCUMENT)을 저장 생성 컬럼(news.search_vector)으로 두고
+  GIN 인덱스(ix_news_fts)를 만듭니다. 식 인덱스와 달리 인덱스 재확인과 ts_rank_cd가
+  일치하는 행마다 본문 전체로 to_tsvector를 다시 계산하지 않습니다. (ORM 모델에는 없는 컬럼)
+"""
+from sqlalchemy import text
+
+FTS_COLUMNS = ("title", "content", "summary", "keywords")
+
+_cols = ", ".join(FTS_COLUMNS)
+_new_cols = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+_old_cols = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+CREATE_STATEMENTS = (
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+        {_cols}, content='news', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS news_fts_ai AFTER INSERT ON news BEGIN
+        INSERT INTO news_fts(rowid, {_cols}) VALUES (new.id, {_new_cols});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS news_fts_ad AFTER DELETE ON news BEGIN
+        INSERT INTO news_fts(news_fts, rowid, {_cols}) VALUES ('delete', old.id, {_old_cols});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS news_fts_au AFTER UPDATE OF {_cols} ON news BEGIN
+        INSERT INTO news_fts(news_fts, rowid, {_cols}) VALUES ('delete', old.id, {_old_cols});
+        INSERT INTO news_fts(rowid, {_cols}) VALUES (new.id, {_new_cols});
+    END""",
+)
+
+# 가중치: title(A) > keywords(B) > summary(C) > content(D) (SQLite bm25 가중치 순서와 동일)
+PG_DOCUMENT = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(keywords, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(summary, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'D')"
+)
+PG_COLUMN = "search_vector"
+PG_INDEX = "ix_news_fts"
+
+DROP_STATEMENTS = (
+    "DROP TRIGGER IF EXISTS news_fts_ai",
+    "DROP TRIGGER IF EXISTS news_fts_ad",
+    "DROP TRIGGER IF EXISTS news_fts_au",
+    "DROP TABLE IF EXISTS news_fts",
+)
+
+
+def fts_exists(sync_conn) -> bool:
+    return sync_conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'")
+    ).first() is not None
+
+
+def create_fts(sync_conn) -> bool:
+    """FTS 테이블과 트리거를 생성합니다. 새로 만들었으면 True. (PostgreSQL은 생성 컬럼과 GIN 인덱스, 항상 False)"""
+    if sync_conn.dialect.name == "postgresql":
+        sync_conn.execute(text(
+            f"ALTER TABLE news ADD COLUMN IF NOT EXISTS {PG_COLUMN} tsvector GENERATED ALWAYS AS ({PG_DOCUMENT}) STORED"
+        ))
+        sync_conn.execute(text(f"CREATE INDEX IF NOT EXISTS {PG_INDEX} ON news USING gin ({PG_COLUMN})"))
+        return False
+    if sync_conn.dialect.name != "sqlite":
+        return False
+    created = not fts_exists(sync_conn)
+    for stmt in CREATE_STATEMENTS:
+        sync_conn.execute(text(stmt))
+    return created
+
+
+def drop_fts(sync_conn) -> None:
+    if sync_conn.dialect.name != "sqlite":
+        return
+    for stmt in DROP_STATEMENTS:
+        sync_conn.execute(text(stmt))
+
+
+def rebuild_fts(sync_conn) -> None:
+    """기존 news 행 전체로 인덱스를 다시 만듭니다."""
+    create_fts(sync_conn)
+    if sync_conn.dialect.name == "postgresql":
+        sync_conn.execute(text(f"REINDEX INDEX {PG_INDEX}"))
+        return
+    sync_conn.execute(text("INSERT INTO news_fts(news_fts) VALUES ('rebuild')"))
+
+
+def ensure_fts(sync_conn) -> None:
+    """
+    앱 시작 시 호출: 기존 DB에 FTS 테이블이 없으면 생성 후 기존 뉴스로 인덱스를 채웁니다.
+    """
+    if create_fts(sync_conn):
+        sync_conn.execute(text("INSERT INTO news_fts(news_fts) VALUES ('rebuild')"))
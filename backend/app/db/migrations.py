@@ -0,0 +1,55 @@
+"""
+버전 관리 스키마 마이그레이션 (Alembic, backend/migrations)
+
+- 앱 시작(DB_MIGRATE_ON_STARTUP) 또는 `python -m app.cli migrate`에서 upgrade_database를 호출합니다.
+- 마이그레이션 도입 전 create_all로 만든 DB는 누락된 테이블/컬럼/전문 검색 인덱스를 보완한 뒤
+  baseline 리비전으로 표시(stamp)하고 이어서 업그레이드합니다.
+- 스키마를 바꿀 때는 모델 수정 후 `alembic revision --autogenerate -m "..."`로 리비전을 추가합니다.
+"""
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
+
+from app.db.database import Base
+from app.db.fts import ensure_fts
+from app.db.schema import add_missing_columns
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+BASELINE_REVISION = "0001"
+
+
+def alembic_config(sync_conn=None) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    # migrations/env.py는 넘겨받은 커넥션(같은 트랜잭션)에서 실행
+    config.attributes["connection"] = sync_conn
+    return config
+
+
+def current_revision(sync_conn) -> Optional[str]:
+    return MigrationContext.configure(sync_conn).get_current_revision()
+
+
+def head_revision() -> str:
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def upgrade_database(sync_conn, revision: str = "head") -> Optional[str]:
+    """
+    스키마를 revision(기본: 최신)까지 업그레이드합니다. (engine.begin() 안에서 run_sync로 호출)
+    반환: 업그레이드 전 리비전 (빈 DB 또는 이전 방식 DB는 None)
+    """
+    config = alembic_config(sync_conn)
+    before = current_revision(sync_conn)
+    if before is None and inspect(sync_conn).has_table("news"):
+        # 이전 방식(create_all) DB: 현재 모델 기준으로 보완 후 baseline으로 표시
+        Base.metadata.create_all(sync_conn)
+        add_missing_columns(sync_conn)
+        ensure_fts(sync_conn)
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, revision)
+    return before
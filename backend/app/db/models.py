@@ -1,12 +1,13 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime
+from sqlalchemy import BigInteger, Boolean, Column, ForeignKey, Index, Integer, LargeBinary, String, Text, Float, DateTime, event, text
 from sqlalchemy.sql import func
+from app.db import fts
 from app.db.database import Base
 
 class News(Base):
     __tablename__ = "news"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String, index=True, nullable=False)
     url = Column(String, unique=True, index=True, nullable=False)
     content = Column(Text, nullable=True) # 뉴스 본문 (전체 혹은 일부)
@@ -21,5 +22,190 @@ class News(Base):
     published_at = Column(DateTime(timezone=True), nullable=True) # 뉴스 원문 발행 시간
     created_at = Column(DateTime(timezone=True), server_default=func.now()) # DB 수집 시간
 
+    # 유사 중복(신디케이트 기사) 묶음
+    minhash = Column(LargeBinary, nullable=True) # MinHash 서명 (짧은 기사는 NULL)
+    cluster_id = Column(Integer, nullable=True) # 대표 기사 ID (대표 기사는 자기 자신)
+
+    __table_args__ = (
+        # 목록 조회 keyset 페이지네이션 (ORDER BY created_at DESC, id DESC)
+        Index("ix_news_created_at_id", "created_at", "id"),
+        Index("ix_news_cluster_id", "cluster_id"),
+        # 감성 라벨 + 발행일 범위 필터
+        Index("ix_news_sentiment_published_at", "sentiment_label", "published_at"),
+        # 미분석 뉴스 최신순 조회 (분석 완료 행은 색인하지 않는 부분 인덱스)
+        Index(
+            "ix_news_unanalyzed", "created_at", "id",
+            sqlite_where=text("summary IS NULL"), postgresql_where=text("summary IS NULL"),
+        ),
+    )
+
     def __repr__(self):
         return f"<News(id={self.id}, title='{self.title}')>"
+
+# 전문 검색 인덱스(SQLite news_fts / PostgreSQL GIN 인덱스)는 news 테이블과 함께 생성/삭제
+event.listen(News.__table__, "after_create", lambda target, conn, **kw: fts.create_fts(conn))
+event.listen(News.__table__, "before_drop", lambda target, conn, **kw: fts.drop_fts(conn))
+
+
+class NewsMinhashBand(Base):
+    """
+    MinHash LSH 밴드 색인: 묶음 대표 기사의 서명을 밴드별 해시로 저장
+    같은 밴드 값을 가진 기사만 후보로 비교하므로 전체 뉴스를 스캔하지 않습니다.
+    """
+    __tablename__ = "news_minhash_bands"
+
+    band = Column(Integer, primary_key=True)
+    value = Column(BigInteger, primary_key=True)
+    news_id = Column(Integer, ForeignKey("news.id", ondelete="CASCADE"), primary_key=True)
+
+
+class NewsBody(Base):
+    """
+    기사 원문 본문 (기사 URL에서 가져와 추출한 전체 본문, 시각은 모두 UTC)
+    NewsAPI content는 약 200자로 잘려 있어 별도 수집하며, 목록/검색에서 자주 읽는
+    news 행이 커지지 않도록 압축하여 별도 테이블에 저장합니다.
+    status: fetched | failed (재시도 대상) | skipped (HTML 아님/본문 없음) | blocked (robots.txt 금지)
+    """
+    __tablename__ = "news_bodies"
+
+    news_id = Column(Integer, ForeignKey("news.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(String, nullable=False)
+    codec = Column(String, nullable=True) # 'zstd'
+    content = Column(LargeBinary, nullable=True) # 압축된 UTF-8 본문
+    original_length = Column(Integer, nullable=True) # 압축 전 바이트 수
+    http_status = Column(Integer, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(DateTime, nullable=True) # failed 재시도 시각
+    fetched_at = Column(DateTime, nullable=False) # 마지막 시도 시각
+
+
+class AnalysisCacheEntry(Base):
+    """LLM 분석 결과 캐시 (영속 계층). key는 제목/본문/모델/프롬프트 버전의 해시"""
+    __tablename__ = "analysis_cache"
+
+    key = Column(String(64), primary_key=True)
+    summary = Column(Text, nullable=False)
+    sentiment_label = Column(String, nullable=False)
+    sentiment_score = Column(Float, nullable=True)
+    expires_at = Column(DateTime, index=True, nullable=False) # UTC
+
+
+class WatchQuery(Base):
+    """백그라운드 스케줄러가 주기적으로 수집하는 관심 키워드 (시각은 모두 UTC)"""
+    __tablename__ = "watch_queries"
+
+    id = Column(Integer, primary_key=True)
+    query = Column(String, unique=True, nullable=False)
+    pages = Column(Integer, nullable=False, default=1)
+    interval_seconds = Column(Integer, nullable=False)
+    enabled = Column(Boolean, nullable=False, default=True)
+
+    # 증분 수집 기준: 지금까지 수집한 가장 최신 기사 발행 시각 (NewsAPI `from`)
+    newest_published_at = Column(DateTime, nullable=True)
+    next_run_at = Column(DateTime, index=True, nullable=True) # None이면 즉시 실행 대상
+
+    # 실행 상태
+    last_run_at = Column(DateTime, nullable=True)
+    last_latency_ms = Column(Float, nullable=True)
+    last_article_count = Column(Integer, nullable=True) # 수집된 기사 수
+    last_new_count = Column(Integer, nullable=True) # 그중 신규 저장된 기사 수
+    consecutive_failures = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class AnalysisJob(Base):
+    """
+    비동기 분석 작업 큐 (시각은 모두 UTC)
+    status: queued -> running -> succeeded | (재시도) queued | dead (최대 시도 초과)
+    """
+    __tablename__ = "analysis_jobs"
+
+    id = Column(Integer, primary_key=True)
+    news_id = Column(Integer, ForeignKey("news.id", ondelete="CASCADE"), index=True, nullable=False)
+    status = Column(String, index=True, nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    last_error = Column(Text, nullable=True)
+    available_at = Column(DateTime, nullable=False) # 이 시각 이후에 워커가 가져감 (재시도 지연)
+    locked_by = Column(String, nullable=True) # 처리 중인 워커 ID
+    locked_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # 워커의 다음 작업 선택 (status = 'queued' AND available_at <= now ORDER BY available_at)
+        Index("ix_analysis_jobs_status_available_at", "status", "available_at"),
+    )
+
+
+class NewsKeyword(Base):
+    """뉴스-키워드 정규화 테이블 (News.keywords JSON의 색인용 사본)"""
+    __tablename__ = "news_keywords"
+
+    news_id = Column(Integer, ForeignKey("news.id", ondelete="CASCADE"), primary_key=True)
+    keyword = Column(String, primary_key=True)
+
+    __table_args__ = (
+        Index("ix_news_keywords_keyword", "keyword"),
+    )
+
+
+class KeywordHourlyRollup(Base):
+    """
+    시간(UTC) 단위 키워드 집계. 수집/분석 시 증분 갱신되어
+    트렌드 조회가 뉴스 테이블을 스캔하지 않도록 합니다.
+    """
+    __tablename__ = "keyword_hourly_rollups"
+
+    bucket_start = Column(DateTime, primary_key=True) # 발행(없으면 수집) 시각의 정시
+    keyword = Column(String, primary_key=True)
+    article_count = Column(Integer, nullable=False, default=0)
+    sentiment_sum = Column(Float, nullable=False, default=0.0)
+    sentiment_count = Column(Integer, nullable=False, default=0) # 감성 점수가 있는 기사 수
+
+
+class SentimentRollup(Base):
+    """
+    시간/일(UTC) 단위 감성 집계: 키워드별(빈 문자열은 전체) 라벨과 점수 구간(히스토그램)마다 기사 수.
+    분석 결과 저장 시 증분 갱신되어 감성 추이 조회가 뉴스 테이블을 스캔하지 않도록 합니다.
+    """
+    __tablename__ = "sentiment_rollups"
+
+    granularity = Column(String, primary_key=True) # 'hour' | 'day'
+    keyword = Column(String, primary_key=True) # '' = 전체 기사
+    bucket_start = Column(DateTime, primary_key=True) # 발행(없으면 수집) 시각의 정시/자정
+    label = Column(String, primary_key=True)
+    score_bin = Column(Integer, primary_key=True) # 감성 점수 구간 번호 (-1: 점수 없음)
+    article_count = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)
+
+
+class TableVersion(Base):
+    """
+    테이블 변경 버전. 쓰기(수집/분석/초기화)와 같은 트랜잭션에서 증가하며
+    목록 응답의 ETag/Last-Modified와 응답 캐시 무효화에 사용됩니다.
+    """
+    __tablename__ = "table_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+
+class TermDocumentFrequency(Base):
+    """키워드 엔진용 문서 빈도(DF): 단어/바이그램이 등장한 뉴스 수. 수집 시 증분 갱신"""
+    __tablename__ = "term_document_frequencies"
+
+    term = Column(String, primary_key=True)
+    df = Column(Integer, nullable=False, default=0)
+
+
+class CorpusStats(Base):
+    """DF 계산 대상 코퍼스 전체 통계 (단일 행, id=1)"""
+    __tablename__ = "corpus_stats"
+
+    id = Column(Integer, primary_key=True)
+    document_count = Column(Integer, nullable=False, default=0)
+    total_length = Column(Integer, nullable=False, default=0) # 전체 토큰 수 (BM25 평균 문서 길이)
@@ -0,0 +1,29 @@
+from typing import List
+
+from sqlalchemy import inspect
+
+from app.db.database import Base
+
+
+def add_missing_columns(sync_conn) -> List[str]:
+    """
+    create_all은 기존 테이블에 새 컬럼을 추가하지 않으므로, 모델에 추가된
+    NULL 허용 컬럼과 그 인덱스를 기존 DB에 만듭니다.
+    (마이그레이션 도입 전 DB를 baseline으로 표시하기 전에 app.db.migrations에서 호출)
+    반환: 추가한 "테이블.컬럼" 목록
+    """
+    inspector = inspect(sync_conn)
+    added = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        missing = [c for c in table.columns if c.name not in existing and c.nullable and not c.primary_key]
+        for column in missing:
+            column_type = column.type.compile(dialect=sync_conn.dialect)
+            sync_conn.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}')
+            added.append(f"{table.name}.{column.name}")
+        if missing:
+            for index in table.indexes:
+                index.create(sync_conn, checkfirst=True)
+    return added
@@ -1,20 +1,49 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
-from app.db.database import engine, Base
-from app.api.endpoints import news
+from app.core.logs import configure_logging
+from app.core.metrics import CONTENT_TYPE, REGISTRY
+from app.core.middleware import RequestContextMiddleware
+from app.db.database import engine
+from app.db.migrations import upgrade_database
+from app.api.endpoints import jobs, news, watchlist
+from app.services.body_fetcher import body_fetcher
+from app.services.crawler import crawler
+from app.services.jobs import worker_pool
+from app.services.keyword_engine import keyword_engine
+from app.services.scheduler import scheduler
 
-# 앱 수명주기 관리 (DB 테이블 생성)
+configure_logging()
+
+# 앱 수명주기 관리 (DB 테이블 생성, 공유 HTTP 클라이언트)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # 시작 시 DB 테이블 생성 (비동기)
-    async with engine.begin() as conn:
-        # 개발 편의를 위해 매번 생성 (운영 환경에서는 Alembic 마이그레이션 권장)
-        await conn.run_sync(Base.metadata.create_all)
+    # 시작 시 스키마를 최신 리비전으로 업그레이드 (migrations/versions)
+    if settings.DB_MIGRATE_ON_STARTUP:
+        async with engine.begin() as conn:
+            await conn.run_sync(upgrade_database)
+    # NewsAPI 커넥션 풀 (keep-alive 재사용)
+    await crawler.startup()
+    # 관심 키워드 백그라운드 수집
+    if settings.SCHEDULER_ENABLED:
+        await scheduler.start()
+    # 기사 원문 본문 백그라운드 수집
+    if settings.BODY_FETCH_ENABLED:
+        await body_fetcher.start()
+    # 비동기 분석 작업 워커 (JOB_WORKERS=0이면 별도 워커 프로세스 사용)
+    await worker_pool.start(settings.JOB_WORKERS)
+    # 키워드 엔진 메모리 DF 주기적 재적재
+    await keyword_engine.start()
     yield
-    # 종료 시 정리 작업 (필요 시)
+    # 종료 시 정리 작업
+    await keyword_engine.stop()
+    await worker_pool.stop()
+    await scheduler.stop()
+    await body_fetcher.shutdown()
+    await crawler.shutdown()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -36,11 +65,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 다른 origin의 프론트엔드가 읽을 수 있도록 노출할 응답 헤더 (목록 다음 페이지 cursor, 캐시 검증, 요청 ID)
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified", "X-Request-ID"],
 )
+# 요청 ID 부여 및 라우트별 처리 시간 측정 (가장 바깥에서 실행)
+app.add_middleware(RequestContextMiddleware)
 
 # 라우터 등록
 app.include_router(news.router, prefix=f"{settings.API_V1_STR}/news", tags=["news"])
+app.include_router(jobs.router, prefix=f"{settings.API_V1_STR}/jobs", tags=["jobs"])
+app.include_router(watchlist.router, prefix=f"{settings.API_V1_STR}/watchlist", tags=["watchlist"])
 
 @app.get("/")
 async def root():
-    return {"message": "News Insight Pro API is running!"}
\ No newline at end of file
+    return {"message": "News Insight Pro API is running!"}
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus 텍스트 형식 지표 (이 프로세스 기준)"""
+        return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
\ No newline at end of file
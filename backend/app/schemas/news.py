@@ -1,5 +1,6 @@
+import json
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 # 공통 속성
@@ -32,5 +33,65 @@ class NewsResponse(NewsBase):
     sentiment_score: Optional[float] = None
     keywords: list[str] = []
     created_at: datetime
+    cluster_id: Optional[int] = None # 유사 중복 묶음 (대표 기사 ID)
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_model(cls, n) -> "NewsResponse":
+        # DB 객체를 딕셔너리로 변환 후 keywords(JSON 문자열) 처리하여 검증
+        news_dict = {c.name: getattr(n, c.name) for c in n.__table__.columns}
+        news_dict['keywords'] = json.loads(n.keywords) if n.keywords else []
+        return cls.model_validate(news_dict)
+
+# 저장된 뉴스 전문 검색 결과
+class NewsSearchResult(NewsResponse):
+    score: float # BM25 관련도 (높을수록 관련)
+    snippet: Optional[str] = None # 일치 구간 하이라이트 (<mark>...</mark>)
+
+# 트렌드 키워드 집계
+class TrendingKeyword(BaseModel):
+    keyword: str
+    count: int # 기간 내 등장 기사 수
+    avg_sentiment_score: Optional[float] = None
+
+# 감성 추이 (시간/일 버킷)
+class SentimentBucket(BaseModel):
+    bucket_start: datetime # UTC
+    count: int # 분석된 기사 수
+    label_counts: dict[str, int] # positive / negative / neutral
+    avg_sentiment_score: Optional[float] = None
+    p10: Optional[float] = None # 감성 점수 백분위수 (구간 히스토그램 기반 추정치)
+    p50: Optional[float] = None
+    p90: Optional[float] = None
+
+# 일괄 분석 요청
+class NewsBatchAnalysisRequest(BaseModel):
+    ids: list[int] = []
+    all_unanalyzed: bool = False # True: summary가 없는 모든 뉴스 분석
+    limit: int = Field(default=100, ge=1, le=1000)
+
+# 일괄 분석 스트림의 항목 (NDJSON 한 줄)
+class NewsBatchAnalysisItem(BaseModel):
+    news_id: int
+    status: Literal["ok", "not_found", "error"]
+    news: Optional[NewsResponse] = None
+    error: Optional[str] = None
+
+# 비동기 분석 작업 등록
+class AnalysisJobCreate(BaseModel):
+    news_ids: list[int] = Field(min_length=1, max_length=1000)
+
+# 비동기 분석 작업 상태
+class AnalysisJobResponse(BaseModel):
+    id: int
+    news_id: int
+    status: Literal["queued", "running", "succeeded", "dead"]
+    attempts: int
+    max_attempts: int
+    last_error: Optional[str] = None
+    available_at: datetime
+    created_at: datetime
+    finished_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.core.config import settings
+
+# 관심 키워드 등록
+class WatchQueryCreate(BaseModel):
+    query: str = Field(min_length=1)
+    pages: int = Field(default=1, ge=1, le=settings.NEWS_API_MAX_PAGES)
+    interval_seconds: Optional[int] = Field(default=None, ge=60) # None이면 기본 주기 사용
+    enabled: bool = True
+
+# 관심 키워드 수정 (전달된 필드만 반영)
+class WatchQueryUpdate(BaseModel):
+    pages: Optional[int] = Field(default=None, ge=1, le=settings.NEWS_API_MAX_PAGES)
+    interval_seconds: Optional[int] = Field(default=None, ge=60)
+    enabled: Optional[bool] = None
+
+# 클라이언트 응답 (실행 상태 포함)
+class WatchQueryResponse(BaseModel):
+    id: int
+    query: str
+    pages: int
+    interval_seconds: int
+    enabled: bool
+    newest_published_at: Optional[datetime] = None
+    next_run_at: Optional[datetime] = None
+    last_run_at: Optional[datetime] = None
+    last_latency_ms: Optional[float] = None
+    last_article_count: Optional[int] = None
+    last_new_count: Optional[int] = None
+    consecutive_failures: int = 0
+    last_error: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+# 스케줄러 상태
+class SchedulerStatus(BaseModel):
+    enabled: bool
+    running: bool
+    tick_seconds: float
+    last_tick_at: Optional[datetime] = None
+    total_runs: int
+    total_failures: int
+    watches: list[WatchQueryResponse] = []
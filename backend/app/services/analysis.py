@@ -0,0 +1,229 @@
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, NamedTuple, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import NEWS_ANALYZED
+from app.db.database import AsyncSessionLocal
+from app.db.models import News
+from app.schemas.news import NewsAnalysisUpdate, NewsBatchAnalysisItem, NewsResponse
+from app.services.analyzer import analyzer
+from app.services.body_fetcher import load_bodies, load_body
+from app.services.dedup import find_cluster_analysis
+from app.services.keyword_engine import keyword_engine
+from app.services.keyword_index import parse_keywords, reindex_news
+from app.services.table_versions import bump_version
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+async def save_analysis(db: AsyncSession, news_item: News, analysis_result: NewsAnalysisUpdate) -> News:
+    """
+    분석 결과(요약/감성/키워드)를 뉴스 행에 반영하고 커밋합니다.
+    키워드 색인과 시간별 키워드/감성 집계, 목록 캐시용 테이블 버전도 같은 트랜잭션에서 갱신합니다.
+    """
+    old_keywords = parse_keywords(news_item.keywords)
+    old_score = news_item.sentiment_score
+    old_label = news_item.sentiment_label
+
+    news_item.summary = analysis_result.summary
+    news_item.sentiment_label = analysis_result.sentiment_label
+    news_item.sentiment_score = analysis_result.sentiment_score
+    news_item.keywords = json.dumps(analysis_result.keywords)
+    await reindex_news(db, news_item, old_keywords, old_score, old_label)
+    await bump_version(db)
+
+    await db.commit()
+    NEWS_ANALYZED.inc()
+    await db.refresh(news_item)
+    return news_item
+
+
+class _KeywordSource(NamedTuple):
+    """키워드 추출 입력 (keywords_for_news는 title/content 속성만 사용)"""
+    title: str
+    content: Optional[str]
+
+
+def _text_to_analyze(news_item: News, body: Optional[str]) -> str:
+    """수집된 원문 본문(news_bodies)이 있으면 본문, 없으면 NewsAPI content(없으면 제목)"""
+    if body:
+        return body
+    return news_item.content if news_item.content else news_item.title
+
+
+async def _keywords_for(db: AsyncSession, news_item: News, body: Optional[str]) -> list[str]:
+    """본문이 있으면 본문으로, 없으면 NewsAPI content(약 200자)로 키워드 추출"""
+    source = _KeywordSource(news_item.title, body or news_item.content)
+    return (await keyword_engine.keywords_for_news(db, [source]))[0]
+
+
+async def analyze_news(
+    db: AsyncSession,
+    news_item: News,
+    keywords: Optional[list[str]] = None,
+    raise_on_error: bool = False,
+) -> News:
+    """
+    뉴스 한 건을 AI로 분석(요약/감성)하고 결과를 저장합니다.
+    keywords: 일괄 처리 시 미리 추출한 키워드 (없으면 KEYWORD_ENGINE으로 추출)
+    raise_on_error: LLM 요청 실패 시 가짜 분석을 저장하지 않고 LLMUnavailable 발생 (summary는 NULL 유지)
+    같은 유사 중복 묶음에 이미 분석된 기사가 있으면 LLM을 호출하지 않고 그 요약/감성을 사용합니다.
+    """
+    body = await load_body(db, news_item.id)
+    if keywords is None:
+        keywords = await _keywords_for(db, news_item, body)
+    analysis_result = await _cluster_analysis(db, news_item, keywords)
+    if analysis_result is None:
+        text = _text_to_analyze(news_item, body)
+        # LLM 응답을 기다리는 동안 읽기 트랜잭션/커넥션을 반환 (expire_on_commit=False)
+        await db.commit()
+        analysis_result = await analyzer.analyze_content(news_item.title, text, keywords, raise_on_error=raise_on_error)
+    return await save_analysis(db, news_item, analysis_result)
+
+
+async def analyze_news_once(db: AsyncSession, news_item: News) -> News:
+    """
+    analyze_news + 같은 기사에 대한 동시 분석 요청 합치기 (분석 버튼 연속 클릭 등)
+    분석/저장은 먼저 들어온 요청이 전용 세션에서 한 번만 수행하고, 함께 기다린 요청은 저장된 행을 다시 읽습니다.
+    (요청별로 저장하면 같은 기사의 감성/키워드 집계가 중복 반영될 수 있음)
+    """
+    async def run() -> None:
+        async with AsyncSessionLocal() as session:
+            item = await session.get(News, news_item.id)
+            if item is not None:
+                await analyze_news(session, item)
+
+    # 기다리는 동안 읽기 트랜잭션/커넥션을 반환 (expire_on_commit=False)
+    await db.commit()
+    await analysis_flight.do(news_item.id, run)
+    await db.refresh(news_item)
+    return news_item
+
+
+async def _cluster_analysis(db: AsyncSession, news_item: News, keywords: list[str]) -> Optional[NewsAnalysisUpdate]:
+    """같은 유사 중복 묶음에서 이미 분석된 기사의 요약/감성 (없으면 None)"""
+    sibling = await find_cluster_analysis(db, news_item)
+    if sibling is None:
+        return None
+    return NewsAnalysisUpdate(
+        summary=sibling.summary,
+        sentiment_label=sibling.sentiment_label or "neutral",
+        sentiment_score=sibling.sentiment_score,
+        keywords=keywords,
+    )
+
+
+async def analyze_news_stream(db: AsyncSession, news_item: News) -> AsyncIterator[Union[str, News]]:
+    """
+    analyze_news의 스트리밍 버전: 요약 조각(str)을 생성되는 대로 내보내고,
+    분석이 끝나면 결과를 저장한 뒤 갱신된 뉴스 행을 마지막으로 내보냅니다.
+    """
+    body = await load_body(db, news_item.id)
+    keywords = await _keywords_for(db, news_item, body)
+    analysis_result = await _cluster_analysis(db, news_item, keywords)
+    if analysis_result is not None:
+        yield analysis_result.summary
+    else:
+        text = _text_to_analyze(news_item, body)
+        await db.commit()
+        async for part in analyzer.stream_content(news_item.title, text, keywords):
+            if isinstance(part, NewsAnalysisUpdate):
+                analysis_result = part
+            else:
+                yield part
+    yield await save_analysis(db, news_item, analysis_result)
+
+
+async def _prefetch(news_ids: Sequence[int]) -> Tuple[dict, dict]:
+    """
+    일괄 분석 대상의 키워드를 한 번에 추출하고 유사 중복 묶음을 조회합니다.
+    (키워드는 수집된 원문 본문이 있으면 본문, 없으면 NewsAPI content 기준)
+    반환: (news_id -> keywords, news_id -> cluster_id)
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(News.id, News.title, News.content, News.cluster_id).where(News.id.in_(news_ids))
+        )
+        rows = result.all()
+        bodies = await load_bodies(db, [row.id for row in rows])
+        keywords = await keyword_engine.keywords_for_news(
+            db, [_KeywordSource(row.title, bodies.get(row.id) or row.content) for row in rows]
+        )
+    return (
+        {row.id: kw for row, kw in zip(rows, keywords)},
+        {row.id: row.cluster_id for row in rows if row.cluster_id is not None},
+    )
+
+
+async def _analyze_one(news_id: int, keywords: Optional[list[str]] = None) -> NewsBatchAnalysisItem:
+    # 작업마다 별도 세션을 사용하여 완료 즉시 커밋
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(News).where(News.id == news_id))
+        news_item = result.scalars().first()
+        if not news_item:
+            return NewsBatchAnalysisItem(news_id=news_id, status="not_found")
+        try:
+            news_item = await analyze_news(db, news_item, keywords, raise_on_error=True)
+        except Exception as e:
+            logger.error("Batch analysis failed for news %s: %s", news_id, e)
+            await db.rollback()
+            return NewsBatchAnalysisItem(news_id=news_id, status="error", error=str(e))
+        return NewsBatchAnalysisItem(news_id=news_id, status="ok", news=NewsResponse.from_model(news_item))
+
+
+async def select_unanalyzed_ids(db: AsyncSession, limit: int) -> list[int]:
+    """summary가 없는 뉴스 ID를 최신순으로 조회합니다."""
+    result = await db.execute(
+        select(News.id)
+        .where(News.summary.is_(None))
+        .order_by(News.created_at.desc(), News.id.desc())
+        .limit(limit)
+    )
+    return list(result.scalars())
+
+
+async def analyze_batch(
+    news_ids: Sequence[int],
+    concurrency: Optional[int] = None,
+) -> AsyncIterator[NewsBatchAnalysisItem]:
+    """
+    여러 뉴스를 동시에 분석합니다. 동시 실행 수는 세마포어로 제한하며,
+    끝나는 순서대로 결과를 내보냅니다. (소비자가 중단하면 남은 작업은 취소)
+    묶음 분석(ANALYSIS_PACK_SIZE > 1) 시에는 동시 LLM 요청 수가 concurrency가 되도록
+    기사 단위 동시 실행 수를 묶음 크기만큼 늘립니다.
+    """
+    pack_size = max(1, settings.ANALYSIS_PACK_SIZE)
+    semaphore = asyncio.Semaphore((concurrency or settings.ANALYSIS_CONCURRENCY) * pack_size)
+    news_ids = list(dict.fromkeys(news_ids))
+    keywords, clusters = await _prefetch(news_ids) if news_ids else ({}, {})
+    # 같은 유사 중복 묶음의 기사는 첫 기사의 분석이 끝난 뒤 그 결과를 재사용
+    leaders: dict = {}
+
+    async def worker(news_id: int) -> NewsBatchAnalysisItem:
+        leader = leaders.get(clusters.get(news_id))
+        if leader is not None and leader is not asyncio.current_task():
+            await asyncio.wait([leader])
+        async with semaphore:
+            return await _analyze_one(news_id, keywords.get(news_id))
+
+    tasks = []
+    for news_id in news_ids:
+        task = asyncio.create_task(worker(news_id))
+        if settings.DEDUP_REUSE_ANALYSIS and news_id in clusters:
+            leaders.setdefault(clusters[news_id], task)
+        tasks.append(task)
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+analysis_flight = SingleFlight("analysis")
@@ -1,74 +1,464 @@
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 from openai import AsyncOpenAI
+from pydantic import ValidationError
 from app.core.config import settings
+from app.core.metrics import LLM_REQUEST_DURATION, LLM_TOKENS
 from app.schemas.news import NewsAnalysisUpdate
+from app.services.cache import AnalysisCache, analysis_cache
+from app.services.sentiment import get_sentiment_model
+from app.utils.json_stream import JsonStringFieldExtractor
 from app.utils.text import TextProcessor
 
+logger = logging.getLogger(__name__)
+
+# 시스템 프롬프트를 변경하면 올려서 이전 캐시 결과를 무효화합니다.
+PROMPT_VERSION = "v1"
+SUMMARY_PROMPT_VERSION = "v1-summary" # 요약 전용 프롬프트 (감성은 로컬 모델)
+SENTIMENT_LABELS = ("positive", "negative", "neutral")
+# 기사 하나에 보내는 본문 길이 (context window 제한)
+CONTENT_LIMIT = 1500
+
+SYSTEM_PROMPT = (
+    "You are a helpful news assistant. "
+    "Summarize the news in 3 bullet points in Korean and analyze the sentiment. "
+    "You must return a valid JSON object with the following keys: "
+    "'summary' (string, the 3 bullet points combined), "
+    "'sentiment_label' (string, one of 'positive', 'negative', 'neutral'), "
+    "'sentiment_score' (float, between -1.0 and 1.0)."
+)
+
+# 로컬 감성 모델이 감성을 맡는 기사 (SENTIMENT_MODE=primary, prefilter에서 로컬 점수가 확실한 경우)
+SUMMARY_SYSTEM_PROMPT = (
+    "You are a helpful news assistant. "
+    "Summarize the news in 3 bullet points in Korean. "
+    "You must return a valid JSON object with the following key: "
+    "'summary' (string, the 3 bullet points combined)."
+)
+
+PACKED_SYSTEM_PROMPT = (
+    "You are a helpful news assistant. "
+    "You will receive a JSON array of news articles, each with an integer 'id'. "
+    "For every article, summarize it in 3 bullet points in Korean and analyze the sentiment. "
+    "You must return a valid JSON object of the form {\"results\": [...]} containing exactly one element "
+    "per article with the following keys: "
+    "'id' (integer, the article id), "
+    "'summary' (string, the 3 bullet points combined), "
+    "'sentiment_label' (string, one of 'positive', 'negative', 'neutral'), "
+    "'sentiment_score' (float, between -1.0 and 1.0)."
+)
+
+PACKED_SUMMARY_SYSTEM_PROMPT = (
+    "You are a helpful news assistant. "
+    "You will receive a JSON array of news articles, each with an integer 'id'. "
+    "For every article, summarize it in 3 bullet points in Korean. "
+    "You must return a valid JSON object of the form {\"results\": [...]} containing exactly one element "
+    "per article with the following keys: "
+    "'id' (integer, the article id), "
+    "'summary' (string, the 3 bullet points combined)."
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """입력 토큰 수 추정 (영어 약 4자, 한국어 약 1자당 1토큰 -> UTF-8 3바이트당 1토큰으로 보수적 추정)"""
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+def record_usage(usage, mode: str) -> None:
+    """응답의 usage 필드(프롬프트/완료 토큰 수)를 지표에 반영합니다. (usage가 없는 호환 서버는 생략)"""
+    if usage is None:
+        return
+    LLM_TOKENS.inc(usage.prompt_tokens or 0, mode=mode, type="prompt")
+    LLM_TOKENS.inc(usage.completion_tokens or 0, mode=mode, type="completion")
+
+
+class LLMUnavailable(Exception):
+    """LLM 요청 실패 (네트워크/API 오류). raise_on_error일 때 가짜 분석 대신 호출자에게 전달됩니다."""
+
+
+class _PendingArticle(NamedTuple):
+    title: str
+    content: str
+    keywords: list[str]
+    cache_key: Optional[str]
+    tokens: int
+    future: asyncio.Future
+    summary_only: bool
+
+
 class NewsAnalyzer:
     def __init__(self):
-        # API 키가 있을 때만 클라이언트 초기화
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+        # API 키가 있을 때만 클라이언트 초기화 (OPENAI_BASE_URL: OpenAI 호환 서버)
+        self.client = (
+            AsyncOpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL or None)
+            if settings.OPENAI_API_KEY else None
+        )
+        # 묶음 요청 대기열 (ANALYSIS_PACK_SIZE > 1)
+        self._pending: List[_PendingArticle] = []
+        self._pending_tokens = 0
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._pack_tasks: set = set()
 
-    async def analyze_content(self, title: str, content: str) -> NewsAnalysisUpdate:
+    async def analyze_content(
+        self,
+        title: str,
+        content: str,
+        keywords: Optional[list[str]] = None,
+        raise_on_error: bool = False,
+    ) -> NewsAnalysisUpdate:
         """
         뉴스 제목과 본문을 분석하여 요약 및 감성 정보를 반환합니다.
+        keywords: 호출자가 미리 추출한 키워드 (KEYWORD_ENGINE, 없으면 빈도 기반으로 추출)
+        raise_on_error: LLM 요청 실패 시 가짜 분석(_fallback_analysis)을 반환하지 않고 LLMUnavailable 발생
+          (작업 큐/일괄 분석: 실패를 저장하지 않고 재시도하도록)
         settings.USE_MOCK_DATA가 True이면 가짜 분석 결과를 반환합니다.
+        감성 라벨/점수는 SENTIMENT_MODE에 따라 로컬 감성 모델 결과로 대체될 수 있으며,
+        이 경우 LLM에는 감성을 묻지 않는 요약 전용 프롬프트를 보냅니다.
         """
         # 1. 키워드 추출 (Local BoW) - AI 호출 전 수행 (비용 절약)
-        keywords = TextProcessor.extract_keywords(content)
+        if keywords is None:
+            keywords = TextProcessor.extract_keywords(content)
 
         if settings.USE_MOCK_DATA or not self.client:
-            print(f"[MOCK] Returning mock analysis for: {title[:20]}...")
-            return self._get_mock_analysis(keywords)
+            logger.info("[MOCK] Returning mock analysis for: %s...", title[:20])
+            return self._get_mock_analysis(keywords) if settings.USE_MOCK_DATA else self._fallback_analysis(title, content, keywords)
 
-        return await self._analyze_via_gpt(title, content, keywords)
+        summary_only = self._local_sentiment(title, content) is not None
+        try:
+            if settings.ANALYSIS_PACK_SIZE > 1:
+                result = await self._analyze_packed(title, content, keywords, summary_only)
+            else:
+                result = await self._analyze_via_gpt(title, content, keywords, summary_only=summary_only)
+        except LLMUnavailable:
+            if raise_on_error:
+                raise
+            return self._fallback_analysis(title, content, keywords)
+        return self._with_local_sentiment(result, title, content)
 
-    async def _analyze_via_gpt(self, title: str, content: str, keywords: list[str]) -> NewsAnalysisUpdate:
-        import json
+    async def _analyze_packed(
+        self, title: str, content: str, keywords: list[str], summary_only: bool = False
+    ) -> NewsAnalysisUpdate:
+        """
+        동시에 들어온 분석 요청을 모아 한 번의 LLM 요청으로 보냅니다.
+        ANALYSIS_PACK_SIZE개 또는 입력 토큰 예산이 차거나 ANALYSIS_PACK_WAIT_MS가 지나면 전송합니다.
+        """
+        cache_key, cached = await self._lookup_cache(title, content, keywords, summary_only)
+        if cached is not None:
+            return cached
 
-        system_prompt = (
-            "You are a helpful news assistant. "
-            "Summarize the news in 3 bullet points in Korean and analyze the sentiment. "
-            "You must return a valid JSON object with the following keys: "
-            "'summary' (string, the 3 bullet points combined), "
-            "'sentiment_label' (string, one of 'positive', 'negative', 'neutral'), "
-            "'sentiment_score' (float, between -1.0 and 1.0)."
+        loop = asyncio.get_running_loop()
+        article = _PendingArticle(
+            title, content, keywords, cache_key,
+            estimate_tokens(f"{title}\n{content[:CONTENT_LIMIT]}"), loop.create_future(), summary_only,
         )
-        
-        user_message = f"Title: {title}\nContent: {content[:1500]}" # Limit context window
+        if self._pending and self._pending_tokens + article.tokens > settings.ANALYSIS_PACK_TOKEN_BUDGET:
+            self._flush()
+        self._pending.append(article)
+        self._pending_tokens += article.tokens
+        if len(self._pending) >= settings.ANALYSIS_PACK_SIZE:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(settings.ANALYSIS_PACK_WAIT_MS / 1000, self._flush)
+        return await article.future
 
+    def _flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        articles, self._pending, self._pending_tokens = self._pending, [], 0
+        if articles:
+            task = asyncio.create_task(self._run_pack(articles))
+            self._pack_tasks.add(task)
+            task.add_done_callback(self._pack_tasks.discard)
+
+    async def _run_pack(self, articles: Sequence[_PendingArticle]) -> None:
+        # 프롬프트(요약 전용 여부)가 같은 기사끼리 요청 (prefilter 모드는 한 묶음에 섞일 수 있음)
+        groups = [[a for a in articles if a.summary_only == summary_only] for summary_only in (False, True)]
+        await asyncio.gather(*(self._run_group(group) for group in groups if group))
+
+    async def _run_group(self, articles: Sequence[_PendingArticle]) -> None:
         try:
-            response = await self.client.chat.completions.create(
-                model=settings.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=0.7,
-                # response_format={"type": "json_object"} # Available in newer models, safe to rely on prompt for base 3.5
-            )
-            
-            content_str = response.choices[0].message.content
-            try:
-                data = json.loads(content_str)
-                return NewsAnalysisUpdate(
-                    summary=data.get("summary", "No summary provided."),
-                    sentiment_label=data.get("sentiment_label", "neutral"),
-                    sentiment_score=data.get("sentiment_score", 0.0),
-                    keywords=keywords
+            if len(articles) == 1:
+                a = articles[0]
+                results = await asyncio.gather(
+                    self._analyze_via_gpt(a.title, a.content, a.keywords, False, a.cache_key, a.summary_only),
+                    return_exceptions=True,
                 )
-            except json.JSONDecodeError:
-                print(f"[ERROR] Failed to parse GPT response as JSON: {content_str}")
-                # Fallback if JSON parsing fails
-                return NewsAnalysisUpdate(
-                    summary=content_str[:500], # Return raw text as summary if parsing fails
-                    sentiment_label="neutral",
-                    sentiment_score=0.0,
-                    keywords=keywords
+            else:
+                results = await self._analyze_pack_via_gpt(articles)
+            # 기사별 결과 또는 LLMUnavailable
+            for article, result in zip(articles, results):
+                if article.future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    article.future.set_exception(result)
+                else:
+                    article.future.set_result(result)
+        except Exception as e:
+            for article in articles:
+                if not article.future.done():
+                    article.future.set_exception(e)
+
+    async def _analyze_pack_via_gpt(
+        self, articles: Sequence[_PendingArticle]
+    ) -> List[Union[NewsAnalysisUpdate, BaseException]]:
+        """
+        여러 기사를 하나의 요청(JSON 배열, 기사 ID 포함)으로 분석합니다. (기사들의 프롬프트 종류는 같아야 함)
+        응답에서 빠졌거나 형식이 맞지 않는 기사만 기사별 요청으로 다시 분석합니다.
+        반환: 기사별 결과 (기사별 요청도 실패한 기사는 LLMUnavailable)
+        """
+        summary_only = articles[0].summary_only
+        payload = [
+            {"id": i, "title": a.title, "content": a.content[:CONTENT_LIMIT]}
+            for i, a in enumerate(articles)
+        ]
+        results: List[Optional[NewsAnalysisUpdate]] = [None] * len(articles)
+        try:
+            with LLM_REQUEST_DURATION.time(mode="packed"):
+                response = await self.client.chat.completions.create(
+                    model=settings.OPENAI_MODEL,
+                    messages=[
+                        {"role": "system", "content": PACKED_SUMMARY_SYSTEM_PROMPT if summary_only else PACKED_SYSTEM_PROMPT},
+                        {"role": "user", "content": json.dumps(payload, ensure_ascii=False)}
+                    ],
+                    temperature=0.7,
+                    response_format={"type": "json_object"},
+                )
+            record_usage(getattr(response, "usage", None), "packed")
+            data = json.loads(response.choices[0].message.content)
+            items = data.get("results") if isinstance(data, dict) else None
+            for item in items if isinstance(items, list) else []:
+                if not isinstance(item, dict) or not isinstance(item.get("id"), int):
+                    continue
+                index = item["id"]
+                if not 0 <= index < len(articles) or results[index] is not None:
+                    continue
+                if summary_only:
+                    item = {**item, "sentiment_label": "neutral", "sentiment_score": None}
+                elif item.get("sentiment_label") not in SENTIMENT_LABELS:
+                    continue
+                article = articles[index]
+                try:
+                    result = NewsAnalysisUpdate(
+                        summary=item.get("summary"),
+                        sentiment_label=item["sentiment_label"],
+                        sentiment_score=item.get("sentiment_score"),
+                        keywords=article.keywords,
+                    )
+                except ValidationError:
+                    continue
+                # 요약 전용 응답은 로컬 감성을 채운 뒤 캐시
+                results[index] = self._with_local_sentiment(result, article.title, article.content) if summary_only else result
+        except json.JSONDecodeError:
+            logger.error("Failed to parse packed GPT response as JSON (%s articles)", len(articles))
+        except Exception as e:
+            logger.error("Packed OpenAI API Request failed (%s articles): %s", len(articles), e)
+
+        for article, result in zip(articles, results):
+            if result is not None and article.cache_key:
+                await analysis_cache.set(article.cache_key, result.model_dump(exclude={"keywords"}))
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning("Packed response missing %s/%s articles, retrying individually", len(missing), len(articles))
+            fallback = await asyncio.gather(*(
+                self._analyze_via_gpt(a.title, a.content, a.keywords, False, a.cache_key, a.summary_only)
+                for a in (articles[i] for i in missing)
+            ), return_exceptions=True)
+            for i, result in zip(missing, fallback):
+                results[i] = result
+        return results
+
+    async def _lookup_cache(self, title: str, content: str, keywords: list[str], summary_only: bool = False):
+        """(캐시 키, 캐시된 결과 또는 None). 캐시 비활성화 시 (None, None)"""
+        if not settings.ANALYSIS_CACHE_ENABLED:
+            return None, None
+        version = SUMMARY_PROMPT_VERSION if summary_only else PROMPT_VERSION
+        cache_key = AnalysisCache.make_key(title, content, settings.OPENAI_MODEL, version)
+        cached = await analysis_cache.get(cache_key)
+        return cache_key, NewsAnalysisUpdate(**cached, keywords=keywords) if cached is not None else None
+
+    async def _analyze_via_gpt(
+        self,
+        title: str,
+        content: str,
+        keywords: list[str],
+        check_cache: bool = True,
+        cache_key: Optional[str] = None,
+        summary_only: bool = False,
+    ) -> NewsAnalysisUpdate:
+        user_message = f"Title: {title}\nContent: {content[:CONTENT_LIMIT]}" # Limit context window
+
+        # 동일 기사(신디케이트 기사, 재분석)는 캐시된 결과 재사용 (묶음 요청에서 이미 확인한 경우 생략)
+        if check_cache:
+            cache_key, cached = await self._lookup_cache(title, content, keywords, summary_only)
+            if cached is not None:
+                return cached
+
+        try:
+            with LLM_REQUEST_DURATION.time(mode="single"):
+                response = await self.client.chat.completions.create(
+                    model=settings.OPENAI_MODEL,
+                    messages=[
+                        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT if summary_only else SYSTEM_PROMPT},
+                        {"role": "user", "content": user_message}
+                    ],
+                    temperature=0.7,
+                    # response_format={"type": "json_object"} # Available in newer models, safe to rely on prompt for base 3.5
                 )
+            record_usage(getattr(response, "usage", None), "single")
+            content_str = response.choices[0].message.content
+        except Exception as e:
+            logger.error("OpenAI API Request failed: %s", e)
+            raise LLMUnavailable(str(e)) from e
+
+        return await self._parse_response(content_str, title, content, keywords, cache_key, summary_only)
+
+    async def _parse_response(
+        self,
+        content_str: str,
+        title: str,
+        content: str,
+        keywords: list[str],
+        cache_key: Optional[str],
+        summary_only: bool = False,
+    ) -> NewsAnalysisUpdate:
+        """
+        단건 프롬프트 응답(JSON)을 결과로 변환하고 캐시에 저장합니다. (요약 전용 응답은 로컬 감성을 채움)
+        감성 라벨이 SENTIMENT_LABELS가 아니면 요약만 사용하고 감성은 LLM 실패와 같이 처리합니다. (캐시하지 않음)
+        """
+        try:
+            data = json.loads(content_str)
+            label_ok = summary_only or data.get("sentiment_label") in SENTIMENT_LABELS
+            result = NewsAnalysisUpdate(
+                summary=data.get("summary", "No summary provided."),
+                sentiment_label=data.get("sentiment_label", "neutral") if label_ok else "neutral",
+                sentiment_score=data.get("sentiment_score", 0.0) if label_ok else 0.0,
+                keywords=keywords
+            )
+            if not label_ok:
+                logger.error("Unexpected sentiment label in GPT response: %r", data.get("sentiment_label"))
+                return self._with_local_sentiment(result, title, content, llm_ok=False)
+            if summary_only:
+                result = self._with_local_sentiment(result, title, content)
+            if cache_key:
+                await analysis_cache.set(cache_key, result.model_dump(exclude={"keywords"}))
+            return result
+        except json.JSONDecodeError:
+            logger.error("Failed to parse GPT response as JSON: %s", content_str)
+            # Fallback if JSON parsing fails
+            result = NewsAnalysisUpdate(
+                summary=content_str[:500], # Return raw text as summary if parsing fails
+                sentiment_label="neutral",
+                sentiment_score=0.0,
+                keywords=keywords
+            )
+            return self._with_local_sentiment(result, title, content, llm_ok=False)
+
+    async def stream_content(
+        self,
+        title: str,
+        content: str,
+        keywords: Optional[list[str]] = None,
+    ) -> AsyncIterator[Union[str, NewsAnalysisUpdate]]:
+        """
+        요약을 생성되는 대로 조각(str)으로 내보내고, 마지막에 전체 결과(NewsAnalysisUpdate)를 내보냅니다.
+        스트리밍 응답(JSON)에서 summary 값만 도착하는 대로 꺼내 전달합니다.
+        요약 조각은 표시용이며, 저장할 값은 마지막 결과를 기준으로 합니다.
+        """
+        if keywords is None:
+            keywords = TextProcessor.extract_keywords(content)
 
+        if settings.USE_MOCK_DATA or not self.client:
+            logger.info("[MOCK] Returning mock analysis for: %s...", title[:20])
+            result = self._get_mock_analysis(keywords) if settings.USE_MOCK_DATA else self._fallback_analysis(title, content, keywords)
+            for line in result.summary.splitlines(keepends=True):
+                yield line
+            yield result
+            return
+
+        summary_only = self._local_sentiment(title, content) is not None
+        cache_key, cached = await self._lookup_cache(title, content, keywords, summary_only)
+        if cached is not None:
+            yield cached.summary
+            yield self._with_local_sentiment(cached, title, content)
+            return
+
+        user_message = f"Title: {title}\nContent: {content[:CONTENT_LIMIT]}"
+        extractor = JsonStringFieldExtractor("summary")
+        parts: List[str] = []
+        emitted = False
+        try:
+            # 요청부터 마지막 조각까지의 시간 (usage는 마지막 조각에 포함)
+            with LLM_REQUEST_DURATION.time(mode="stream"):
+                stream = await self.client.chat.completions.create(
+                    model=settings.OPENAI_MODEL,
+                    messages=[
+                        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT if summary_only else SYSTEM_PROMPT},
+                        {"role": "user", "content": user_message}
+                    ],
+                    temperature=0.7,
+                    response_format={"type": "json_object"},
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+                async for chunk in stream:
+                    record_usage(getattr(chunk, "usage", None), "stream")
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    text = extractor.feed(delta)
+                    if text:
+                        emitted = True
+                        yield text
         except Exception as e:
-            print(f"[ERROR] OpenAI API Request failed: {e}")
-            return self._get_mock_analysis(keywords)
+            logger.error("OpenAI streaming request failed: %s", e)
+            if emitted:
+                raise
+            result = self._fallback_analysis(title, content, keywords)
+            yield result.summary
+            yield result
+            return
+
+        result = await self._parse_response("".join(parts), title, content, keywords, cache_key, summary_only)
+        if not emitted:
+            # summary 필드를 찾지 못한 응답 (파싱 실패 등)
+            yield result.summary
+        yield self._with_local_sentiment(result, title, content)
+
+    def _local_sentiment(self, title: str, content: str, llm_ok: bool = True) -> Optional[Tuple[str, float]]:
+        """
+        SENTIMENT_MODE에 따라 로컬 감성 모델 결과를 쓰면 (라벨, 점수), LLM 감성을 쓰면 None
+        llm_ok: False이면 LLM 감성 결과가 없는 경우 (요청 실패, 응답 파싱 실패, 클라이언트 미설정)
+        """
+        mode = settings.SENTIMENT_MODE
+        if mode == "llm" or (mode == "fallback" and llm_ok):
+            return None
+        label, score = get_sentiment_model().predict(f"{title}\n{content}")
+        if mode == "prefilter" and llm_ok and abs(score) < settings.SENTIMENT_PREFILTER_THRESHOLD:
+            return None
+        return label, score
+
+    def _with_local_sentiment(
+        self,
+        result: NewsAnalysisUpdate,
+        title: str,
+        content: str,
+        llm_ok: bool = True,
+    ) -> NewsAnalysisUpdate:
+        """SENTIMENT_MODE에 따라 감성 라벨/점수를 로컬 감성 모델 결과로 대체합니다."""
+        local = self._local_sentiment(title, content, llm_ok)
+        if local is None:
+            return result
+        label, score = local
+        return result.model_copy(update={"sentiment_label": label, "sentiment_score": score})
+
+    def _fallback_analysis(self, title: str, content: str, keywords: list[str]) -> NewsAnalysisUpdate:
+        """LLM 결과를 얻지 못했을 때의 결과 (요약은 가짜 분석, 감성은 SENTIMENT_MODE에 따름)"""
+        return self._with_local_sentiment(self._get_mock_analysis(keywords), title, content, llm_ok=False)
 
     def _get_mock_analysis(self, keywords: list[str] = []) -> NewsAnalysisUpdate:
         """UI 테스트용 가짜 분석 결과"""
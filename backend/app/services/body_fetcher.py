@@ -0,0 +1,425 @@
+"""
+기사 원문 본문 수집 (news_bodies)
+
+NewsAPI content는 약 200자로 잘려 있으므로 기사 URL의 HTML을 직접 받아 본문을 추출합니다.
+- 호스트별 동시 요청 수(BODY_FETCH_PER_HOST)와 요청 간 최소 간격(BODY_FETCH_HOST_DELAY_SECONDS,
+  robots.txt Crawl-delay가 더 길면 그 값)을 지키고, 전체 동시 요청 수는 BODY_FETCH_CONCURRENCY로 제한
+- robots.txt는 호스트별로 캐시 (RFC 9309: 4xx는 전체 허용, 5xx/연결 실패는 나중에 재시도)
+- 리디렉션은 BODY_FETCH_MAX_REDIRECTS회까지 직접 따라가며 hop마다 위 제한과 robots.txt를 다시 적용하고,
+  공인 IP가 아닌 주소(사설망/루프백/메타데이터 서버 등)는 요청하지 않습니다.
+- 결과는 기사마다 바로 커밋하므로 중단 후 다시 실행하면 남은 기사부터 이어서 수집합니다.
+  (본문이 저장된 기사는 다시 요청하지 않고, 일시적 실패만 지수 백오프로 최대 BODY_FETCH_MAX_ATTEMPTS회 재시도)
+- 본문은 zstd로 압축하여 저장
+"""
+import asyncio
+import codecs
+import ipaddress
+import logging
+import re
+import socket
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import SplitResult, urljoin, urlsplit
+from urllib.robotparser import RobotFileParser
+
+import httpx
+import zstandard
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import BODY_FETCH_DURATION
+from app.db.database import AsyncSessionLocal, dialect_insert
+from app.db.models import News, NewsBody
+from app.utils.dates import utcnow
+from app.utils.html_text import extract_main_text
+
+logger = logging.getLogger(__name__)
+
+# 일시적 오류로 보고 재시도하는 응답 코드 (그 외 4xx는 skipped)
+RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+REDIRECT_STATUS_CODES = {301, 302, 303, 307, 308}
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+_META_CHARSET = re.compile(rb"<meta[^>]+charset=[\"']?([\w-]+)", re.IGNORECASE)
+
+
+async def is_public_host(host: str, port: int) -> bool:
+    """호스트(IP 또는 도메인)가 가리키는 모든 주소가 공인 IP인지. DNS 조회 실패는 OSError"""
+    try:
+        addresses = [ipaddress.ip_address(host)]
+    except ValueError:
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = [ipaddress.ip_address(info[4][0]) for info in infos]
+    return bool(addresses) and all(address.is_global for address in addresses)
+
+
+def compress_body(text: str) -> Tuple[bytes, str, int]:
+    """(압축 데이터, 코덱, 압축 전 바이트 수)"""
+    data = text.encode("utf-8")
+    return zstandard.ZstdCompressor(level=3).compress(data), "zstd", len(data)
+
+
+def decompress_body(data: bytes, codec: str) -> str:
+    if codec != "zstd":
+        raise ValueError(f"Unknown body codec: {codec!r}")
+    return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+
+
+async def load_body(db: AsyncSession, news_id: int) -> Optional[str]:
+    """수집된 원문 본문 (없거나 수집 실패 시 None)"""
+    result = await db.execute(
+        select(NewsBody.content, NewsBody.codec)
+        .where(NewsBody.news_id == news_id, NewsBody.status == "fetched")
+    )
+    row = result.first()
+    return decompress_body(row.content, row.codec) if row else None
+
+
+async def load_bodies(db: AsyncSession, news_ids: Sequence[int]) -> Dict[int, str]:
+    """여러 기사의 수집된 원문 본문 (news_id -> 본문, 없는 기사는 제외)"""
+    if not news_ids:
+        return {}
+    result = await db.execute(
+        select(NewsBody.news_id, NewsBody.content, NewsBody.codec)
+        .where(NewsBody.news_id.in_(news_ids), NewsBody.status == "fetched")
+    )
+    return {row.news_id: decompress_body(row.content, row.codec) for row in result}
+
+
+async def select_pending(
+    db: AsyncSession,
+    limit: int,
+    news_ids: Optional[Sequence[int]] = None,
+    now: Optional[datetime] = None,
+) -> list:
+    """
+    본문 수집 대상 (최신 기사 우선): 시도한 적 없는 기사와 재시도 시각이 된 실패 기사
+    news_ids: 지정한 기사 중에서만 선택 (수집 직후 등)
+    반환 행: (id, url, attempts)
+    """
+    now = now or utcnow()
+    stmt = (
+        select(News.id, News.url, func.coalesce(NewsBody.attempts, 0).label("attempts"))
+        .outerjoin(NewsBody, NewsBody.news_id == News.id)
+        .where(or_(
+            NewsBody.news_id.is_(None),
+            and_(
+                NewsBody.status == "failed",
+                NewsBody.attempts < settings.BODY_FETCH_MAX_ATTEMPTS,
+                NewsBody.next_attempt_at <= now,
+            ),
+        ))
+        .order_by(News.id.desc())
+        .limit(limit)
+    )
+    if news_ids is not None:
+        stmt = stmt.where(News.id.in_(news_ids))
+    result = await db.execute(stmt)
+    return result.all()
+
+
+async def save_result(db: AsyncSession, news_id: int, attempts: int, result: "BodyResult") -> None:
+    """수집 결과를 저장(upsert)하고 커밋합니다. attempts: 이번 시도를 포함한 시도 횟수"""
+    now = utcnow()
+    content = codec = length = None
+    if result.text:
+        content, codec, length = compress_body(result.text)
+    next_attempt_at = None
+    if result.status == "failed" and attempts < settings.BODY_FETCH_MAX_ATTEMPTS:
+        next_attempt_at = now + timedelta(seconds=settings.BODY_FETCH_RETRY_BACKOFF_SECONDS * (2 ** (attempts - 1)))
+    row = {
+        "news_id": news_id,
+        "status": result.status,
+        "codec": codec,
+        "content": content,
+        "original_length": length,
+        "http_status": result.http_status,
+        "attempts": attempts,
+        "last_error": result.error,
+        "next_attempt_at": next_attempt_at,
+        "fetched_at": now,
+    }
+    insert = dialect_insert(db)
+    stmt = insert(NewsBody).values(row)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[NewsBody.news_id],
+        set_={k: stmt.excluded[k] for k in row if k != "news_id"},
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+
+@dataclass
+class _Page:
+    status: int
+    content_type: str
+    charset: Optional[str]
+    location: Optional[str]
+    data: bytes
+
+
+@dataclass
+class BodyResult:
+    status: str # fetched | failed | skipped | blocked
+    http_status: Optional[int] = None
+    text: Optional[str] = None
+    error: Optional[str] = None
+
+
+class _HostState:
+    """호스트별 동시 요청 제한, 다음 요청 가능 시각, robots.txt 캐시"""
+
+    def __init__(self, per_host: int):
+        self.semaphore = asyncio.Semaphore(per_host)
+        self.turn_lock = asyncio.Lock()
+        self.robots_lock = asyncio.Lock()
+        self.next_request_at = 0.0 # time.monotonic 기준
+        self.robots: Optional[RobotFileParser] = None
+        self.robots_error: Optional[str] = None # robots.txt를 확인할 수 없음 (5xx/연결 실패)
+        self.robots_expires_at = 0.0
+
+
+class BodyFetcher:
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        # transport: 테스트 시 httpx.MockTransport 주입용
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._hosts: Dict[str, _HostState] = {}
+        self._slots = asyncio.Semaphore(settings.BODY_FETCH_CONCURRENCY)
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": settings.BODY_FETCH_USER_AGENT},
+                limits=httpx.Limits(max_connections=settings.BODY_FETCH_CONCURRENCY),
+                timeout=httpx.Timeout(settings.BODY_FETCH_TIMEOUT_SECONDS),
+                follow_redirects=False, # _fetch에서 hop마다 확인하며 직접 따라감
+                transport=self._transport,
+            )
+        return self._client
+
+    async def shutdown(self) -> None:
+        await self.stop()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # --- 백그라운드 수집 (IngestionScheduler와 같은 방식) ---
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._stopping.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while not self._stopping.is_set():
+            processed = 0
+            try:
+                processed = sum((await self.run_pending()).values())
+            except Exception as e:
+                logger.error("Body fetch batch failed: %s", e)
+            # 대상이 배치 크기만큼 남아 있었으면 바로 다음 배치
+            if processed >= settings.BODY_FETCH_BATCH_SIZE:
+                continue
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=settings.BODY_FETCH_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    # --- 수집 ---
+
+    async def run_pending(self, limit: Optional[int] = None, news_ids: Optional[Sequence[int]] = None) -> Dict[str, int]:
+        """
+        수집 대상 기사의 본문을 가져와 저장합니다. 반환: 상태별 저장 건수
+        (저장하지 못한 기사는 포함하지 않으며 다음 실행에서 다시 대상이 됩니다.)
+        """
+        async with AsyncSessionLocal() as db:
+            pending = await select_pending(db, limit or settings.BODY_FETCH_BATCH_SIZE, news_ids)
+        counts: Counter = Counter()
+
+        async def process(row) -> None:
+            result = await self.fetch(row.url)
+            try:
+                async with AsyncSessionLocal() as db:
+                    await save_result(db, row.id, row.attempts + 1, result)
+            except Exception as e:
+                # 수집 중 기사가 삭제된 경우 등
+                logger.warning("Failed to store body of news %s: %s", row.id, e)
+                return
+            counts[result.status] += 1
+
+        await asyncio.gather(*(process(row) for row in pending))
+        return dict(counts)
+
+    def _host(self, netloc: str) -> _HostState:
+        state = self._hosts.get(netloc)
+        if state is None:
+            state = self._hosts[netloc] = _HostState(settings.BODY_FETCH_PER_HOST)
+        return state
+
+    async def _robots(self, origin: str, state: _HostState) -> Optional[RobotFileParser]:
+        """호스트의 robots.txt (캐시). 확인할 수 없으면 state.robots_error를 채우고 None"""
+        async with state.robots_lock:
+            if time.monotonic() < state.robots_expires_at:
+                return state.robots
+            parser, error = RobotFileParser(), None
+            try:
+                response = await self._get_robots_txt(f"{origin}/robots.txt")
+            except (httpx.HTTPError, OSError) as e:
+                error = f"robots.txt unreachable: {e.__class__.__name__}"
+            else:
+                if response is None:
+                    error = "robots.txt redirected too many times or to a non-public address"
+                elif response.status_code >= 500:
+                    error = f"robots.txt unavailable ({response.status_code})"
+                elif response.status_code >= 400:
+                    parser.allow_all = True
+                else:
+                    parser.parse(response.text.splitlines())
+            state.robots, state.robots_error = (None, error) if error else (parser, None)
+            state.robots_expires_at = time.monotonic() + settings.BODY_FETCH_ROBOTS_TTL_SECONDS
+            return state.robots
+
+    async def _get_robots_txt(self, url: str) -> Optional[httpx.Response]:
+        """robots.txt 요청 (리디렉션은 공인 주소로만 BODY_FETCH_MAX_REDIRECTS회까지 따라감, 실패 시 None)"""
+        for _ in range(settings.BODY_FETCH_MAX_REDIRECTS + 1):
+            async with self._slots:
+                response = await self.client.get(url)
+            location = response.headers.get("Location")
+            if response.status_code not in REDIRECT_STATUS_CODES or not location:
+                return response
+            url = urljoin(url, location)
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.hostname or not await self._allowed_address(parts):
+                return None
+        return None
+
+    async def _allowed_address(self, parts: SplitResult) -> bool:
+        """
+        요청해도 되는 주소인지 (사설/루프백/링크 로컬 등 공인 IP가 아닌 주소는 거부: 서버 측 요청 위조 방지)
+        DNS 조회 실패는 OSError
+        """
+        if settings.BODY_FETCH_ALLOW_PRIVATE_ADDRESSES:
+            return True
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        return await is_public_host(parts.hostname, port)
+
+    async def _wait_turn(self, state: _HostState, delay: float) -> None:
+        """같은 호스트의 요청 시작 간격을 delay초 이상으로 유지합니다."""
+        async with state.turn_lock:
+            now = time.monotonic()
+            start_at = max(now, state.next_request_at)
+            state.next_request_at = start_at + delay
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+    async def fetch(self, url: str) -> BodyResult:
+        """기사 페이지 하나를 받아 본문을 추출합니다. (예외 대신 결과 상태로 반환)"""
+        start = time.perf_counter()
+        result = await self._fetch(url)
+        BODY_FETCH_DURATION.observe(time.perf_counter() - start, status=result.status)
+        return result
+
+    async def _fetch(self, url: str) -> BodyResult:
+        # 리디렉션은 직접 따라가며 hop마다 주소 확인, robots.txt, 호스트별 제한/요청 간격을 다시 적용
+        agent = settings.BODY_FETCH_USER_AGENT
+        for _ in range(settings.BODY_FETCH_MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                return BodyResult("skipped", error=f"unsupported URL: {url}")
+            try:
+                allowed = await self._allowed_address(parts)
+            except OSError as e:
+                return BodyResult("failed", error=f"DNS lookup failed for {parts.hostname}: {e}")
+            if not allowed:
+                return BodyResult("skipped", error=f"non-public address: {parts.hostname}")
+            state = self._host(parts.netloc)
+            async with state.semaphore:
+                robots = await self._robots(f"{parts.scheme}://{parts.netloc}", state)
+                if robots is None:
+                    return BodyResult("failed", error=state.robots_error)
+                if not robots.can_fetch(agent, url):
+                    return BodyResult("blocked", error=f"disallowed by robots.txt: {url}")
+                delay = max(settings.BODY_FETCH_HOST_DELAY_SECONDS, float(robots.crawl_delay(agent) or 0))
+                await self._wait_turn(state, delay)
+                try:
+                    async with self._slots:
+                        page = await self._download(url)
+                except httpx.HTTPError as e:
+                    return BodyResult("failed", error=f"{e.__class__.__name__}: {e}")
+            if page.status in REDIRECT_STATUS_CODES and page.location:
+                url = urljoin(url, page.location)
+                continue
+            return await self._extract(page)
+        return BodyResult("skipped", error="too many redirects")
+
+    async def _extract(self, page: "_Page") -> BodyResult:
+        status = page.status
+        if status in RETRY_STATUS_CODES:
+            return BodyResult("failed", http_status=status, error=f"HTTP {status}")
+        if status >= 300:
+            return BodyResult("skipped", http_status=status, error=f"HTTP {status}")
+        if page.content_type and not page.content_type.startswith(HTML_CONTENT_TYPES):
+            return BodyResult("skipped", http_status=status, error=f"not HTML ({page.content_type})")
+        # HTML 파싱은 CPU 작업이므로 이벤트 루프 밖에서 실행
+        text = await asyncio.to_thread(extract_main_text, self._decode(page.data, page.charset))
+        if not text:
+            return BodyResult("skipped", http_status=status, error="no article text found")
+        return BodyResult("fetched", http_status=status, text=text)
+
+    async def _download(self, url: str) -> "_Page":
+        """응답 하나 (HTML 본문은 앞 BODY_FETCH_MAX_BYTES 바이트만 읽음, 리디렉션은 따라가지 않음)"""
+        async with self.client.stream("GET", url, headers={"Accept": "text/html,application/xhtml+xml"}) as response:
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            chunks: List[bytes] = []
+            size = 0
+            if response.status_code < 300 and (not content_type or content_type.startswith(HTML_CONTENT_TYPES)):
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= settings.BODY_FETCH_MAX_BYTES:
+                        break
+            return _Page(
+                status=response.status_code,
+                content_type=content_type,
+                charset=response.charset_encoding,
+                location=response.headers.get("Location"),
+                data=b"".join(chunks)[:settings.BODY_FETCH_MAX_BYTES],
+            )
+
+    @staticmethod
+    def _decode(data: bytes, charset: Optional[str]) -> str:
+        """Content-Type charset, 없으면 <meta charset>, 그래도 없으면 UTF-8"""
+        if charset is None:
+            match = _META_CHARSET.search(data[:2048])
+            charset = match.group(1).decode("ascii") if match else "utf-8"
+        try:
+            codecs.lookup(charset)
+        except LookupError:
+            charset = "utf-8"
+        return data.decode(charset, errors="replace")
+
+
+body_fetcher = BodyFetcher()
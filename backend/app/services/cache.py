@@ -0,0 +1,141 @@
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import delete, select
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, dialect_insert
+from app.db.models import AnalysisCacheEntry
+from app.utils.dates import utcnow
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class AnalysisCache:
+    """
+    LLM 분석 결과(요약/감성) 캐시
+    - 1계층: 프로세스 내 LRU (max_size, TTL)
+    - 2계층: SQLite `analysis_cache` 테이블 (TTL, 재시작 후에도 유지)
+    값은 {"summary", "sentiment_label", "sentiment_score"} 딕셔너리입니다.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int, persistent: bool = True):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.persistent = persistent
+        self._entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(title: str, content: str, model: str, prompt_version: str) -> str:
+        """정규화한 제목 + 본문 앞 1500자 + 모델명 + 프롬프트 버전의 SHA-256"""
+        normalized_title = _WHITESPACE.sub(" ", title or "").strip().lower()
+        payload = "\x1f".join([normalized_title, (content or "")[:1500], model, prompt_version])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return value
+            del self._entries[key]
+
+        if self.persistent:
+            value = await self._get_persistent(key)
+            if value is not None:
+                self._remember(key, value)
+                self.persistent_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: dict) -> None:
+        self._remember(key, value)
+        if self.persistent:
+            await self._set_persistent(key, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.memory_hits = self.persistent_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.persistent_hits + self.misses
+        hits = self.memory_hits + self.persistent_hits
+        return {
+            "size": len(self._entries),
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
+
+    def _remember(self, key: str, value: dict) -> None:
+        self._entries[key] = (time.time() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def _get_persistent(self, key: str) -> Optional[dict]:
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(AnalysisCacheEntry).where(
+                        AnalysisCacheEntry.key == key,
+                        AnalysisCacheEntry.expires_at > utcnow(),
+                    )
+                )
+                entry = result.scalars().first()
+        except Exception as e:
+            logger.warning("Analysis cache lookup failed: %s", e)
+            return None
+        if entry is None:
+            return None
+        return {
+            "summary": entry.summary,
+            "sentiment_label": entry.sentiment_label,
+            "sentiment_score": entry.sentiment_score,
+        }
+
+    async def _set_persistent(self, key: str, value: dict) -> None:
+        now = utcnow()
+        row = {
+            "key": key,
+            "summary": value["summary"],
+            "sentiment_label": value["sentiment_label"],
+            "sentiment_score": value.get("sentiment_score"),
+            "expires_at": now + timedelta(seconds=self.ttl_seconds),
+        }
+        try:
+            async with AsyncSessionLocal() as db:
+                insert = dialect_insert(db)
+                stmt = insert(AnalysisCacheEntry).values(row)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[AnalysisCacheEntry.key],
+                    set_={k: stmt.excluded[k] for k in row if k != "key"},
+                )
+                await db.execute(stmt)
+                # 만료된 항목 정리
+                await db.execute(delete(AnalysisCacheEntry).where(AnalysisCacheEntry.expires_at <= now))
+                await db.commit()
+        except Exception as e:
+            logger.warning("Analysis cache store failed: %s", e)
+
+
+analysis_cache = AnalysisCache(
+    max_size=settings.ANALYSIS_CACHE_MAX_SIZE,
+    ttl_seconds=settings.ANALYSIS_CACHE_TTL_SECONDS,
+    persistent=settings.ANALYSIS_CACHE_PERSISTENT,
+)
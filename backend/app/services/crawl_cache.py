@@ -0,0 +1,100 @@
+import time
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Sequence, Tuple, Union
+
+from app.core.config import settings
+from app.core.metrics import CRAWL_CACHE_LOOKUPS
+from app.schemas.news import NewsCreate
+from app.services.crawler import crawler
+from app.services.ingestion import lookup_known_urls
+from app.utils.singleflight import SingleFlight
+
+CrawlKey = Tuple[Tuple[str, ...], int]
+
+
+class CrawlCache:
+    """
+    검색 수집 결과(NewsCreate 목록) LRU + TTL 캐시 (키: 정규화한 키워드 목록과 페이지 수)
+    인기 키워드에 검색이 몰려도 TTL 동안은 NewsAPI를 다시 호출하지 않습니다.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, List[NewsCreate]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[List[NewsCreate]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: List[NewsCreate]) -> None:
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def _normalize(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def crawl_key(query: Union[str, Sequence[str]], pages: int) -> CrawlKey:
+    """대소문자/공백/순서/중복만 다른 검색은 같은 키 (NewsAPI 검색은 대소문자 구분 없음)"""
+    queries = [query] if isinstance(query, str) else query
+    return tuple(sorted({_normalize(q) for q in queries if q and q.strip()})), pages
+
+
+async def crawl_news(query: Union[str, Sequence[str]], pages: int = 1) -> List[NewsCreate]:
+    """
+    crawler.search_news + 짧은 결과 캐시 + 동시 요청 합치기 (POST /news/search용)
+    1. CRAWL_CACHE_TTL_SECONDS 이내의 같은 검색은 캐시된 수집 결과를 반환
+    2. 수집 중인 같은 검색이 있으면 새로 호출하지 않고 그 결과(또는 실패)를 함께 받음
+    반환 목록은 여러 요청이 공유하므로 수정하지 않습니다.
+    """
+    key = crawl_key(query, pages)
+    cached = crawl_cache.get(key)
+    CRAWL_CACHE_LOOKUPS.inc(result="hit" if cached is not None else "miss")
+    if cached is not None:
+        return cached
+
+    async def fetch() -> List[NewsCreate]:
+        # 먼저 들어온 요청의 표기로 수집 (같은 키의 요청은 결과를 공유)
+        queries = [query] if isinstance(query, str) else query
+        originals = {}
+        for q in queries:
+            if q and q.strip():
+                originals.setdefault(_normalize(q), q.strip())
+        news = await crawler.search_news([originals[q] for q in key[0]], pages=pages, known_urls=lookup_known_urls)
+        crawl_cache.set(key, news)
+        return news
+
+    return await crawl_flight.do(key, fetch)
+
+
+crawl_cache = CrawlCache(settings.CRAWL_CACHE_MAX_SIZE, settings.CRAWL_CACHE_TTL_SECONDS)
+crawl_flight = SingleFlight("crawl")
@@ -1,60 +1,225 @@
+import asyncio
+import importlib.util
+import logging
+import random
 import httpx
-from datetime import datetime
-from typing import List
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, List, Optional, Sequence, Union
 from app.core.config import settings
+from app.core.metrics import NEWSAPI_REQUEST_DURATION, STAGE_DURATION
 from app.schemas.news import NewsCreate
+from app.utils.ratelimit import TokenBucket
 from app.utils.text import TextProcessor
 
+logger = logging.getLogger(__name__)
+
+# 이미 저장된 URL 집합을 조회하는 콜백 (조기 종료 판단용)
+KnownUrlsFn = Callable[[List[str]], Awaitable[set]]
+
 class NewsCrawler:
-    BASE_URL = "https://newsapi.org/v2/everything"
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        # transport: 테스트 시 httpx.MockTransport 주입용
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self.rate_limiter = TokenBucket(settings.NEWS_API_RATE_PER_SECOND, settings.NEWS_API_BURST)
+
+    async def startup(self) -> None:
+        """공유 커넥션 풀 클라이언트를 엽니다. (app lifespan 시작 시 호출)"""
+        if self._client is None:
+            self._client = self._create_client()
+
+    async def shutdown(self) -> None:
+        """커넥션 풀을 닫습니다. (app lifespan 종료 시 호출)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # lifespan 없이 사용되는 경우(테스트, 스크립트)를 위해 지연 생성
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        http2 = settings.HTTP2_ENABLED
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP2_ENABLED is set but 'h2' is not installed. Falling back to HTTP/1.1.")
+            http2 = False
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(settings.HTTP_TIMEOUT_SECONDS),
+            http2=http2,
+            transport=self._transport,
+        )
+
+    @staticmethod
+    def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+        """Retry-After 헤더 (초 또는 HTTP-date) 해석"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _backoff_seconds(self, attempt: int) -> float:
+        delay = settings.HTTP_BACKOFF_BASE_SECONDS * (2 ** attempt)
+        return min(settings.HTTP_BACKOFF_MAX_SECONDS, delay * random.uniform(0.5, 1.0))
 
+    async def _request(self, params: dict) -> httpx.Response:
+        """
+        속도 제한 후 요청하고, 429/5xx 및 네트워크 오류는 지수 백오프로 재시도합니다.
+        """
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            try:
+                response = await self.client.get(settings.NEWS_API_BASE_URL, params=params)
+            except httpx.TransportError as e:
+                if attempt >= settings.HTTP_MAX_RETRIES:
+                    raise
+                delay = self._backoff_seconds(attempt)
+                logger.warning("NewsAPI transport error (%s), retrying in %.1fs", e, delay)
+            else:
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt >= settings.HTTP_MAX_RETRIES:
+                    response.raise_for_status()
+                    return response
+                retry_after = self._retry_after_seconds(response)
+                delay = retry_after if retry_after is not None else self._backoff_seconds(attempt)
+                delay = min(delay, settings.HTTP_BACKOFF_MAX_SECONDS)
+                logger.warning("NewsAPI responded %s, retrying in %.1fs", response.status_code, delay)
+            attempt += 1
+            await asyncio.sleep(delay)
 
-    async def search_news(self, query: str) -> List[NewsCreate]:
+
+    async def search_news(
+        self,
+        query: Union[str, Sequence[str]],
+        pages: int = 1,
+        known_urls: Optional[KnownUrlsFn] = None,
+        from_date: Optional[datetime] = None,
+    ) -> List[NewsCreate]:
         """
-        키워드로 뉴스를 검색합니다.
+        키워드(단일 또는 목록)로 뉴스를 검색합니다.
+        - pages: 키워드당 최대 페이지 수 (페이지는 동시성 제한 하에 병렬 조회)
+        - known_urls: 이미 저장된 URL 집합을 돌려주는 콜백. 한 페이지 묶음에서
+          저장된 기사를 만나면 (최신순 정렬이므로) 더 오래된 페이지는 조회하지 않습니다.
+          키워드별 수집이 동시에 호출하므로 공유 세션이 아닌 호출별 세션을 사용해야 합니다.
+          (ingestion.lookup_known_urls)
+        - from_date: 이 시각 이후 발행된 기사만 조회 (증분 수집)
+        결과는 URL 기준으로 중복 제거되어 반환됩니다.
         settings.USE_MOCK_DATA가 True이면 가짜 데이터를 반환합니다.
         """
+        queries = [query] if isinstance(query, str) else list(query)
+        queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))
+        pages = max(1, min(pages, settings.NEWS_API_MAX_PAGES))
+
         if settings.USE_MOCK_DATA:
-            print(f"[MOCK] Returning mock news data for query: {query}")
-            return self._get_mock_news(query)
+            logger.info("[MOCK] Returning mock news data for query: %s", ', '.join(queries))
+            return self._merge([self._get_mock_news(q) for q in queries])
 
-        return await self._fetch_from_api(query)
+        semaphore = asyncio.Semaphore(settings.NEWS_API_CONCURRENCY)
 
-    async def _fetch_from_api(self, query: str) -> List[NewsCreate]:
+        async def fetch_page(q: str, page: int) -> List[NewsCreate]:
+            async with semaphore:
+                return await self._fetch_from_api(q, page=page, from_date=from_date)
+
+        async def fetch_query(q: str) -> List[NewsCreate]:
+            results: List[NewsCreate] = []
+            page = 1
+            while page <= pages:
+                wave = range(page, min(pages, page + settings.NEWS_API_CONCURRENCY - 1) + 1)
+                batches = await asyncio.gather(*(fetch_page(q, p) for p in wave), return_exceptions=True)
+                done = False
+                wave_items: List[NewsCreate] = []
+                for p, batch in zip(wave, batches):
+                    if isinstance(batch, BaseException):
+                        # 첫 페이지 실패는 전파, 이후 페이지 실패(결과 한도 초과 등)는 검색 종료로 처리
+                        if p == 1:
+                            raise batch
+                        logger.warning("NewsAPI page %s for '%s' failed, stopping: %s", p, q, batch)
+                        done = True
+                        break
+                    wave_items.extend(batch)
+                    if len(batch) < settings.NEWS_API_PAGE_SIZE: # 마지막 페이지
+                        done = True
+                        break
+                results.extend(wave_items)
+                if not done and known_urls and wave_items:
+                    done = bool(await known_urls([n.url for n in wave_items]))
+                if done:
+                    break
+                page += len(wave)
+            return results
+
+        return self._merge(await asyncio.gather(*(fetch_query(q) for q in queries)))
+
+    @staticmethod
+    def _merge(batches: Sequence[List[NewsCreate]]) -> List[NewsCreate]:
+        """여러 검색 결과를 URL 기준으로 병합 (먼저 나온 항목 유지)"""
+        merged: dict = {}
+        for batch in batches:
+            for news in batch:
+                merged.setdefault(news.url, news)
+        return list(merged.values())
+
+    async def _fetch_from_api(self, query: str, page: int = 1, from_date: Optional[datetime] = None) -> List[NewsCreate]:
         if not settings.NEWS_API_KEY:
              # 키가 없으면 안전하게 Mock으로 폴백하거나 에러 발생
-            print("[WARNING] No API Key found. Fallback to Mock data.")
-            return self._get_mock_news(query)
+            logger.warning("No API Key found. Fallback to Mock data.")
+            return self._get_mock_news(query) if page == 1 else []
 
         params = {
             "q": query,
             "apiKey": settings.NEWS_API_KEY,
             "language": "en", # or 'ko'
             "sortBy": "publishedAt",
-            "pageSize": 10
+            "pageSize": settings.NEWS_API_PAGE_SIZE,
+            "page": page
         }
+        if from_date:
+            params["from"] = from_date.isoformat(timespec="seconds")
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(self.BASE_URL, params=params)
-                response.raise_for_status()
+        try:
+            with NEWSAPI_REQUEST_DURATION.time():
+                response = await self._request(params)
                 data = response.json()
-                
-                articles = data.get("articles", [])
-                return [
-                    NewsCreate(
-                        title=TextProcessor.clean_text(article.get("title", "No Title")),
-                        url=article.get("url", ""),
-                        content=TextProcessor.clean_text(article.get("content") or article.get("description", "")),
-                        image_url=article.get("urlToImage"),
-                        published_at=datetime.fromisoformat(article["publishedAt"].replace("Z", "+00:00")) if article.get("publishedAt") else datetime.now()
-                    )
-                    for article in articles
-                    if article.get("url") and article.get("title") # 필수 필드 체크
-                ]
-            except Exception as e:
-                print(f"[ERROR] NewsAPI request failed: {e}")
-                raise e # Re-raise to be handled by the endpoint or middleware
+            
+            articles = [
+                article for article in data.get("articles", [])
+                if article.get("url") and article.get("title") # 필수 필드 체크
+            ]
+            # 페이지 단위로 제목/본문을 한 번에 정제
+            with STAGE_DURATION.time(stage="text_clean"):
+                titles = TextProcessor.clean_many([article["title"] for article in articles])
+                contents = TextProcessor.clean_many([article.get("content") or article.get("description", "") for article in articles])
+            return [
+                NewsCreate(
+                    title=title,
+                    url=article["url"],
+                    content=content,
+                    image_url=article.get("urlToImage"),
+                    published_at=datetime.fromisoformat(article["publishedAt"].replace("Z", "+00:00")) if article.get("publishedAt") else datetime.now()
+                )
+                for article, title, content in zip(articles, titles, contents)
+            ]
+        except Exception as e:
+            logger.error("NewsAPI request failed: %s", e)
+            raise e # Re-raise to be handled by the endpoint or middleware
 
     def _get_mock_news(self, query: str) -> List[NewsCreate]:
         """UI 개발 및 테스트를 위한 가짜 데이터 (한국어)"""
@@ -0,0 +1,130 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.db.database import dialect_insert
+from app.db.models import News, NewsMinhashBand
+from app.services.table_versions import bump_version
+from app.utils.minhash import bands, minhash, similarity
+
+# (밴드 번호, 밴드 값) IN (...) 조건 하나당 바인드 변수 2개
+CHUNK_SIZE = 400
+
+# (band, value) -> [(news_id, minhash, cluster_id)]
+Candidates = Dict[Tuple[int, int], List[Tuple[int, bytes, int]]]
+
+
+def news_minhash(title: Optional[str], content: Optional[str]) -> Optional[bytes]:
+    """저장할 뉴스의 MinHash 서명 (본문이 없으면 제목 기준, 비활성화 시 None)"""
+    if not settings.DEDUP_ENABLED:
+        return None
+    return minhash(content or title or "", settings.DEDUP_MIN_TOKENS)
+
+
+async def _load_candidates(db: AsyncSession, keys: Sequence[Tuple[int, int]]) -> Candidates:
+    candidates: Candidates = {}
+    for i in range(0, len(keys), CHUNK_SIZE):
+        result = await db.execute(
+            select(NewsMinhashBand.band, NewsMinhashBand.value, News.id, News.minhash, News.cluster_id)
+            .join(News, News.id == NewsMinhashBand.news_id)
+            .where(tuple_(NewsMinhashBand.band, NewsMinhashBand.value).in_(keys[i:i + CHUNK_SIZE]))
+        )
+        for band, value, news_id, signature, cluster_id in result:
+            candidates.setdefault((band, value), []).append((news_id, signature, cluster_id or news_id))
+    return candidates
+
+
+def _closest_cluster(candidates: Candidates, keys: List[Tuple[int, int]], signature: bytes) -> Optional[int]:
+    best: Optional[Tuple[float, int]] = None
+    seen = set()
+    for key in keys:
+        for news_id, other, cluster_id in candidates.get(key, ()):
+            if news_id in seen:
+                continue
+            seen.add(news_id)
+            score = similarity(signature, other)
+            if score >= settings.DEDUP_MIN_SIMILARITY and (best is None or score > best[0]):
+                best = (score, cluster_id)
+    return best[1] if best else None
+
+
+async def assign_clusters(db: AsyncSession, news_list: Sequence[News]) -> int:
+    """
+    새로 저장된 뉴스를 유사 중복 묶음에 연결합니다. (커밋은 호출자가 수행)
+    - LSH 밴드가 하나라도 같은 대표 기사만 후보로 조회 후 서명의 유사도로 판정
+    - 가까운 묶음이 없으면 자기 자신이 새 묶음의 대표가 되고 밴드 색인에 추가
+    - 같은 배치 안의 앞선 기사와도 비교 (입력 순서대로 처리)
+    반환: 기존 묶음에 연결된 뉴스 수
+    """
+    if not news_list:
+        return 0
+    news_keys = {n.id: list(enumerate(bands(n.minhash))) for n in news_list if n.minhash is not None}
+    all_keys = list({key for keys in news_keys.values() for key in keys})
+    candidates = await _load_candidates(db, all_keys) if all_keys else {}
+
+    band_rows: List[dict] = []
+    assignments: List[dict] = []
+    linked = 0
+    for news in news_list:
+        keys = news_keys.get(news.id)
+        cluster_id = _closest_cluster(candidates, keys, news.minhash) if keys else None
+        if cluster_id is None:
+            cluster_id = news.id
+            for key in keys or ():
+                candidates.setdefault(key, []).append((news.id, news.minhash, news.id))
+                band_rows.append({"band": key[0], "value": key[1], "news_id": news.id})
+        else:
+            linked += 1
+        assignments.append({"id": news.id, "cluster_id": cluster_id})
+
+    await db.execute(update(News), assignments)
+    for news, row in zip(news_list, assignments):
+        set_committed_value(news, "cluster_id", row["cluster_id"])
+    insert = dialect_insert(db)
+    for i in range(0, len(band_rows), CHUNK_SIZE):
+        await db.execute(insert(NewsMinhashBand).values(band_rows[i:i + CHUNK_SIZE]).on_conflict_do_nothing())
+    return linked
+
+
+async def find_cluster_analysis(db: AsyncSession, news_item: News) -> Optional[News]:
+    """같은 묶음에서 이미 분석된 다른 기사 (대표 기사 우선)"""
+    if not settings.DEDUP_REUSE_ANALYSIS or news_item.cluster_id is None:
+        return None
+    result = await db.execute(
+        select(News)
+        .where(
+            News.cluster_id == news_item.cluster_id,
+            News.id != news_item.id,
+            News.summary.is_not(None),
+        )
+        .order_by(News.id)
+        .limit(1)
+    )
+    return result.scalars().first()
+
+
+async def rebuild_clusters(db: AsyncSession, chunk_size: int = 1000) -> int:
+    """
+    기존 뉴스 전체의 MinHash 서명과 묶음을 다시 계산합니다. (마이그레이션/복구용)
+    반환: 기존 묶음에 연결된 뉴스 수
+    """
+    await db.execute(delete(NewsMinhashBand))
+    linked, last_id = 0, 0
+    while True:
+        result = await db.execute(select(News).where(News.id > last_id).order_by(News.id).limit(chunk_size))
+        chunk = result.scalars().all()
+        if not chunk:
+            break
+        signatures = [{"id": n.id, "minhash": news_minhash(n.title, n.content)} for n in chunk]
+        await db.execute(update(News), signatures)
+        for news, row in zip(chunk, signatures):
+            set_committed_value(news, "minhash", row["minhash"])
+        linked += await assign_clusters(db, chunk)
+        last_id = chunk[-1].id
+        db.expunge_all()
+    await bump_version(db)
+    await db.commit()
+    return linked
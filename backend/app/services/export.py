@@ -0,0 +1,196 @@
+"""
+뉴스 대량 내보내기 (GET /news/export)
+
+- 수집 시각(created_at, id) 오름차순으로 서버 측 커서(yield_per)에서 EXPORT_CHUNK_SIZE행씩 읽어
+  바로 직렬화/압축하여 내보냅니다. ORM 객체를 만들지 않으며 메모리 사용량은 전체 행 수와 무관합니다.
+- ndjson / csv: gzip 또는 zstd(zstandard)로 파일 전체를 압축할 수 있습니다.
+- parquet(pyarrow): 청크마다 row group 하나를 씁니다. compression은 파일 전체가 아니라
+  Parquet 컬럼 압축 코덱(gzip/zstd, 기본 snappy)으로 적용됩니다.
+"""
+import csv
+import importlib.util
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, Iterable, List, Optional, Sequence
+
+from sqlalchemy import Select, select
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.models import News
+from app.services.listing import LIST_FIELDS
+from app.utils.dates import as_naive_utc
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8", "parquet": "application/vnd.apache.parquet"}
+COMPRESSED_MEDIA_TYPES = {"gzip": "application/gzip", "zstd": "application/zstd"}
+EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+
+class ExportUnavailable(RuntimeError):
+    """요청한 형식/압축에 필요한 패키지가 설치되지 않음 (requirements.txt 일부만 설치한 경우 대비)"""
+
+
+def check_available(fmt: str, compression: str) -> None:
+    if fmt == "parquet" and importlib.util.find_spec("pyarrow") is None:
+        raise ExportUnavailable("Parquet export requires 'pyarrow' (pip install pyarrow)")
+    if fmt != "parquet" and compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+        raise ExportUnavailable("zstd compression requires 'zstandard' (pip install zstandard)")
+
+
+def export_filename(fmt: str, compression: str) -> str:
+    suffix = EXTENSIONS.get(compression, "") if fmt != "parquet" else ""
+    return f"news_export.{fmt}{suffix}"
+
+
+def export_media_type(fmt: str, compression: str) -> str:
+    if fmt != "parquet" and compression in COMPRESSED_MEDIA_TYPES:
+        return COMPRESSED_MEDIA_TYPES[compression]
+    return MEDIA_TYPES[fmt]
+
+
+def build_export_query(fields: Sequence[str] = LIST_FIELDS, since: Optional[datetime] = None) -> Select:
+    """수집 시각 오름차순 (ix_news_created_at_id 인덱스 순서). since: 이 시각 이후 수집된 뉴스만"""
+    stmt = select(*(getattr(News, f) for f in fields)).order_by(News.created_at, News.id)
+    if since is not None:
+        stmt = stmt.where(News.created_at >= as_naive_utc(since))
+    return stmt
+
+
+async def _row_chunks(stmt: Select, chunk_size: int) -> AsyncIterator[List[dict]]:
+    # 응답 전송 중에도 유지되도록 내보내기 전용 세션 사용
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(stmt.execution_options(yield_per=chunk_size))
+        async for partition in result.mappings().partitions():
+            rows = [dict(row) for row in partition]
+            for row in rows:
+                if "keywords" in row:
+                    row["keywords"] = json.loads(row["keywords"]) if row["keywords"] else []
+            yield rows
+
+
+def _iso(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _ndjson(rows: Iterable[dict]) -> bytes:
+    return "".join(
+        json.dumps({k: _iso(v) for k, v in row.items()}, ensure_ascii=False) + "\n" for row in rows
+    ).encode("utf-8")
+
+
+def _csv(rows: Iterable[Sequence]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _csv_rows(fields: Sequence[str], rows: Iterable[dict]) -> bytes:
+    # keywords는 JSON 배열 문자열로 기록
+    return _csv(
+        [json.dumps(row[f], ensure_ascii=False) if f == "keywords" else _iso(row[f]) for f in fields]
+        for row in rows
+    )
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter 출력 버퍼 (row group을 쓸 때마다 take()로 비움)"""
+
+    def __init__(self):
+        super().__init__()
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def take(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def _parquet_schema(fields: Sequence[str]):
+    import pyarrow as pa
+
+    types = {
+        "id": pa.int64(),
+        "cluster_id": pa.int64(),
+        "sentiment_score": pa.float64(),
+        "keywords": pa.list_(pa.string()),
+        # 저장 값은 UTC (SQLite는 tzinfo 없이 반환)
+        "published_at": pa.timestamp("us", tz="UTC"),
+        "created_at": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([(f, types.get(f, pa.string())) for f in fields])
+
+
+def _compressor(compression: str):
+    if compression == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 31) # wbits=31: gzip 헤더 포함
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().compressobj()
+    return None
+
+
+async def _parquet_stream(chunks: AsyncIterator[List[dict]], fields: Sequence[str], compression: str) -> AsyncIterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema(fields)
+    sink = _ChunkSink()
+    codec = compression if compression != "none" else "snappy"
+    writer = pq.ParquetWriter(sink, schema, compression=codec)
+    try:
+        async for rows in chunks:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            yield sink.take()
+    finally:
+        writer.close()
+    yield sink.take()
+
+
+async def export_news(
+    fmt: str,
+    fields: Sequence[str] = LIST_FIELDS,
+    since: Optional[datetime] = None,
+    compression: str = "none",
+    chunk_size: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """선택한 컬럼을 형식에 맞게 직렬화(및 압축)한 바이트 조각을 청크 단위로 내보냅니다."""
+    chunks = _row_chunks(build_export_query(fields, since), chunk_size or settings.EXPORT_CHUNK_SIZE)
+
+    if fmt == "parquet":
+        async for data in _parquet_stream(chunks, fields, compression):
+            if data:
+                yield data
+        return
+
+    async def encoded() -> AsyncIterator[bytes]:
+        if fmt == "csv":
+            yield _csv([fields]) # 행이 없어도 헤더는 내보냄
+        async for rows in chunks:
+            yield _ndjson(rows) if fmt == "ndjson" else _csv_rows(fields, rows)
+
+    compressor = _compressor(compression)
+    async for data in encoded():
+        data = compressor.compress(data) if compressor else data
+        if data:
+            yield data
+    if compressor:
+        yield compressor.flush()
@@ -0,0 +1,138 @@
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import NEWS_DEDUPLICATED, NEWS_INGESTED, STAGE_DURATION
+from app.db.database import AsyncSessionLocal, dialect_insert
+from app.db.models import News
+from app.schemas.news import NewsCreate
+from app.services.dedup import assign_clusters, news_minhash
+from app.services.keyword_engine import keyword_engine
+from app.services.keyword_index import index_new_news
+from app.services.table_versions import bump_version
+
+# SQLite 바인드 변수 한도(구버전 999, 3.32+ 32766)를 넘지 않도록 나누어 처리
+CHUNK_SIZE = 500
+
+
+def _to_row(news_data: NewsCreate) -> dict:
+    return {
+        "title": news_data.title,
+        "url": news_data.url,
+        "content": news_data.content,
+        "image_url": news_data.image_url,
+        "published_at": news_data.published_at,
+        # Optional fields (if provided by Crawler/Mock)
+        "summary": news_data.summary,
+        "sentiment_label": news_data.sentiment_label,
+        "sentiment_score": news_data.sentiment_score,
+        "keywords": json.dumps(news_data.keywords) if news_data.keywords else None,
+        "minhash": news_minhash(news_data.title, news_data.content),
+    }
+
+
+async def _select_by_urls(db: AsyncSession, urls: Sequence[str]) -> Dict[str, News]:
+    found: Dict[str, News] = {}
+    for i in range(0, len(urls), CHUNK_SIZE):
+        chunk = urls[i:i + CHUNK_SIZE]
+        result = await db.execute(select(News).where(News.url.in_(chunk)))
+        for n in result.scalars():
+            found[n.url] = n
+    return found
+
+
+async def select_existing_urls(db: AsyncSession, urls: Sequence[str]) -> set:
+    """주어진 URL 중 이미 저장된 URL 집합을 반환합니다."""
+    existing = set()
+    for i in range(0, len(urls), CHUNK_SIZE):
+        result = await db.execute(select(News.url).where(News.url.in_(urls[i:i + CHUNK_SIZE])))
+        existing.update(result.scalars())
+    return existing
+
+
+async def lookup_known_urls(urls: Sequence[str]) -> set:
+    """
+    crawler.search_news의 known_urls 콜백용: 호출마다 전용 세션으로 조회합니다.
+    여러 키워드의 수집이 동시에 콜백을 호출하므로 하나의 AsyncSession을 공유하면 안 됩니다.
+    """
+    async with AsyncSessionLocal() as db:
+        return await select_existing_urls(db, urls)
+
+
+@dataclass
+class UpsertResult:
+    """upsert_news 결과"""
+    news: List[News] # 저장된 뉴스 (입력 순서, 입력 내 중복 URL은 한 번)
+    inserted: int # 이번에 새로 저장한 행 수 (나머지는 이미 저장되어 있던 URL)
+
+
+async def bulk_upsert_news(db: AsyncSession, news_list: Sequence[NewsCreate]) -> List[News]:
+    """크롤링 결과를 저장하고 저장된 뉴스 목록(입력 순서)을 반환합니다. (upsert_news 참고)"""
+    return (await upsert_news(db, news_list)).news
+
+
+async def upsert_news(db: AsyncSession, news_list: Sequence[NewsCreate]) -> UpsertResult:
+    """
+    크롤링 결과를 한 번의 트랜잭션으로 저장합니다.
+    1. 입력 목록 내 중복 URL 제거 (먼저 나온 항목 유지)
+    2. 기존 뉴스를 `url IN (...)` 한 번으로 조회
+    3. 신규 뉴스만 `INSERT ... ON CONFLICT(url) DO NOTHING RETURNING` 으로 저장
+    4. 동시 검색과의 경합으로 건너뛴 행은 다시 조회하여 채움
+    5. 신규 뉴스의 키워드를 news_keywords / 시간별 집계에, 단어를 문서 빈도(DF)에 반영
+       (코퍼스 통계 단일 행은 커밋 직전에, 메모리 DF 사본은 커밋 후 갱신)
+    6. 신규 뉴스를 MinHash로 기존 유사 중복 묶음(cluster_id)에 연결
+    7. 신규 뉴스가 있으면 테이블 버전(목록 응답 ETag/캐시) 증가
+    반환: 저장된 뉴스(입력 순서)와 새로 저장한 행 수
+    """
+    unique: Dict[str, NewsCreate] = {}
+    for news_data in news_list:
+        if news_data.url and news_data.url not in unique:
+            unique[news_data.url] = news_data
+    if not unique:
+        return UpsertResult(news=[], inserted=0)
+
+    urls = list(unique)
+    with STAGE_DURATION.time(stage="upsert"):
+        stored = await _select_by_urls(db, urls)
+
+        new_rows = [_to_row(unique[url]) for url in urls if url not in stored]
+        inserted: List[News] = []
+        insert = dialect_insert(db)
+        for i in range(0, len(new_rows), CHUNK_SIZE):
+            stmt = (
+                insert(News)
+                .values(new_rows[i:i + CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=[News.url])
+                .returning(News)
+            )
+            result = await db.execute(stmt)
+            for n in result.scalars():
+                stored[n.url] = n
+                inserted.append(n)
+
+        # 다른 요청이 먼저 저장한 URL (ON CONFLICT로 건너뜀)
+        missing = [url for url in urls if url not in stored]
+        if missing:
+            stored.update(await _select_by_urls(db, missing))
+
+    # 신규 뉴스 키워드 색인/집계 (같은 트랜잭션)
+    with STAGE_DURATION.time(stage="keyword_index"):
+        await index_new_news(db, inserted)
+        corpus_delta = await keyword_engine.add_documents(db, inserted)
+    with STAGE_DURATION.time(stage="dedup"):
+        linked = await assign_clusters(db, inserted)
+    if inserted:
+        await bump_version(db)
+    # 모든 수집이 갱신하는 단일 행이므로 잠금을 가장 짧게 잡도록 커밋 직전에 갱신
+    await keyword_engine.add_corpus_stats(db, corpus_delta)
+
+    with STAGE_DURATION.time(stage="commit"):
+        await db.commit()
+    keyword_engine.merge(corpus_delta)
+    NEWS_INGESTED.inc(len(inserted))
+    NEWS_DEDUPLICATED.inc(len(news_list) - len(inserted), kind="url")
+    NEWS_DEDUPLICATED.inc(linked, kind="near_duplicate")
+    return UpsertResult(news=[stored[url] for url in urls if url in stored], inserted=len(inserted))
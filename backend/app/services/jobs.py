@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import os
+import socket
+from datetime import timedelta
+from typing import List, Optional, Sequence
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.models import AnalysisJob, News
+from app.services.analysis import analyze_news
+from app.utils.dates import utcnow
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+FINISHED_STATUSES = ("succeeded", "dead")
+
+
+class AnalysisJobQueue:
+    """
+    SQLite(또는 PostgreSQL) 테이블 기반의 내구성 있는 분석 작업 큐
+    - 같은 뉴스에 대해 대기/처리 중인 작업이 있으면 새로 만들지 않음
+    - 워커는 `UPDATE ... RETURNING` 한 번으로 작업을 원자적으로 가져감
+    - 실패 시 지수 백오프로 재시도, JOB_MAX_ATTEMPTS 초과 시 dead(dead-letter)
+    """
+
+    def __init__(self):
+        # 같은 프로세스의 대기자(long-poll)와 워커를 깨우는 브로드캐스트 이벤트
+        self._changed = asyncio.Event()
+
+    def notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def wait_changed(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def enqueue(self, db: AsyncSession, news_ids: Sequence[int]) -> List[AnalysisJob]:
+        """뉴스 ID별 작업을 등록합니다. 이미 대기/처리 중인 작업은 그대로 반환합니다."""
+        news_ids = list(dict.fromkeys(news_ids))
+        if not news_ids:
+            return []
+        result = await db.execute(
+            select(AnalysisJob).where(
+                AnalysisJob.news_id.in_(news_ids),
+                AnalysisJob.status.in_(ACTIVE_STATUSES),
+            )
+        )
+        jobs = {job.news_id: job for job in result.scalars()}
+
+        now = utcnow()
+        for news_id in news_ids:
+            if news_id not in jobs:
+                jobs[news_id] = AnalysisJob(
+                    news_id=news_id,
+                    status="queued",
+                    attempts=0,
+                    max_attempts=settings.JOB_MAX_ATTEMPTS,
+                    available_at=now,
+                    created_at=now,
+                )
+                db.add(jobs[news_id])
+        await db.commit()
+        self.notify()
+        return [jobs[news_id] for news_id in news_ids]
+
+    async def enqueue_unanalyzed(self, db: AsyncSession, news_list: Sequence[News]) -> List[AnalysisJob]:
+        """요약이 없는 뉴스만 골라 작업을 등록합니다. (수집 직후 자동 분석용)"""
+        return await self.enqueue(db, [n.id for n in news_list if n.summary is None])
+
+    async def claim(self, worker_id: str) -> Optional[AnalysisJob]:
+        """실행 가능한 작업 하나를 running 상태로 바꾸며 가져옵니다."""
+        now = utcnow()
+        next_job = (
+            select(AnalysisJob.id)
+            .where(AnalysisJob.status == "queued", AnalysisJob.available_at <= now)
+            .order_by(AnalysisJob.available_at, AnalysisJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True) # PostgreSQL 전용, SQLite는 쓰기 잠금으로 직렬화
+            .scalar_subquery()
+        )
+        stmt = (
+            update(AnalysisJob)
+            .where(AnalysisJob.id == next_job, AnalysisJob.status == "queued")
+            .values(
+                status="running",
+                attempts=AnalysisJob.attempts + 1,
+                locked_by=worker_id,
+                locked_at=now,
+            )
+            .returning(AnalysisJob)
+            .execution_options(synchronize_session=False)
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(stmt)
+            job = result.scalars().first()
+            await db.commit()
+        return job
+
+    async def complete(self, job_id: int) -> None:
+        await self._finish(job_id, status="succeeded", finished_at=utcnow(), last_error=None)
+
+    async def fail(self, job: AnalysisJob, error: str) -> None:
+        """재시도 가능하면 지연 후 다시 대기열로, 아니면 dead로 이동합니다."""
+        if job.attempts >= job.max_attempts:
+            await self._finish(job.id, status="dead", finished_at=utcnow(), last_error=error)
+            return
+        delay = settings.JOB_RETRY_BACKOFF_SECONDS * (2 ** (job.attempts - 1))
+        await self._finish(
+            job.id,
+            status="queued",
+            available_at=utcnow() + timedelta(seconds=delay),
+            last_error=error,
+        )
+
+    async def retry(self, db: AsyncSession, job: AnalysisJob) -> AnalysisJob:
+        """dead 작업을 시도 횟수를 초기화하여 다시 대기열에 넣습니다."""
+        job.status = "queued"
+        job.attempts = 0
+        job.available_at = utcnow()
+        job.finished_at = None
+        await db.commit()
+        await db.refresh(job)
+        self.notify()
+        return job
+
+    async def requeue_stale(self) -> int:
+        """오래 running 상태인 작업(워커 비정상 종료)을 다시 대기열에 넣습니다."""
+        deadline = utcnow() - timedelta(seconds=settings.JOB_STALE_SECONDS)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                update(AnalysisJob)
+                .where(AnalysisJob.status == "running", AnalysisJob.locked_at < deadline)
+                .values(status="queued", locked_by=None, locked_at=None, available_at=utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        return result.rowcount or 0
+
+    async def wait_for(self, db: AsyncSession, job_id: int, timeout: float) -> Optional[AnalysisJob]:
+        """
+        작업이 끝나거나 timeout(초)이 지날 때까지 기다린 뒤 최신 상태를 반환합니다. (long-poll)
+        별도 워커 프로세스가 처리하는 경우에도 동작하도록 주기적으로 DB를 다시 조회합니다.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            result = await db.execute(
+                select(AnalysisJob).where(AnalysisJob.id == job_id).execution_options(populate_existing=True)
+            )
+            job = result.scalars().first()
+            await db.commit() # 다음 조회가 최신 스냅샷을 보도록 트랜잭션 종료
+            remaining = deadline - loop.time()
+            if job is None or job.status in FINISHED_STATUSES or remaining <= 0:
+                return job
+            await self.wait_changed(min(remaining, settings.JOB_POLL_INTERVAL_SECONDS))
+
+    async def _finish(self, job_id: int, **values) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(AnalysisJob)
+                .where(AnalysisJob.id == job_id)
+                .values(locked_by=None, locked_at=None, **values)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        self.notify()
+
+
+class AnalysisWorkerPool:
+    """분석 작업 큐를 소비하는 asyncio 워커 묶음"""
+
+    def __init__(self, queue: AnalysisJobQueue):
+        self.queue = queue
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+    @property
+    def running(self) -> bool:
+        return any(not t.done() for t in self._tasks)
+
+    async def start(self, workers: int) -> None:
+        if self.running or workers <= 0:
+            return
+        self._stopping.clear()
+        await self.queue.requeue_stale()
+        self._tasks = [
+            asyncio.create_task(self._work(f"{self.worker_prefix}:{i}")) for i in range(workers)
+        ]
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_once(self, worker_id: str) -> bool:
+        """작업 하나를 처리합니다. 처리할 작업이 없으면 False."""
+        job = await self.queue.claim(worker_id)
+        if job is None:
+            return False
+        try:
+            async with AsyncSessionLocal() as db:
+                news_item = await db.get(News, job.news_id)
+                if news_item is None:
+                    raise LookupError(f"News {job.news_id} not found")
+                # LLM 실패는 가짜 분석을 저장하지 않고 재시도/dead-letter로 처리
+                await analyze_news(db, news_item, raise_on_error=True)
+        except Exception as e:
+            logger.error("Analysis job %s (news %s) failed: %s", job.id, job.news_id, e)
+            await self.queue.fail(job, str(e))
+        else:
+            await self.queue.complete(job.id)
+        return True
+
+    async def _work(self, worker_id: str) -> None:
+        loop = asyncio.get_running_loop()
+        last_requeue = loop.time()
+        while not self._stopping.is_set():
+            try:
+                if await self.run_once(worker_id):
+                    continue
+                # 유휴 시간에 중단된 작업 회수
+                if loop.time() - last_requeue > settings.JOB_STALE_SECONDS:
+                    last_requeue = loop.time()
+                    await self.queue.requeue_stale()
+            except Exception as e:
+                logger.error("Analysis worker %s error: %s", worker_id, e)
+            await self.queue.wait_changed(settings.JOB_POLL_INTERVAL_SECONDS)
+
+
+job_queue = AnalysisJobQueue()
+worker_pool = AnalysisWorkerPool(job_queue)
@@ -0,0 +1,370 @@
+import asyncio
+import itertools
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, dialect_insert
+from app.db.models import CorpusStats, News, TermDocumentFrequency
+from app.services.table_versions import bump_version
+from app.utils.text import TextProcessor, parallel_map
+
+logger = logging.getLogger(__name__)
+
+# BM25 파라미터 (일반적인 기본값)
+BM25_K1 = 1.2
+BM25_B = 0.75
+# 바이그램은 문서 안에서 반복되거나 다른 뉴스에도 등장해야 후보가 됨 (우연한 단어 조합 제외)
+BIGRAM_MIN_COUNT = 2
+CHUNK_SIZE = 500
+
+
+def is_rare_bigram(term: str, df: int) -> bool:
+    """한 문서에만 등장한 바이그램 (DF 테이블 행의 대부분, 메모리 사본에는 적재하지 않고 df 0으로 계산)"""
+    return df < BIGRAM_MIN_COUNT and " " in term
+
+
+def document_text(title: Optional[str], content: Optional[str]) -> str:
+    """DF 집계와 점수 계산에 사용하는 뉴스 텍스트 (제목 + 본문)"""
+    return f"{title or ''}\n{content or ''}"
+
+
+def document_terms(text: str) -> Tuple[List[str], int]:
+    """
+    텍스트의 단어와 바이그램 목록(등장 순서, 중복 포함)과 문서 길이(단어 수)
+    바이그램은 같은 문장(제목/본문 경계 포함) 안에서 불용어 제거 후 이웃한 두 단어를 공백으로 연결합니다.
+    """
+    tokens: List[str] = []
+    bigrams: List[str] = []
+    for words in TextProcessor.tokenize_sentences(text):
+        tokens.extend(words)
+        bigrams.extend(map(" ".join, zip(words, words[1:])))
+    return tokens + bigrams, len(tokens)
+
+
+def count_document_frequencies(texts: Iterable[str]) -> Tuple[Counter, int, int]:
+    """텍스트 묶음의 DF 증분: (term -> 등장 문서 수, 문서 수, 전체 단어 수)"""
+    df: Counter = Counter()
+    documents = total_length = 0
+    for terms, length in parallel_map(document_terms, list(texts)):
+        df.update(set(terms))
+        documents += 1
+        total_length += length
+    return df, documents, total_length
+
+
+@dataclass
+class CorpusDelta:
+    """수집 한 번의 DF 증분"""
+    df: Counter
+    documents: int
+    total_length: int
+
+
+class KeywordEngine:
+    """
+    코퍼스 기반 키워드 추출기
+    - DF는 term_document_frequencies 테이블에 저장하고, 새 뉴스만큼만 증분 갱신 (전체 재계산 없음)
+    - 점수 계산은 프로세스 메모리의 DF 사본을 사용 (처음 사용할 때 적재, 이후 start()의 백그라운드 작업이
+      KEYWORD_DF_REFRESH_SECONDS마다 재적재하므로 요청 경로에서는 DF 테이블을 다시 읽지 않음)
+    - 메모리 사본에는 한 문서에만 등장한 바이그램을 적재하지 않음 (후보 조건 BIGRAM_MIN_COUNT를 넘지 못해 점수에 영향이 작음)
+    - 여러 문서는 NumPy로 한 번에 점수를 계산
+    """
+
+    def __init__(self):
+        self._df: Dict[str, int] = {}
+        self._documents = 0
+        self._total_length = 0
+        self._loaded_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    @property
+    def document_count(self) -> int:
+        return self._documents
+
+    def reset(self) -> None:
+        """메모리 사본 초기화 (다음 사용 시 DB에서 다시 적재)"""
+        self._df = {}
+        self._documents = 0
+        self._total_length = 0
+        self._loaded_at = None
+
+    def observe(self, texts: Iterable[str]) -> None:
+        """메모리 DF에만 문서를 반영합니다. (벤치마크/테스트용)"""
+        df, documents, total_length = count_document_frequencies(texts)
+        self._merge(df, documents, total_length)
+        self._loaded_at = self._loaded_at or time.monotonic()
+
+    def _merge(self, df: Counter, documents: int, total_length: int) -> None:
+        for term, count in df.items():
+            self._df[term] = self._df.get(term, 0) + count
+        self._documents += documents
+        self._total_length += total_length
+
+    async def load(self, db: AsyncSession) -> None:
+        """DB의 DF를 메모리로 적재합니다. (한 문서에만 등장한 바이그램 제외)"""
+        stats = await db.get(CorpusStats, 1)
+        result = await db.execute(
+            select(TermDocumentFrequency.term, TermDocumentFrequency.df).where(or_(
+                TermDocumentFrequency.df >= BIGRAM_MIN_COUNT,
+                ~TermDocumentFrequency.term.contains(" "),
+            ))
+        )
+        self._df = dict(result.all())
+        self._documents = stats.document_count if stats else 0
+        self._total_length = stats.total_length if stats else 0
+        self._loaded_at = time.monotonic()
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """처음 사용할 때만 적재합니다. (재적재는 백그라운드 작업이 수행)"""
+        if self._loaded_at is None:
+            await self.load(db)
+
+    # --- 백그라운드 DF 재적재 (다른 프로세스의 수집 반영, IngestionScheduler와 같은 방식) ---
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._stopping.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=settings.KEYWORD_DF_REFRESH_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            # 아직 사용하지 않은(적재되지 않은) 사본은 읽지 않음
+            if self._stopping.is_set() or self._loaded_at is None:
+                continue
+            try:
+                async with AsyncSessionLocal() as db:
+                    await self.load(db)
+            except Exception as e:
+                logger.error("Keyword DF refresh failed: %s", e)
+
+    async def add_documents(self, db: AsyncSession, news_list: Sequence[News]) -> Optional[CorpusDelta]:
+        """
+        새로 저장된 뉴스의 단어를 DF에 더하고 증분을 반환합니다. 비용은 새 뉴스의 길이에 비례합니다.
+        코퍼스 전체 통계(corpus_stats, 모든 수집이 갱신하는 단일 행)는 잠금 시간을 줄이도록 호출자가
+        커밋 직전에 add_corpus_stats로, 메모리 사본은 커밋 후 merge로 반영합니다. (롤백 시 메모리 DF 부풀림 방지)
+        """
+        if not news_list:
+            return None
+        delta = CorpusDelta(*count_document_frequencies(
+            document_text(n.title, n.content) for n in news_list
+        ))
+        await self._apply_terms(db, delta.df)
+        return delta
+
+    async def add_corpus_stats(self, db: AsyncSession, delta: Optional[CorpusDelta]) -> None:
+        """add_documents 증분의 문서 수/전체 단어 수를 corpus_stats에 더합니다. (커밋은 호출자가 수행)"""
+        if delta is not None:
+            await self._apply_stats(db, delta.documents, delta.total_length)
+
+    def merge(self, delta: Optional[CorpusDelta]) -> None:
+        """커밋된 증분을 메모리 사본에 반영합니다. (적재되어 있을 때만, 사본에 없는 희귀 바이그램은 제외)"""
+        if delta is not None and self._loaded_at is not None:
+            df = Counter({
+                term: count for term, count in delta.df.items()
+                if term in self._df or not is_rare_bigram(term, count)
+            })
+            self._merge(df, delta.documents, delta.total_length)
+
+    async def _apply_terms(self, db: AsyncSession, df: Counter) -> None:
+        # 동시 수집(PostgreSQL)이 같은 단어 행을 다른 순서로 잠가 교착 상태가 되지 않도록 단어 순으로 갱신
+        insert = dialect_insert(db)
+        rows = [{"term": term, "df": count} for term, count in sorted(df.items())]
+        for i in range(0, len(rows), CHUNK_SIZE):
+            stmt = insert(TermDocumentFrequency).values(rows[i:i + CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[TermDocumentFrequency.term],
+                set_={"df": TermDocumentFrequency.df + stmt.excluded.df},
+            )
+            await db.execute(stmt)
+
+    async def _apply_stats(self, db: AsyncSession, documents: int, total_length: int) -> None:
+        insert = dialect_insert(db)
+        stmt = insert(CorpusStats).values(id=1, document_count=documents, total_length=total_length)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CorpusStats.id],
+            set_={
+                "document_count": CorpusStats.document_count + stmt.excluded.document_count,
+                "total_length": CorpusStats.total_length + stmt.excluded.total_length,
+            },
+        )
+        await db.execute(stmt)
+
+    def score_many(
+        self,
+        texts: Sequence[str],
+        top_n: int = 5,
+        method: str = "bm25",
+        bigrams: bool = True,
+    ) -> List[List[str]]:
+        """
+        여러 문서의 상위 키워드를 한 번에 계산합니다. (메모리 DF 기준)
+        (문서, 단어) 쌍을 정수 배열로 만들어 TF 집계/가중치/문서별 정렬을 모두 NumPy로 처리합니다.
+        동점이면 바이그램, 그다음 문서 안에서 먼저 등장한 단어가 우선하며
+        이미 뽑힌 바이그램에 포함된 단어는 제외합니다.
+        """
+        # 단어 -> 정수 ID (처음 보는 단어는 다음 번호), 변환은 map으로 C 수준에서 처리
+        vocab: Dict[str, int] = defaultdict(itertools.count().__next__)
+        all_terms: List[str] = []
+        counts = np.zeros(len(texts), dtype=np.int64)
+        lengths = np.zeros(len(texts), dtype=np.float64)
+        for i, (terms, length) in enumerate(parallel_map(document_terms, texts)):
+            if not bigrams:
+                terms = terms[:length]
+            all_terms.extend(terms)
+            counts[i] = len(terms)
+            lengths[i] = length
+        if not all_terms:
+            return [[] for _ in texts]
+        term_ids = np.fromiter(map(vocab.__getitem__, all_terms), dtype=np.int64, count=len(all_terms))
+        doc_ids = np.repeat(np.arange(len(texts), dtype=np.int64), counts)
+
+        # (문서, 단어) 쌍별 TF와 첫 등장 위치
+        vocab_size = len(vocab)
+        keys = doc_ids * vocab_size + term_ids
+        pairs, first_seen, tf = np.unique(keys, return_index=True, return_counts=True)
+        docs = pairs // vocab_size
+        terms = pairs % vocab_size
+
+        words = list(vocab)
+        is_bigram = np.fromiter((" " in w for w in words), dtype=bool, count=vocab_size)
+        df = np.fromiter((self._df.get(w, 0) for w in words), dtype=np.float64, count=vocab_size)
+        n_docs = float(max(self._documents, 1))
+        tf = tf.astype(np.float64)
+
+        if method == "tfidf":
+            idf = np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
+            scores = (1.0 + np.log(tf)) * idf[terms]
+        else:
+            idf = np.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            avgdl = self._total_length / self._documents if self._documents else max(lengths.mean(), 1.0)
+            norm = BM25_K1 * (1.0 - BM25_B + BM25_B * lengths[docs] / max(avgdl, 1.0))
+            scores = tf * (BM25_K1 + 1.0) / (tf + norm) * idf[terms]
+
+        keep = ~is_bigram[terms] | (tf >= BIGRAM_MIN_COUNT) | (df[terms] >= BIGRAM_MIN_COUNT)
+        docs, terms, scores, first_seen = docs[keep], terms[keep], scores[keep], first_seen[keep]
+
+        # 문서 순 -> 점수 내림차순 -> (동점이면) 바이그램 -> 첫 등장 순으로 정렬
+        order = np.lexsort((first_seen, ~is_bigram[terms], -scores, docs))
+        docs, terms = docs[order], terms[order]
+        # 먼저 뽑힌 바이그램에 포함된 단어는 건너뛰므로 후보를 넉넉히 남김
+        group_start = np.searchsorted(docs, docs, side="left")
+        top = (np.arange(len(docs)) - group_start) < top_n * 3
+        docs, terms = docs[top], terms[top]
+
+        results: List[List[str]] = [[] for _ in texts]
+        covered: set = set()
+        current = -1
+        for d, t in zip(docs.tolist(), terms.tolist()):
+            if d != current:
+                current, covered = d, set()
+            keywords, word = results[d], words[t]
+            if len(keywords) >= top_n or word in covered:
+                continue
+            keywords.append(word)
+            if is_bigram[t]:
+                covered.update(word.split(" "))
+        return results
+
+    async def extract_keywords_many(self, db: AsyncSession, texts: Sequence[str], top_n: int = 5) -> List[List[str]]:
+        """설정된 엔진(KEYWORD_ENGINE)으로 여러 텍스트의 키워드를 추출합니다."""
+        if settings.KEYWORD_ENGINE == "frequency":
+            return TextProcessor.extract_keywords_many(texts, top_n)
+        await self.ensure_loaded(db)
+        return self.score_many(texts, top_n, settings.KEYWORD_ENGINE, settings.KEYWORD_BIGRAMS)
+
+    async def keywords_for_news(self, db: AsyncSession, news_list: Sequence, top_n: int = 5) -> List[List[str]]:
+        """
+        뉴스(title/content 속성을 가진 행) 목록의 키워드
+        frequency 엔진은 기존과 같이 본문(없으면 제목)만 사용합니다.
+        """
+        if settings.KEYWORD_ENGINE == "frequency":
+            return TextProcessor.extract_keywords_many([n.content or n.title for n in news_list], top_n)
+        return await self.extract_keywords_many(db, [document_text(n.title, n.content) for n in news_list], top_n)
+
+    async def rebuild(self, db: AsyncSession, chunk_size: int = 1000) -> int:
+        """
+        저장된 뉴스 전체로 DF를 다시 계산합니다. (마이그레이션/복구용)
+        반환: 처리한 뉴스 수
+        """
+        await db.execute(delete(TermDocumentFrequency))
+        await db.execute(delete(CorpusStats))
+        df: Counter = Counter()
+        documents = total_length = 0
+        async for chunk in _iter_news_text(db, chunk_size):
+            chunk_df, chunk_docs, chunk_length = count_document_frequencies(
+                document_text(row.title, row.content) for row in chunk
+            )
+            df.update(chunk_df)
+            documents += chunk_docs
+            total_length += chunk_length
+        await self._apply_terms(db, df)
+        await self._apply_stats(db, documents, total_length)
+        await db.commit()
+        self.reset()
+        return documents
+
+    async def rescore_all(self, db: AsyncSession, chunk_size: int = 5000, top_n: int = 5) -> int:
+        """
+        저장된 뉴스 전체의 키워드를 현재 DF로 다시 계산해 News.keywords에 저장합니다.
+        (news_keywords 색인/집계는 호출자가 rebuild_keyword_index로 다시 만듭니다)
+        반환: 처리한 뉴스 수
+        """
+        await self.load(db)
+        processed = 0
+        async for chunk in _iter_news_text(db, chunk_size):
+            keywords = await self.keywords_for_news(db, chunk, top_n)
+            await db.execute(
+                update(News),
+                [{"id": row.id, "keywords": json.dumps(kw)} for row, kw in zip(chunk, keywords)],
+            )
+            processed += len(chunk)
+        await bump_version(db)
+        await db.commit()
+        return processed
+
+
+async def _iter_news_text(db: AsyncSession, chunk_size: int):
+    """(id, title, content) 행을 id 순으로 나누어 조회합니다."""
+    last_id = 0
+    while True:
+        result = await db.execute(
+            select(News.id, News.title, News.content).where(News.id > last_id).order_by(News.id).limit(chunk_size)
+        )
+        chunk = result.all()
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1].id
+
+
+keyword_engine = KeywordEngine()
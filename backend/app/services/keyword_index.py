@@ -0,0 +1,185 @@
+import json
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import dialect_insert
+from app.db.models import KeywordHourlyRollup, News, NewsKeyword, SentimentRollup
+from app.services import sentiment_rollup
+from app.utils.dates import floor_hour, utcnow
+
+MAX_KEYWORD_LENGTH = 64
+
+# (bucket_start, keyword) -> [article_count, sentiment_sum, sentiment_count]
+RollupDelta = Dict[Tuple[datetime, str], List[float]]
+
+
+def normalize_keywords(keywords: Optional[Iterable[str]]) -> List[str]:
+    """소문자/공백 정리 후 중복 제거 (순서 유지)"""
+    normalized = []
+    for keyword in keywords or []:
+        keyword = " ".join(str(keyword).split()).lower()[:MAX_KEYWORD_LENGTH]
+        if keyword:
+            normalized.append(keyword)
+    return list(dict.fromkeys(normalized))
+
+
+def parse_keywords(raw: Optional[str]) -> List[str]:
+    """News.keywords(JSON 문자열) -> 정규화된 키워드 목록"""
+    return normalize_keywords(json.loads(raw)) if raw else []
+
+
+def _timestamp(news: News) -> datetime:
+    return news.published_at or news.created_at or utcnow()
+
+
+def _bucket(news: News) -> datetime:
+    return floor_hour(_timestamp(news))
+
+
+def _accumulate(delta: RollupDelta, bucket: datetime, keywords: Sequence[str], score: Optional[float], sign: int) -> None:
+    for keyword in keywords:
+        entry = delta.setdefault((bucket, keyword), [0, 0.0, 0])
+        entry[0] += sign
+        if score is not None:
+            entry[1] += sign * score
+            entry[2] += sign
+
+
+async def _apply_rollup_delta(db: AsyncSession, delta: RollupDelta) -> None:
+    # 동시 트랜잭션이 같은 집계 행을 같은 순서로 잠그도록 기본 키 (bucket_start, keyword) 순으로 정렬
+    rows = [
+        {
+            "bucket_start": bucket,
+            "keyword": keyword,
+            "article_count": count,
+            "sentiment_sum": score_sum,
+            "sentiment_count": score_count,
+        }
+        for (bucket, keyword), (count, score_sum, score_count) in sorted(delta.items())
+        if count or score_sum or score_count
+    ]
+    if not rows:
+        return
+    insert = dialect_insert(db)
+    stmt = insert(KeywordHourlyRollup).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[KeywordHourlyRollup.bucket_start, KeywordHourlyRollup.keyword],
+        set_={
+            "article_count": KeywordHourlyRollup.article_count + stmt.excluded.article_count,
+            "sentiment_sum": KeywordHourlyRollup.sentiment_sum + stmt.excluded.sentiment_sum,
+            "sentiment_count": KeywordHourlyRollup.sentiment_count + stmt.excluded.sentiment_count,
+        },
+    )
+    await db.execute(stmt)
+
+
+async def index_new_news(db: AsyncSession, news_list: Sequence[News]) -> None:
+    """
+    새로 저장된 뉴스의 키워드를 색인하고 시간별 집계(감성 라벨이 있으면 감성 집계 포함)에 더합니다.
+    (커밋은 호출자가 수행)
+    """
+    rows, delta, sentiment_delta = [], {}, {}
+    for news in news_list:
+        keywords = parse_keywords(news.keywords)
+        rows.extend({"news_id": news.id, "keyword": k} for k in keywords)
+        _accumulate(delta, _bucket(news), keywords, news.sentiment_score, +1)
+        sentiment_rollup.accumulate(
+            sentiment_delta, _timestamp(news), keywords, news.sentiment_label, news.sentiment_score, +1
+        )
+    if rows:
+        insert = dialect_insert(db)
+        await db.execute(insert(NewsKeyword).values(rows).on_conflict_do_nothing())
+    await _apply_rollup_delta(db, delta)
+    await sentiment_rollup.apply_delta(db, sentiment_delta)
+
+
+async def reindex_news(
+    db: AsyncSession,
+    news: News,
+    old_keywords: Sequence[str],
+    old_score: Optional[float],
+    old_label: Optional[str] = None,
+) -> None:
+    """
+    분석 결과로 키워드/감성이 바뀐 뉴스의 색인과 집계(키워드, 감성)를 갱신합니다.
+    이전 기여분을 빼고 새 값을 더합니다. (커밋은 호출자가 수행)
+    """
+    old_keywords = normalize_keywords(old_keywords)
+    new_keywords = parse_keywords(news.keywords)
+    bucket = _bucket(news)
+    delta: RollupDelta = {}
+    _accumulate(delta, bucket, old_keywords, old_score, -1)
+    _accumulate(delta, bucket, new_keywords, news.sentiment_score, +1)
+    sentiment_delta: sentiment_rollup.SentimentDelta = {}
+    timestamp = _timestamp(news)
+    sentiment_rollup.accumulate(sentiment_delta, timestamp, old_keywords, old_label, old_score, -1)
+    sentiment_rollup.accumulate(sentiment_delta, timestamp, new_keywords, news.sentiment_label, news.sentiment_score, +1)
+
+    await db.execute(delete(NewsKeyword).where(NewsKeyword.news_id == news.id))
+    if new_keywords:
+        insert = dialect_insert(db)
+        await db.execute(
+            insert(NewsKeyword)
+            .values([{"news_id": news.id, "keyword": k} for k in new_keywords])
+            .on_conflict_do_nothing()
+        )
+    await _apply_rollup_delta(db, delta)
+    await sentiment_rollup.apply_delta(db, sentiment_delta)
+
+
+async def trending_keywords(db: AsyncSession, hours: int = 24, limit: int = 10) -> List[dict]:
+    """최근 hours 시간 동안 가장 많이 등장한 키워드 (집계 테이블만 조회)"""
+    since = floor_hour(utcnow() - timedelta(hours=hours - 1))
+    total = func.sum(KeywordHourlyRollup.article_count)
+    scored = func.sum(KeywordHourlyRollup.sentiment_count)
+    stmt = (
+        select(
+            KeywordHourlyRollup.keyword,
+            total.label("count"),
+            func.sum(KeywordHourlyRollup.sentiment_sum).label("sentiment_sum"),
+            scored.label("sentiment_count"),
+        )
+        .where(KeywordHourlyRollup.bucket_start >= since)
+        .group_by(KeywordHourlyRollup.keyword)
+        .having(total > 0)
+        .order_by(total.desc(), KeywordHourlyRollup.keyword)
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    return [
+        {
+            "keyword": row.keyword,
+            "count": row.count,
+            "avg_sentiment_score": row.sentiment_sum / row.sentiment_count if row.sentiment_count else None,
+        }
+        for row in result
+    ]
+
+
+async def rebuild_keyword_index(db: AsyncSession, chunk_size: int = 1000) -> int:
+    """
+    기존 뉴스 전체로 키워드 색인과 시간별 키워드/감성 집계를 다시 만듭니다. (마이그레이션/복구용)
+    반환: 처리한 뉴스 수
+    """
+    await db.execute(delete(NewsKeyword))
+    await db.execute(delete(KeywordHourlyRollup))
+    await db.execute(delete(SentimentRollup))
+
+    processed, last_id = 0, 0
+    while True:
+        result = await db.execute(
+            select(News).where(News.id > last_id).order_by(News.id).limit(chunk_size)
+        )
+        chunk = result.scalars().all()
+        if not chunk:
+            break
+        await index_new_news(db, chunk)
+        processed += len(chunk)
+        last_id = chunk[-1].id
+        db.expunge_all()
+    await db.commit()
+    return processed
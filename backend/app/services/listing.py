@@ -0,0 +1,110 @@
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, String, select, tuple_, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import News
+from app.schemas.news import NewsResponse
+
+# fields= 로 선택 가능한 컬럼 (NewsResponse 필드와 동일)
+LIST_FIELDS = tuple(NewsResponse.model_fields)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _created_at_key(dialect_name: str):
+    # SQLite는 DATETIME을 문자열로 저장하므로 (server_default 'YYYY-MM-DD HH:MM:SS' 등)
+    # 저장된 문자열 그대로 비교해야 같은 시각의 행이 누락/중복되지 않음. CAST 없이 인덱스 사용.
+    if dialect_name == "sqlite":
+        return type_coerce(News.created_at, String)
+    return News.created_at
+
+
+def encode_cursor(created_at, news_id: int) -> str:
+    value = created_at.isoformat() if isinstance(created_at, datetime) else created_at
+    raw = json.dumps([value, news_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, dialect_name: str) -> Tuple[object, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, news_id = json.loads(raw)
+        if dialect_name != "sqlite":
+            created_at = datetime.fromisoformat(created_at)
+        return created_at, int(news_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+
+
+def parse_fields(fields: Optional[str]) -> Sequence[str]:
+    """쉼표로 구분된 필드 목록을 검증합니다. None이면 전체 필드."""
+    if not fields:
+        return LIST_FIELDS
+    selected = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in selected if f not in LIST_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return tuple(dict.fromkeys(selected))
+
+
+def build_list_query(
+    dialect_name: str,
+    fields: Sequence[str] = LIST_FIELDS,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+) -> Select:
+    """
+    최신순 목록 조회 쿼리. 요청한 컬럼만 조회하며(ORM 객체 생성 없음),
+    cursor가 있으면 (created_at, id) 기준 keyset 조건을 사용합니다. (OFFSET 미사용)
+    """
+    created_key = _created_at_key(dialect_name)
+    columns = [getattr(News, f) for f in fields if f not in ("id", "created_at")]
+    stmt = select(
+        News.id,
+        News.created_at,
+        created_key.label("_cursor_created_at"),
+        *columns,
+    ).order_by(News.created_at.desc(), News.id.desc()).limit(limit)
+
+    if cursor:
+        created_at, news_id = decode_cursor(cursor, dialect_name)
+        stmt = stmt.where(tuple_(created_key, News.id) < tuple_(created_at, news_id))
+    elif skip:
+        stmt = stmt.offset(skip)
+    return stmt
+
+
+async def fetch_news_page(
+    db: AsyncSession,
+    fields: Sequence[str] = LIST_FIELDS,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    목록 한 페이지를 직렬화 가능한 딕셔너리로 반환합니다.
+    반환: (행 목록, 다음 페이지 cursor 또는 None)
+    """
+    stmt = build_list_query(db.get_bind().dialect.name, fields, limit, cursor, skip)
+    result = await db.execute(stmt)
+    rows = result.mappings().all()
+
+    items = []
+    for row in rows:
+        item = {f: row[f] for f in fields}
+        if "keywords" in item:
+            item["keywords"] = json.loads(item["keywords"]) if item["keywords"] else []
+        items.append(item)
+
+    next_cursor = None
+    if len(rows) == limit:
+        last = rows[-1]
+        next_cursor = encode_cursor(last["_cursor_created_at"], last["id"])
+    return items, next_cursor
@@ -0,0 +1,95 @@
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Hashable, NamedTuple, Optional
+
+from app.core.config import settings
+
+
+class CachedResponse(NamedTuple):
+    version: int
+    body: bytes
+    headers: Dict[str, str]
+
+
+class ResponseCache:
+    """
+    직렬화된 응답 본문 LRU (키: 정규화한 요청 파라미터)
+    항목은 저장 당시의 테이블 버전과 함께 보관되며, 버전이 바뀌면 무효입니다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: int) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, version: int, body: bytes, headers: Dict[str, str]) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = CachedResponse(version, body, headers)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def make_etag(version: int) -> str:
+    return f'"v{version}"'
+
+
+def validator_headers(version: int, updated_at: Optional[datetime]) -> Dict[str, str]:
+    """ETag/Last-Modified 및 매번 재검증하도록 하는 Cache-Control 헤더"""
+    headers = {"ETag": make_etag(version), "Cache-Control": "no-cache"}
+    if updated_at is not None:
+        headers["Last-Modified"] = format_datetime(updated_at.replace(tzinfo=timezone.utc), usegmt=True)
+    return headers
+
+
+def is_not_modified(
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+    version: int,
+    updated_at: Optional[datetime],
+) -> bool:
+    """조건부 GET 판정 (If-None-Match 우선, 약한 비교)"""
+    if if_none_match is not None:
+        etag = make_etag(version)
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+    if if_modified_since is None or updated_at is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP 날짜는 초 단위
+    return updated_at.replace(tzinfo=timezone.utc, microsecond=0) <= since
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_MAX_SIZE)
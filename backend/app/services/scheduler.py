@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import or_, select
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.models import WatchQuery
+from app.services.crawler import crawler
+from app.services.ingestion import lookup_known_urls, upsert_news
+from app.services.jobs import job_queue
+from app.utils.dates import as_naive_utc, utcnow
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionScheduler:
+    """
+    관심 키워드(watch-list)를 주기적으로 수집하는 백그라운드 스케줄러
+    - 실행 간격에 ±jitter를 적용하여 여러 키워드 요청이 한꺼번에 몰리지 않도록 분산
+    - 실패 시 키워드별 지수 백오프 (SCHEDULER_MAX_BACKOFF_SECONDS 상한)
+    - 마지막으로 수집한 최신 발행 시각을 `from`으로 사용하는 증분 수집
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self.last_tick_at: Optional[datetime] = None
+        self.total_runs = 0
+        self.total_failures = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._stopping.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await self.run_due()
+            except Exception as e:
+                logger.error("Scheduler tick failed: %s", e)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=settings.SCHEDULER_TICK_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run_due(self) -> int:
+        """실행 시각이 된 관심 키워드를 수집하고, 실행한 개수를 반환합니다."""
+        self.last_tick_at = utcnow()
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(WatchQuery.id)
+                .where(
+                    WatchQuery.enabled.is_(True),
+                    or_(WatchQuery.next_run_at.is_(None), WatchQuery.next_run_at <= self.last_tick_at),
+                )
+                .order_by(WatchQuery.next_run_at)
+            )
+            due_ids = list(result.scalars())
+        for watch_id in due_ids:
+            if self._stopping.is_set():
+                break
+            await self.run_query(watch_id)
+        return len(due_ids)
+
+    @staticmethod
+    def _jittered(seconds: float) -> float:
+        ratio = settings.SCHEDULER_JITTER_RATIO
+        return seconds * random.uniform(1 - ratio, 1 + ratio)
+
+    async def run_query(self, watch_id: int) -> Optional[WatchQuery]:
+        """
+        관심 키워드 하나를 수집하고 실행 결과를 기록합니다.
+        NewsAPI 요청(여러 페이지) 동안 DB 커넥션을 잡지 않도록 수집 후에 저장용 세션을 엽니다.
+        """
+        async with AsyncSessionLocal() as db:
+            watch = await db.get(WatchQuery, watch_id)
+        if watch is None:
+            return None
+
+        start = time.perf_counter()
+        error: Optional[Exception] = None
+        try:
+            scraped = await crawler.search_news(
+                watch.query,
+                pages=watch.pages,
+                known_urls=lookup_known_urls,
+                from_date=watch.newest_published_at,
+            )
+        except Exception as e:
+            error = e
+
+        async with AsyncSessionLocal() as db:
+            watch = await db.get(WatchQuery, watch_id)
+            if watch is None: # 수집 중 삭제됨
+                return None
+            if error is None:
+                try:
+                    result = await upsert_news(db, scraped)
+                    if settings.JOB_AUTO_ENQUEUE:
+                        await job_queue.enqueue_unanalyzed(db, result.news)
+                except Exception as e:
+                    await db.rollback()
+                    await db.refresh(watch)
+                    error = e
+
+            if error is not None:
+                self.total_failures += 1
+                watch.consecutive_failures += 1
+                watch.last_error = str(error)
+                backoff = min(
+                    settings.SCHEDULER_MAX_BACKOFF_SECONDS,
+                    watch.interval_seconds * (2 ** watch.consecutive_failures),
+                )
+                watch.next_run_at = utcnow() + timedelta(seconds=self._jittered(backoff))
+                logger.error("Scheduled crawl for '%s' failed: %s", watch.query, error)
+            else:
+                published = [as_naive_utc(n.published_at) for n in scraped if n.published_at]
+                if published:
+                    newest = max(published)
+                    if watch.newest_published_at is None or newest > watch.newest_published_at:
+                        watch.newest_published_at = newest
+                watch.last_article_count = len(scraped)
+                watch.last_new_count = result.inserted
+                watch.consecutive_failures = 0
+                watch.last_error = None
+                watch.next_run_at = utcnow() + timedelta(seconds=self._jittered(watch.interval_seconds))
+
+            self.total_runs += 1
+            watch.last_run_at = utcnow()
+            watch.last_latency_ms = (time.perf_counter() - start) * 1000
+            await db.commit()
+            await db.refresh(watch)
+            return watch
+
+scheduler = IngestionScheduler()
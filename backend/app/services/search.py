@@ -0,0 +1,95 @@
+import re
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Select, column, func, literal_column, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.fts import PG_COLUMN
+from app.db.models import News
+from app.utils.dates import as_naive_utc
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+news_fts = table("news_fts", column("rowid"))
+
+# 컬럼 가중치: title, content, summary, keywords (bm25는 낮을수록 관련도 높음)
+_BM25 = literal_column("bm25(news_fts, 10.0, 1.0, 4.0, 6.0)")
+_SNIPPET = literal_column("snippet(news_fts, -1, '<mark>', '</mark>', '…', 16)")
+
+# PostgreSQL: GIN 인덱스가 걸린 저장 tsvector 컬럼 (ts_rank_cd는 높을수록 관련도 높음)
+_PG_VECTOR = literal_column(f"news.{PG_COLUMN}")
+_PG_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=16, MinWords=5, FragmentDelimiter=…, MaxFragments=1"
+
+
+def build_tsquery(q: str) -> str:
+    """사용자 입력을 PostgreSQL to_tsquery 식으로 변환합니다. (FTS5와 같이 모든 단어 포함, 접두 검색)"""
+    return " & ".join(f"{token.lower()}:*" for token in _TOKEN.findall(q))
+
+
+def build_match_query(q: str) -> str:
+    """
+    사용자 입력을 안전한 FTS5 MATCH 식으로 변환합니다.
+    각 단어를 따옴표로 감싸 연산자 해석을 막고, 접두 검색(*)으로 한국어 조사 결합형도 찾습니다.
+    (예: '시장 전망' -> '"시장"* "전망"*', 모든 단어 포함)
+    """
+    return " ".join(f'"{token}"*' for token in _TOKEN.findall(q))
+
+
+async def search_stored_news(
+    db: AsyncSession,
+    q: str,
+    sentiment: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> List[Tuple[News, float, str]]:
+    """
+    저장된 뉴스를 BM25 순위로 전문 검색합니다.
+    반환: (뉴스, 관련도 점수(높을수록 관련), 하이라이트 스니펫) 목록
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = _postgres_search(q)
+    else:
+        stmt = _sqlite_search(q)
+    if stmt is None:
+        return []
+
+    if sentiment:
+        stmt = stmt.where(News.sentiment_label == sentiment)
+    if date_from:
+        stmt = stmt.where(News.published_at >= as_naive_utc(date_from))
+    if date_to:
+        stmt = stmt.where(News.published_at <= as_naive_utc(date_to))
+    stmt = stmt.order_by(literal_column("rank")).limit(limit).offset(offset)
+
+    result = await db.execute(stmt)
+    return [(news, -rank, snippet) for news, rank, snippet in result.all()]
+
+
+def _sqlite_search(q: str) -> Optional[Select]:
+    match = build_match_query(q)
+    if not match:
+        return None
+    return (
+        select(News, _BM25.label("rank"), _SNIPPET.label("snippet"))
+        .select_from(news_fts)
+        .join(News, News.id == news_fts.c.rowid)
+        .where(text("news_fts MATCH :match").bindparams(match=match))
+    )
+
+
+def _postgres_search(q: str) -> Optional[Select]:
+    tsquery = build_tsquery(q)
+    if not tsquery:
+        return None
+    query = func.to_tsquery(literal_column("'simple'"), tsquery)
+    snippet = func.ts_headline(
+        literal_column("'simple'"), func.coalesce(News.content, News.title), query, _PG_HEADLINE_OPTIONS
+    )
+    # rank는 오름차순 정렬되므로 음수로 (반환 시 다시 부호 반전)
+    return (
+        select(News, (-func.ts_rank_cd(_PG_VECTOR, query)).label("rank"), snippet.label("snippet"))
+        .where(_PG_VECTOR.op("@@")(query))
+    )
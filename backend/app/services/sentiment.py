@@ -0,0 +1,170 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.utils.text import TextProcessor, parallel_map
+
+# 기본 감성 사전 (단어 -> 가중치). 영어는 원형, 한국어는 어간(조사/어미 제외) 기준
+ENGLISH_LEXICON = {
+    # positive
+    "gain": 1.0, "gains": 1.0, "growth": 1.0, "grow": 0.8, "rise": 0.8, "rally": 1.0, "surge": 1.0, "soar": 1.0,
+    "jump": 0.7, "climb": 0.7, "rebound": 0.8, "recover": 0.8, "recovery": 0.8, "boost": 0.8, "improve": 0.8,
+    "improvement": 0.8, "strong": 0.8, "strength": 0.6, "robust": 0.8, "record": 0.5, "profit": 0.8,
+    "profitable": 0.9, "beat": 0.7, "outperform": 0.9, "upgrade": 0.9, "optimism": 1.0, "optimistic": 1.0,
+    "confidence": 0.7, "confident": 0.7, "success": 1.0, "successful": 1.0, "win": 0.8, "breakthrough": 1.0,
+    "innovation": 0.6, "innovative": 0.6, "expand": 0.6, "expansion": 0.6, "approve": 0.6, "approval": 0.6,
+    "agreement": 0.5, "deal": 0.3, "partnership": 0.5, "launch": 0.3, "positive": 0.9, "good": 0.7,
+    "great": 0.9, "best": 0.8, "better": 0.6, "benefit": 0.7, "opportunity": 0.6, "stable": 0.5,
+    "stability": 0.5, "bullish": 1.0, "upbeat": 0.9, "praise": 0.8, "celebrate": 0.8, "support": 0.4,
+    "peace": 0.8, "safe": 0.5, "welcome": 0.6, "efficient": 0.5, "hire": 0.5, "hiring": 0.5,
+    # negative
+    "loss": -1.0, "losses": -1.0, "lose": -0.8, "decline": -0.8, "fall": -0.8, "drop": -0.8, "plunge": -1.0,
+    "slump": -1.0, "tumble": -1.0, "crash": -1.0, "sink": -0.8, "slide": -0.6, "weak": -0.8, "weakness": -0.8,
+    "slowdown": -0.8, "recession": -1.0, "crisis": -1.0, "risk": -0.5, "risks": -0.5, "fear": -0.9,
+    "fears": -0.9, "concern": -0.6, "concerns": -0.6, "worry": -0.7, "worries": -0.7, "uncertainty": -0.7,
+    "volatile": -0.5, "volatility": -0.5, "inflation": -0.4, "debt": -0.4, "default": -0.9, "bankruptcy": -1.0,
+    "bankrupt": -1.0, "layoff": -0.9, "layoffs": -0.9, "cut": -0.5, "cuts": -0.5, "miss": -0.6,
+    "downgrade": -0.9, "warn": -0.7, "warning": -0.7, "lawsuit": -0.7, "sue": -0.7, "fraud": -1.0,
+    "scandal": -1.0, "probe": -0.6, "investigation": -0.5, "penalty": -0.7, "ban": -0.6,
+    "sanction": -0.7, "sanctions": -0.7, "tariff": -0.4, "tariffs": -0.4, "war": -1.0, "attack": -1.0,
+    "conflict": -0.8, "violence": -1.0, "death": -1.0, "dead": -1.0, "kill": -1.0, "killed": -1.0,
+    "disaster": -1.0, "damage": -0.8, "fail": -0.9, "failure": -0.9, "negative": -0.9, "bad": -0.7,
+    "worse": -0.8, "worst": -0.9, "bearish": -1.0, "pessimism": -1.0, "pessimistic": -1.0, "shortage": -0.7,
+    "delay": -0.5, "outage": -0.8, "breach": -0.8, "hack": -0.8, "protest": -0.6, "criticism": -0.7,
+    "criticize": -0.7, "threat": -0.8, "collapse": -1.0, "struggle": -0.7, "unemployment": -0.7,
+}
+
+KOREAN_LEXICON = {
+    # positive
+    "상승": 1.0, "급등": 1.0, "반등": 0.8, "호조": 1.0, "호황": 1.0, "호재": 1.0, "성장": 0.9, "증가": 0.6,
+    "개선": 0.8, "회복": 0.8, "흑자": 1.0, "최고": 0.7, "신기록": 0.7, "돌파": 0.7, "강세": 0.9, "수혜": 0.8,
+    "기대": 0.6, "기대감": 0.7, "낙관": 0.9, "확대": 0.5, "성공": 1.0, "혁신": 0.6, "협력": 0.5, "합의": 0.6,
+    "승인": 0.6, "타결": 0.7, "안정": 0.6, "긍정": 0.9, "호평": 0.9, "수상": 0.8, "선정": 0.5, "투자유치": 0.8,
+    "활성화": 0.6, "상향": 0.8, "최대": 0.4, "신고가": 0.9, "출시": 0.3, "채용": 0.5, "평화": 0.8, "지원": 0.3,
+    # negative
+    "하락": -1.0, "급락": -1.0, "폭락": -1.0, "약세": -0.9, "부진": -0.9, "둔화": -0.8, "침체": -1.0,
+    "감소": -0.6, "적자": -1.0, "손실": -1.0, "위기": -1.0, "우려": -0.8, "불안": -0.8, "불확실": -0.7,
+    "공포": -0.9, "리스크": -0.5, "위험": -0.7, "악재": -1.0, "악화": -0.9, "부도": -1.0, "파산": -1.0,
+    "폐업": -0.9, "해고": -0.9, "구조조정": -0.8, "감원": -0.8, "실패": -0.9, "논란": -0.7, "비판": -0.7,
+    "의혹": -0.7, "소송": -0.7, "사기": -1.0, "횡령": -1.0, "비리": -1.0, "수사": -0.6, "제재": -0.7,
+    "벌금": -0.6, "규제": -0.4, "관세": -0.4, "전쟁": -1.0, "공격": -0.9, "분쟁": -0.8, "갈등": -0.7,
+    "사망": -1.0, "사고": -0.9, "피해": -0.8, "재난": -1.0, "화재": -0.9, "지진": -0.9, "부정": -0.8,
+    "하향": -0.8, "경고": -0.7, "인플레이션": -0.4, "부채": -0.4, "연체": -0.7, "중단": -0.6, "지연": -0.5,
+    "파업": -0.7, "시위": -0.6, "해킹": -0.8, "유출": -0.8, "실업": -0.7, "최저": -0.6, "충격": -0.8,
+    # 감성 어간으로 시작하지만 중립인 단어
+    "최고경영자": 0.0, "최고치": 0.7, "지원자": 0.0,
+}
+
+# 영어 어형 변화 -> 원형 후보 (접미사, 대체 문자열)
+_ENGLISH_SUFFIXES = (
+    ("ies", "y"), ("ied", "y"), ("ing", ""), ("ing", "e"), ("ed", ""), ("ed", "e"), ("es", ""), ("s", ""),
+    ("ly", ""), ("er", ""), ("est", ""),
+)
+# 한국어 어간 최소 길이 (어절 앞부분을 줄여가며 사전과 대조)
+_KOREAN_MIN_STEM = 2
+# 단어 -> 가중치 색인 캐시 최대 크기 (초과 시 비움)
+_MEMO_LIMIT = 200_000
+
+
+class LexiconSentimentModel:
+    """
+    CPU 전용 감성 점수 모델 (사전 기반 선형 모델)
+    score = tanh(bias + scale * Σ 가중치 / sqrt(단어 수)), |score| < neutral_band 이면 neutral
+    가중치는 NumPy 배열(float32)로 보관하며 .npz로 저장/적재할 수 있습니다.
+    """
+
+    def __init__(self, terms: Sequence[str], weights: np.ndarray, bias: float = 0.0, scale: float = 2.0,
+                 neutral_band: float = 0.15):
+        self.terms = list(terms)
+        # 마지막 칸은 사전에 없는 단어용 0
+        self.weights = np.append(np.asarray(weights, dtype=np.float32), np.float32(0))
+        self.bias = float(bias)
+        self.scale = float(scale)
+        self.neutral_band = float(neutral_band)
+        self._index: Dict[str, int] = {term: i for i, term in enumerate(self.terms)}
+        self._memo: Dict[str, int] = {}
+
+    @classmethod
+    def from_lexicon(cls, lexicon: Optional[Dict[str, float]] = None) -> "LexiconSentimentModel":
+        lexicon = lexicon if lexicon is not None else {**ENGLISH_LEXICON, **KOREAN_LEXICON}
+        return cls(list(lexicon), np.fromiter(lexicon.values(), dtype=np.float32, count=len(lexicon)))
+
+    @classmethod
+    def load(cls, path: str) -> "LexiconSentimentModel":
+        with np.load(path) as data:
+            return cls(
+                data["terms"].tolist(), data["weights"],
+                float(data["bias"]), float(data["scale"]), float(data["neutral_band"]),
+            )
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(
+            path,
+            terms=np.array(self.terms),
+            weights=self.weights[:-1].astype(np.float16),
+            bias=self.bias, scale=self.scale, neutral_band=self.neutral_band,
+        )
+
+    def _resolve(self, token: str) -> int:
+        """단어의 사전 색인 (어형 변화/어미를 떼어 대조, 없으면 마지막 칸)"""
+        index = self._index.get(token)
+        if index is None:
+            if token.isascii():
+                for suffix, replacement in _ENGLISH_SUFFIXES:
+                    if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+                        index = self._index.get(token[:-len(suffix)] + replacement)
+                        if index is not None:
+                            break
+            else:
+                for end in range(len(token) - 1, _KOREAN_MIN_STEM - 1, -1):
+                    index = self._index.get(token[:end])
+                    if index is not None:
+                        break
+        if index is None:
+            index = len(self.terms)
+        if len(self._memo) >= _MEMO_LIMIT:
+            self._memo.clear()
+        self._memo[token] = index
+        return index
+
+    def score_many(self, texts: Sequence[str], processes: Optional[bool] = None) -> np.ndarray:
+        """여러 텍스트의 감성 점수 (-1.0 ~ 1.0, float32 배열)"""
+        memo, resolve = self._memo, self._resolve
+        token_lists = parallel_map(TextProcessor.tokenize, texts, processes=processes)
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.float32, count=len(token_lists))
+        ids = np.fromiter(
+            (memo[t] if t in memo else resolve(t) for tokens in token_lists for t in tokens),
+            dtype=np.int32, count=int(lengths.sum()),
+        )
+        doc_ids = np.repeat(np.arange(len(token_lists)), lengths.astype(np.int64))
+        totals = np.bincount(doc_ids, weights=self.weights[ids], minlength=len(token_lists))
+        return np.tanh(self.bias + self.scale * totals / np.sqrt(np.maximum(lengths, 1))).astype(np.float32)
+
+    def labels(self, scores: np.ndarray) -> List[str]:
+        return np.where(
+            scores >= self.neutral_band, "positive",
+            np.where(scores <= -self.neutral_band, "negative", "neutral"),
+        ).tolist()
+
+    def predict_many(self, texts: Sequence[str], processes: Optional[bool] = None) -> List[Tuple[str, float]]:
+        """여러 텍스트의 (감성 라벨, 점수)"""
+        scores = self.score_many(texts, processes)
+        return [(label, round(float(score), 3)) for label, score in zip(self.labels(scores), scores)]
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        return self.predict_many([text])[0]
+
+
+_model: Optional[LexiconSentimentModel] = None
+
+
+def get_sentiment_model() -> LexiconSentimentModel:
+    """SENTIMENT_MODEL_PATH의 가중치(없으면 기본 사전)로 만든 모델 (최초 호출 시 적재)"""
+    global _model
+    if _model is None:
+        _model = (
+            LexiconSentimentModel.load(settings.SENTIMENT_MODEL_PATH)
+            if settings.SENTIMENT_MODEL_PATH else LexiconSentimentModel.from_lexicon()
+        )
+    return _model
@@ -0,0 +1,154 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import dialect_insert
+from app.db.models import SentimentRollup
+from app.utils.dates import floor_day, floor_hour
+
+GRANULARITIES = {"hour": (floor_hour, timedelta(hours=1)), "day": (floor_day, timedelta(days=1))}
+SENTIMENT_LABELS = ("positive", "negative", "neutral")
+PERCENTILES = (10, 50, 90)
+# 감성 점수(-1.0 ~ 1.0)를 나누는 구간 수 (백분위수 해상도 0.05)
+BIN_COUNT = 40
+BIN_WIDTH = 2.0 / BIN_COUNT
+NO_SCORE_BIN = -1
+
+# (granularity, bucket_start, keyword, label, score_bin) -> [article_count, score_sum]
+SentimentDelta = Dict[Tuple[str, datetime, str, str, int], List[float]]
+
+
+def score_bin(score: Optional[float]) -> int:
+    if score is None:
+        return NO_SCORE_BIN
+    return min(max(int((score + 1.0) / BIN_WIDTH), 0), BIN_COUNT - 1)
+
+
+def accumulate(
+    delta: SentimentDelta,
+    timestamp: datetime,
+    keywords: Sequence[str],
+    label: Optional[str],
+    score: Optional[float],
+    sign: int,
+) -> None:
+    """기사 하나의 기여분을 시간/일 버킷, 전체('')와 키워드마다 더하거나(sign=1) 뺍니다(sign=-1)."""
+    if label is None:
+        return
+    bin_index = score_bin(score)
+    for granularity, (floor, _) in GRANULARITIES.items():
+        bucket = floor(timestamp)
+        for keyword in ("", *keywords):
+            entry = delta.setdefault((granularity, bucket, keyword, label, bin_index), [0, 0.0])
+            entry[0] += sign
+            if score is not None:
+                entry[1] += sign * score
+
+
+def _primary_key(key: tuple) -> tuple:
+    """delta 키 (granularity, bucket, keyword, label, score_bin) -> 테이블 기본 키 순서"""
+    granularity, bucket, keyword, label, bin_index = key
+    return granularity, keyword, bucket, label, bin_index
+
+
+async def apply_delta(db: AsyncSession, delta: SentimentDelta) -> None:
+    # 동시 저장(PostgreSQL)이 같은 집계 행(특히 전체 '' 행)을 같은 순서로 잠그도록 기본 키 순으로 정렬
+    rows = [
+        {
+            "granularity": granularity,
+            "bucket_start": bucket,
+            "keyword": keyword,
+            "label": label,
+            "score_bin": bin_index,
+            "article_count": count,
+            "score_sum": score_sum,
+        }
+        for (granularity, bucket, keyword, label, bin_index), (count, score_sum) in sorted(
+            delta.items(), key=lambda item: _primary_key(item[0])
+        )
+        if count or score_sum
+    ]
+    if not rows:
+        return
+    insert = dialect_insert(db)
+    stmt = insert(SentimentRollup).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            SentimentRollup.granularity, SentimentRollup.keyword, SentimentRollup.bucket_start,
+            SentimentRollup.label, SentimentRollup.score_bin,
+        ],
+        set_={
+            "article_count": SentimentRollup.article_count + stmt.excluded.article_count,
+            "score_sum": SentimentRollup.score_sum + stmt.excluded.score_sum,
+        },
+    )
+    await db.execute(stmt)
+
+
+def _percentile(histogram: List[int], total: int, q: int) -> float:
+    """구간별 기사 수로 백분위수 추정 (구간 내 선형 보간)"""
+    target = total * q / 100
+    cumulative = 0
+    for bin_index, count in enumerate(histogram):
+        if count and cumulative + count >= target:
+            fraction = (target - cumulative) / count
+            return round(-1.0 + (bin_index + fraction) * BIN_WIDTH, 3)
+        cumulative += count
+    return 1.0
+
+
+def _summarize(bucket: datetime, label_counts: Dict[str, int], histogram: List[int], score_sum: float) -> dict:
+    scored = sum(histogram)
+    return {
+        "bucket_start": bucket,
+        "count": sum(label_counts.values()),
+        "label_counts": {label: label_counts.get(label, 0) for label in SENTIMENT_LABELS},
+        "avg_sentiment_score": round(score_sum / scored, 4) if scored else None,
+        **{f"p{q}": _percentile(histogram, scored, q) if scored else None for q in PERCENTILES},
+    }
+
+
+async def sentiment_timeseries(
+    db: AsyncSession,
+    keyword: str,
+    granularity: str,
+    start: datetime,
+    end: datetime,
+) -> List[dict]:
+    """
+    [start, end] 구간의 버킷별 라벨 수, 평균/백분위 감성 점수 (집계 테이블만 조회)
+    keyword: 정규화된 키워드 ('' = 전체 기사). 기사가 없는 버킷도 count 0으로 포함
+    """
+    floor, step = GRANULARITIES[granularity]
+    first, last = floor(start), floor(end)
+    result = await db.execute(
+        select(
+            SentimentRollup.bucket_start, SentimentRollup.label, SentimentRollup.score_bin,
+            SentimentRollup.article_count, SentimentRollup.score_sum,
+        ).where(
+            SentimentRollup.granularity == granularity,
+            SentimentRollup.keyword == keyword,
+            SentimentRollup.bucket_start >= first,
+            SentimentRollup.bucket_start <= last,
+            SentimentRollup.article_count > 0,
+        )
+    )
+    label_counts: Dict[datetime, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    histograms: Dict[datetime, List[int]] = defaultdict(lambda: [0] * BIN_COUNT)
+    score_sums: Dict[datetime, float] = defaultdict(float)
+    for bucket, label, bin_index, count, score_sum in result.all():
+        label_counts[bucket][label] += count
+        if bin_index != NO_SCORE_BIN:
+            histograms[bucket][bin_index] += count
+            score_sums[bucket] += score_sum
+
+    series = []
+    bucket = first
+    while bucket <= last:
+        series.append(_summarize(bucket, label_counts.get(bucket, {}), histograms.get(bucket, [0] * BIN_COUNT),
+                                 score_sums.get(bucket, 0.0)))
+        bucket += step
+    return series
@@ -0,0 +1,36 @@
+import time
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import dialect_insert
+from app.db.models import TableVersion
+from app.utils.dates import utcnow
+
+NEWS = "news"
+
+
+async def bump_version(db: AsyncSession, name: str = NEWS) -> None:
+    """
+    테이블 버전을 1 올립니다. (커밋은 호출자가 수행)
+    첫 버전은 현재 시각(ms)으로 시작하여 DB를 새로 만들어도 이전 버전 값과 겹치지 않습니다.
+    """
+    now = utcnow()
+    insert = dialect_insert(db)
+    stmt = insert(TableVersion).values(name=name, version=int(time.time() * 1000), updated_at=now)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TableVersion.name],
+        set_={"version": TableVersion.version + 1, "updated_at": now},
+    )
+    await db.execute(stmt)
+
+
+async def get_version(db: AsyncSession, name: str = NEWS) -> Tuple[int, Optional[datetime]]:
+    """(버전, 마지막 변경 시각). 기록이 없으면 (0, None)"""
+    result = await db.execute(
+        select(TableVersion.version, TableVersion.updated_at).where(TableVersion.name == name)
+    )
+    row = result.first()
+    return (row.version, row.updated_at) if row else (0, None)
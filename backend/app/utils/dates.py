@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """DB 저장용 UTC 현재 시각 (SQLite DateTime 컬럼과 비교 가능하도록 tzinfo 제거)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def as_naive_utc(value: datetime) -> datetime:
+    """tz-aware 시각을 tzinfo 없는 UTC 시각으로 변환합니다. (naive 값은 그대로)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def floor_hour(value: datetime) -> datetime:
+    """UTC 기준 정시로 내림 (시간 단위 집계 버킷)"""
+    return as_naive_utc(value).replace(minute=0, second=0, microsecond=0)
+
+
+def floor_day(value: datetime) -> datetime:
+    """UTC 기준 자정으로 내림 (일 단위 집계 버킷)"""
+    return floor_hour(value).replace(hour=0)
@@ -0,0 +1,125 @@
+from html.parser import HTMLParser
+from typing import List, Optional
+
+# 본문이 아닌 영역 (내용 전체를 무시)
+SKIP_TAGS = {
+    "script", "style", "noscript", "template", "svg", "iframe", "form", "button", "select",
+    "nav", "header", "footer", "aside", "figure",
+}
+# 문단 경계가 되는 태그
+BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "h1", "h2", "h3", "h4", "h5", "h6",
+    "li", "ul", "ol", "blockquote", "pre", "table", "tr", "td", "th", "br", "hr", "dd", "dt",
+}
+# 본문 텍스트로 채택할 문단 최소 길이와 최대 링크 텍스트 비율 (메뉴/관련 기사 목록 제외)
+MIN_BLOCK_CHARS = 25
+MAX_LINK_DENSITY = 0.5
+# HTML에서 여는 태그 없이 닫히지 않는 태그
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+class _Block:
+    __slots__ = ("parts", "link_chars", "in_article")
+
+    def __init__(self, in_article: bool):
+        self.parts: List[str] = []
+        self.link_chars = 0
+        self.in_article = in_article
+
+    @property
+    def text(self) -> str:
+        return " ".join("".join(self.parts).split())
+
+
+class _MainTextParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks: List[_Block] = []
+        self._stack: List[str] = []
+        self._skip_depth = 0
+        self._article_depth = 0
+        self._link_depth = 0
+        self._current: Optional[_Block] = None
+
+    def _is_article(self, tag: str, attrs) -> bool:
+        attrs = dict(attrs)
+        return (
+            tag in ("article", "main")
+            or attrs.get("itemprop") == "articleBody"
+            or attrs.get("role") == "main"
+        )
+
+    def _close_block(self) -> None:
+        if self._current is not None and self._current.text:
+            self.blocks.append(self._current)
+        self._current = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_TAGS:
+            if tag in BLOCK_TAGS:
+                self._close_block()
+            return
+        article = self._is_article(tag, attrs)
+        self._stack.append(tag + ("!" if article else ""))
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        if article:
+            self._article_depth += 1
+        if tag == "a":
+            self._link_depth += 1
+        if tag in BLOCK_TAGS:
+            self._close_block()
+
+    def handle_endtag(self, tag):
+        # 닫히지 않은 태그는 일치하는 여는 태그까지 함께 닫음
+        if not any(entry.rstrip("!") == tag for entry in self._stack):
+            return
+        while self._stack:
+            entry = self._stack.pop()
+            name = entry.rstrip("!")
+            if name in SKIP_TAGS:
+                self._skip_depth -= 1
+            if entry.endswith("!"):
+                self._article_depth -= 1
+            if name == "a":
+                self._link_depth -= 1
+            if name in BLOCK_TAGS:
+                self._close_block()
+            if name == tag:
+                break
+
+    def handle_data(self, data):
+        if self._skip_depth or not data.strip() and self._current is None:
+            return
+        if self._current is None:
+            self._current = _Block(self._article_depth > 0)
+        self._current.parts.append(data)
+        if self._link_depth:
+            self._current.link_chars += len(data.strip())
+
+    def close(self):
+        super().close()
+        self._close_block()
+
+
+def extract_main_text(html: str) -> str:
+    """
+    HTML 문서에서 기사 본문 텍스트를 추출합니다. (문단은 빈 줄로 구분)
+    - 스크립트/스타일/내비게이션/머리말/꼬리말/사이드바 등은 제외
+    - <article>, <main>, itemprop="articleBody" 영역이 있으면 그 안의 문단만 사용
+    - 짧은 문단(MIN_BLOCK_CHARS 미만)과 링크 텍스트 비율이 높은 문단(메뉴, 관련 기사 목록)은 제외
+    """
+    parser = _MainTextParser()
+    parser.feed(html)
+    parser.close()
+
+    blocks = parser.blocks
+    if any(b.in_article for b in blocks):
+        blocks = [b for b in blocks if b.in_article]
+    paragraphs = []
+    for block in blocks:
+        text = block.text
+        if len(text) < MIN_BLOCK_CHARS or block.link_chars / len(text) > MAX_LINK_DENSITY:
+            continue
+        paragraphs.append(text)
+    return "\n\n".join(paragraphs)
@@ -0,0 +1,77 @@
+import re
+from typing import Optional
+
+_SIMPLE_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class JsonStringFieldExtractor:
+    """
+    스트리밍 중인 JSON 객체 텍스트에서 특정 문자열 필드의 값을 도착하는 대로 꺼냅니다.
+    예) '{"summary": "첫 줄\\n둘' + '째 줄", ...' -> "첫 줄\n둘", "째 줄"
+    - 이스케이프(\\n, \\", \\uXXXX, 서로게이트 쌍)가 청크 경계에서 잘려도 처리
+    - 전체 JSON 파싱은 스트림이 끝난 뒤 호출자가 수행
+    """
+
+    def __init__(self, field: str):
+        self._key = re.compile(r'"' + re.escape(field) + r'"\s*:\s*"')
+        self._buffer = ""  # 아직 해석하지 않은 텍스트
+        self._state = "seek"  # seek -> value -> done
+        self._high_surrogate: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
+
+    def feed(self, chunk: str) -> str:
+        """새 청크를 넣고, 새로 확정된 필드 값 조각을 반환합니다."""
+        if self._state == "done":
+            return ""
+        self._buffer += chunk
+        if self._state == "seek":
+            match = self._key.search(self._buffer)
+            if not match:
+                # 키가 청크 경계에 걸칠 수 있으므로 끝부분만 남김
+                self._buffer = self._buffer[-64:]
+                return ""
+            self._buffer = self._buffer[match.end():]
+            self._state = "value"
+        return self._decode()
+
+    def _decode(self) -> str:
+        out = []
+        text, i = self._buffer, 0
+        while i < len(text):
+            ch = text[i]
+            if ch == '"':
+                self._state = "done"
+                i += 1
+                break
+            if ch != "\\":
+                out.append(ch)
+                i += 1
+                continue
+            if i + 1 >= len(text):
+                break  # 이스케이프가 다음 청크에서 이어짐
+            code = text[i + 1]
+            if code == "u":
+                if i + 6 > len(text):
+                    break
+                out.append(self._unicode(text[i + 2:i + 6]))
+                i += 6
+            else:
+                out.append(_SIMPLE_ESCAPES.get(code, code))
+                i += 2
+        self._buffer = text[i:]
+        return "".join(out)
+
+    def _unicode(self, hex_digits: str) -> str:
+        char = chr(int(hex_digits, 16))
+        if 0xD800 <= ord(char) <= 0xDBFF:
+            self._high_surrogate = char
+            return ""
+        if self._high_surrogate and 0xDC00 <= ord(char) <= 0xDFFF:
+            pair = self._high_surrogate + char
+            self._high_surrogate = None
+            return pair.encode("utf-16", "surrogatepass").decode("utf-16")
+        return char
+
@@ -0,0 +1,63 @@
+import re
+from hashlib import blake2b
+from typing import List, Optional
+
+import numpy as np
+
+from app.utils.text import TextProcessor
+
+NUM_PERM = 64
+# LSH: 4개 값씩 16개 밴드. 자카드 유사도 0.8인 두 기사가 한 밴드 이상 일치할 확률 99.9%+,
+# 0.2인 기사는 약 2.5% (후보는 서명으로 다시 확인)
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+_WORD = re.compile(r'[0-9a-z가-힣]+')
+
+# 순열 대신 쓰는 해시 시드 (고정값: 저장된 서명과 호환되어야 함)
+_SEEDS = np.random.default_rng(20240501).integers(0, 2**63, size=NUM_PERM, dtype=np.uint64)
+_M1 = np.uint64(0xBF58476D1CE4E5B9)
+_M2 = np.uint64(0x94D049BB133111EB)
+
+
+def shingles(text: str) -> List[str]:
+    """
+    clean_text 결과를 소문자 단어 3-gram(shingle)으로 나눕니다. (단어가 적으면 단어 단위)
+    clean_text가 남기는 문장부호는 제외하여 띄어쓰기/구두점 차이를 무시합니다.
+    """
+    words = _WORD.findall(TextProcessor.clean_text(text).lower())
+    if len(words) < SHINGLE_SIZE:
+        return words
+    return [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+
+
+def minhash(text: str, min_tokens: int = 0) -> Optional[bytes]:
+    """
+    MinHash 서명 (uint32 NUM_PERM개, DB 저장용 bytes)
+    단어 수가 min_tokens 미만이면 None (짧은 텍스트는 우연히 비슷해지기 쉬움)
+    """
+    features = set(shingles(text))
+    if not features or len(features) + SHINGLE_SIZE - 1 < min_tokens:
+        return None
+    digests = b"".join(blake2b(f.encode("utf-8"), digest_size=8).digest() for f in features)
+    base = np.frombuffer(digests, dtype="<u8")
+    # (shingle 수, NUM_PERM) 해시 행렬을 splitmix64로 섞은 뒤 열별 최솟값
+    z = base[:, None] ^ _SEEDS[None, :]
+    z = (z ^ (z >> np.uint64(30))) * _M1
+    z = (z ^ (z >> np.uint64(27))) * _M2
+    z ^= z >> np.uint64(31)
+    return (z.min(axis=0) >> np.uint64(32)).astype("<u4").tobytes()
+
+
+def similarity(a: bytes, b: bytes) -> float:
+    """두 서명으로 추정한 자카드 유사도"""
+    return float(np.mean(np.frombuffer(a, dtype="<u4") == np.frombuffer(b, dtype="<u4")))
+
+
+def bands(signature: bytes) -> List[int]:
+    """LSH 밴드 값 목록 (인덱스 = 밴드 번호, DB BIGINT에 맞는 부호 있는 64비트 정수)"""
+    size = ROWS * 4
+    return [
+        int.from_bytes(blake2b(signature[i * size:(i + 1) * size], digest_size=8).digest(), "little", signed=True)
+        for i in range(BANDS)
+    ]
@@ -0,0 +1,47 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+from app.core.metrics import COALESCED_CALLS
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 한 번의 실행으로 합칩니다.
+    - 먼저 들어온 호출이 fn을 태스크로 실행하고, 실행 중에 같은 키로 들어온 호출은 그 결과(또는 예외)를 함께 받습니다.
+    - 실행이 끝나면 키를 지우므로 결과를 보관하지 않습니다. (짧은 결과 캐시는 호출자가 별도로 둠)
+    - 대기 중인 호출이 취소되어도 공유 실행은 계속됩니다. (다른 대기자 보호)
+    name: 합쳐진 호출 수 지표(coalesced_calls_total)의 operation 라벨
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self.executions = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.executions += 1
+        else:
+            self.shared += 1
+            COALESCED_CALLS.inc(operation=self.name)
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # 모든 대기자가 취소된 경우에도 "exception was never retrieved" 경고가 나지 않도록 확인
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    def stats(self) -> dict:
+        return {"in_flight": len(self._tasks), "executions": self.executions, "shared": self.shared}
@@ -1,6 +1,8 @@
+import os
 import re
 from collections import Counter
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence
 
 # 확장된 전문 불용어 데이터셋
 ENGLISH_STOPWORDS = {
@@ -11,6 +13,44 @@ KOREAN_STOPWORDS = {
     "있는", "있으며", "있고", "있다", "합니다", "하는", "했다", "있습니다", "위해", "대한", "통해", "대해", "따르면", "관련", "이번", "지난", "것이다", "것으로", "것을", "것이", "것은", "경우", "모든", "정도", "이후", "이전", "지금", "다시", "따라", "부터", "까지", "에게", "에서", "그리고", "하지만", "또한", "매우", "가장", "이미", "결국", "항상", "종종"
 }
 
+# 사전 컴파일된 정규식
+_HTML_TAG = re.compile(r'<[^>]+>')
+_URL = re.compile(r'http\S+|www\.\S+')
+_DISALLOWED = re.compile(r'[^a-zA-Z0-9가-힣\s.,!?\'"]+')
+# 토큰과 언어 분류를 한 번에: 두 번째 그룹은 영어(첫 글자 a-z) 토큰일 때만 채워짐
+_TOKEN = re.compile(r'\b((?:([a-z])|[A-Z가-힣])[a-zA-Z가-힣]+)\b')
+# 위 토큰 또는 문장 경계 문자 (세 번째 그룹)
+_TOKEN_OR_BOUNDARY = re.compile(_TOKEN.pattern + r'|([.!?;:\n])')
+
+# 이 개수 이상이면 clean_many / extract_keywords_many가 프로세스 풀을 사용
+PARALLEL_THRESHOLD = 2000
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _executor
+
+
+def _use_pool(count: int, processes: Optional[bool]) -> bool:
+    if processes is None:
+        return count >= PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1
+    return processes
+
+
+def parallel_map(fn: Callable, texts: Sequence[str], *args: Sequence, processes: Optional[bool] = None) -> list:
+    """
+    fn(text, *args)를 텍스트마다 적용합니다. 개수가 많으면 프로세스 풀에서 나누어 실행
+    (fn은 모듈 최상위 함수여야 함)
+    """
+    if _use_pool(len(texts), processes):
+        chunksize = max(1, len(texts) // ((os.cpu_count() or 1) * 4))
+        return list(_get_executor().map(fn, texts, *args, chunksize=chunksize))
+    return list(map(fn, texts, *args))
+
+
 class TextProcessor:
     @staticmethod
     def clean_text(text: str) -> str:
@@ -24,19 +64,51 @@ class TextProcessor:
         if not text:
             return ""
         
-        # 1. HTML 태그 제거 (간이)
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # 2. URL 제거
-        text = re.sub(r'http\S+|www\.\S+', '', text)
+        # 1. HTML 태그 제거 (간이) - 태그가 없으면 생략
+        if '<' in text:
+            text = _HTML_TAG.sub('', text)
         
-        # 3. 특수문자 제거 (일부 보존하고 싶은 문자는 제외 가능) 및 줄바꿈 정리
-        text = re.sub(r'[^a-zA-Z0-9가-힣\s.,!?\'"]', '', text)
+        # 2. URL 제거 - URL 후보가 없으면 생략
+        if 'http' in text or 'www.' in text:
+            text = _URL.sub('', text)
         
-        # 4. 다중 공백 및 줄바꿈을 공백 하나로 통일
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        # 3~4. 특수문자 제거 후 공백 정리와 양끝 제거를 split/join 한 번으로 처리
+        # (str.split()의 공백 판정은 정규식 \s와 동일)
+        return ' '.join(_DISALLOWED.sub('', text).split())
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """
+        불용어를 제외한 의미 있는 단어 목록 (소문자, 등장 순서 유지)
+        - 영어: 3글자 이상, ENGLISH_STOPWORDS 제외
+        - 한국어: KOREAN_STOPWORDS 제외
+        """
+        if not text:
+            return []
+        return [
+            word
+            for word, latin in _TOKEN.findall(text.lower())
+            if ((len(word) >= 3 and word not in ENGLISH_STOPWORDS) if latin else word not in KOREAN_STOPWORDS)
+        ]
+
+    @staticmethod
+    def tokenize_sentences(text: str) -> List[List[str]]:
+        """
+        tokenize와 같은 규칙의 단어 목록을 문장 경계(. ! ? ; : 줄바꿈)마다 나누어 반환
+        (빈 문장은 제외)
+        """
+        sentences: List[List[str]] = []
+        current: List[str] = []
+        for word, latin, boundary in _TOKEN_OR_BOUNDARY.findall(text.lower() if text else ""):
+            if boundary:
+                if current:
+                    sentences.append(current)
+                    current = []
+            elif (len(word) >= 3 and word not in ENGLISH_STOPWORDS) if latin else word not in KOREAN_STOPWORDS:
+                current.append(word)
+        if current:
+            sentences.append(current)
+        return sentences
 
     @staticmethod
     def extract_keywords(text: str, top_n: int = 5) -> List[str]:
@@ -45,21 +117,20 @@ class TextProcessor:
         """
         if not text:
             return []
-            
-        # 소문자 변환 및 토큰화
-        all_words = re.findall(r'\b[a-zA-Z가-힣]{2,}\b', text.lower())
-        
-        meaningful_words = []
-        for w in all_words:
-            # 영어인 경우 (알파벳 포함)
-            if re.match(r'[a-z]', w):
-                if len(w) < 3 or w in ENGLISH_STOPWORDS:
-                    continue
-            # 한국어인 경우
-            else:
-                if w in KOREAN_STOPWORDS:
-                    continue
-            meaningful_words.append(w)
-        
-        counter = Counter(meaningful_words)
+        counter = Counter(TextProcessor.tokenize(text))
         return [word for word, count in counter.most_common(top_n)]
+
+    @staticmethod
+    def clean_many(texts: Sequence[str], processes: Optional[bool] = None) -> List[str]:
+        """
+        여러 텍스트를 한 번에 정제합니다. (결과는 clean_text와 동일)
+        processes: True/False로 프로세스 풀 사용 강제, None이면 개수에 따라 자동 선택
+        """
+        return parallel_map(TextProcessor.clean_text, texts, processes=processes)
+
+    @staticmethod
+    def extract_keywords_many(texts: Sequence[str], top_n: int = 5, processes: Optional[bool] = None) -> List[List[str]]:
+        """
+        여러 텍스트의 키워드를 한 번에 추출합니다. (결과는 extract_keywords와 동일)
+        """
+        return parallel_map(TextProcessor.extract_keywords, texts, [top_n] * len(texts), processes=processes)
@@ -0,0 +1,40 @@
+"""
+분석 작업 전용 워커 프로세스
+
+API 서버와 분리하여 실행할 때 사용합니다. (API 서버는 JOB_WORKERS=0으로 설정)
+실행: (backend 디렉터리에서) python -m app.worker [--workers N]
+"""
+import argparse
+import asyncio
+import logging
+import signal
+
+from app.core.config import settings
+from app.core.logs import configure_logging
+from app.services.jobs import worker_pool
+from app.services.keyword_engine import keyword_engine
+
+logger = logging.getLogger(__name__)
+
+
+async def main(workers: int) -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await worker_pool.start(workers)
+    await keyword_engine.start()
+    logger.info("Analysis worker started with %s workers", workers)
+    await stop.wait()
+    await keyword_engine.stop()
+    await worker_pool.stop()
+    logger.info("Analysis worker stopped")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="News Insight Pro analysis worker")
+    parser.add_argument("--workers", type=int, default=max(1, settings.JOB_WORKERS))
+    args = parser.parse_args()
+    configure_logging()
+    asyncio.run(main(args.workers))
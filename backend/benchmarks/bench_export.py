@@ -0,0 +1,99 @@
+"""
+대량 내보내기(app.services.export) 벤치마크: 행 수별 처리량과 최대 메모리(tracemalloc)
+
+- 행 수를 늘려도 최대 메모리가 거의 같아야 합니다. (EXPORT_CHUNK_SIZE행 단위로 읽고 바로 전송)
+- 비교용으로 기존 방식(전체 행을 ORM 객체로 읽은 뒤 한 번에 직렬화)도 측정합니다.
+- 임시 SQLite 파일 DB에 기사 행을 직접 적재합니다. (키워드 색인/중복 묶음 생략)
+
+실행: (backend 디렉터리에서) python -m benchmarks.bench_export [--sizes 10000 100000] [--formats ndjson csv parquet]
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--formats", nargs="+", default=["ndjson", "csv", "parquet"])
+    parser.add_argument("--compression", default="none", choices=("none", "gzip", "zstd"))
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> None:
+    # 설정은 모듈 import 시점에 읽히므로 환경 변수 지정 후 import
+    from sqlalchemy import func, insert, select
+
+    from app.db.database import AsyncSessionLocal, Base, engine
+    from app.db.models import News
+    from app.schemas.news import NewsResponse
+    from app.services.export import export_news
+
+    formats = args.formats
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(f"{'rows':>8} {'format':>8} {'MB':>8} {'rows/s':>10} {'peak MB':>8}")
+    loaded = 0
+    for size in sorted(args.sizes):
+        async with engine.begin() as conn:
+            for start in range(loaded, size, 5000):
+                await conn.execute(insert(News), [
+                    {
+                        "title": f"Export benchmark article {i}",
+                        "url": f"https://bench.example.com/export/{i}",
+                        "content": "market earnings inflation " * 80,
+                        "summary": "- 요약 " * 20,
+                        "sentiment_label": "neutral",
+                        "sentiment_score": 0.1,
+                        "keywords": json.dumps(["market", "earnings"]),
+                    }
+                    for i in range(start, min(start + 5000, size))
+                ])
+        loaded = size
+        async with AsyncSessionLocal() as db:
+            assert await db.scalar(select(func.count(News.id))) == size
+
+        for fmt in formats:
+            tracemalloc.start()
+            started = time.perf_counter()
+            total = 0
+            async for data in export_news(fmt, compression=args.compression):
+                total += len(data)
+            elapsed = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{size:>8} {fmt:>8} {total / 1e6:>8.1f} {size / elapsed:>10.0f} {peak / 1e6:>8.1f}")
+
+        # 기존 방식: ORM 객체 전체 적재 후 직렬화
+        tracemalloc.start()
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            items = (await db.execute(select(News))).scalars().all()
+            body = json.dumps([NewsResponse.from_model(n).model_dump(mode="json") for n in items]).encode()
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{size:>8} {'orm-list':>8} {len(body) / 1e6:>8.1f} {size / elapsed:>10.0f} {peak / 1e6:>8.1f}")
+        del items, body
+
+    await engine.dispose()
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ.update(
+            DATABASE_URL=f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'bench_export.db')}",
+            DB_ECHO="false",
+            METRICS_ENABLED="false",
+        )
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+/news/search 저장 경로 벤치마크: 행 단위 SELECT + commit + refresh vs 일괄 upsert
+
+실행: (backend 디렉터리에서) python -m benchmarks.bench_ingest
+"""
+import asyncio
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.database import Base
+from app.db.models import News
+from app.schemas.news import NewsCreate
+from app.services.ingestion import bulk_upsert_news
+
+BATCH_SIZES = (10, 100, 1000)
+ROUNDS = 3
+
+
+def make_batch(size: int, tag: str) -> list[NewsCreate]:
+    return [
+        NewsCreate(
+            title=f"Benchmark article {tag}-{i}",
+            url=f"https://bench.example.com/{tag}/{i}",
+            content="Lorem ipsum dolor sit amet " * 8,
+            published_at=datetime.now(timezone.utc),
+        )
+        for i in range(size)
+    ]
+
+
+async def legacy_save(db: AsyncSession, news_list: list[NewsCreate]) -> list[News]:
+    """기존 search_and_save_news의 행 단위 저장 루프"""
+    saved = []
+    for news_data in news_list:
+        result = await db.execute(select(News).where(News.url == news_data.url))
+        existing = result.scalars().first()
+        if not existing:
+            new_news = News(
+                title=news_data.title,
+                url=news_data.url,
+                content=news_data.content,
+                image_url=news_data.image_url,
+                published_at=news_data.published_at,
+                keywords=json.dumps(news_data.keywords) if news_data.keywords else None,
+            )
+            db.add(new_news)
+            await db.commit()
+            await db.refresh(new_news)
+            saved.append(new_news)
+        else:
+            saved.append(existing)
+    return saved
+
+
+async def run() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        Session = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        print(f"{'batch':>6} {'legacy(ms)':>12} {'bulk(ms)':>10} {'speedup':>8}")
+        for size in BATCH_SIZES:
+            timings = {"legacy": [], "bulk": []}
+            for r in range(ROUNDS):
+                for name, fn in (("legacy", legacy_save), ("bulk", bulk_upsert_news)):
+                    # 절반은 기존 데이터와 겹치도록 구성 (실제 반복 검색 패턴)
+                    batch = make_batch(size, f"{name}-{size}-{r}")
+                    async with Session() as db:
+                        await bulk_upsert_news(db, batch[: size // 2])
+                    async with Session() as db:
+                        start = time.perf_counter()
+                        await fn(db, batch)
+                        timings[name].append((time.perf_counter() - start) * 1000)
+            legacy = min(timings["legacy"])
+            bulk = min(timings["bulk"])
+            print(f"{size:>6} {legacy:>12.1f} {bulk:>10.1f} {legacy / bulk:>7.1f}x")
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
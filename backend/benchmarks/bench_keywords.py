@@ -0,0 +1,50 @@
+"""
+키워드 엔진 벤치마크: DF 구축 / 증분 갱신 / 일괄 재채점(NumPy) vs 문서별 채점
+
+실행: (backend 디렉터리에서) python -m benchmarks.bench_keywords [문서 수]
+"""
+import random
+import sys
+import time
+
+from app.services.keyword_engine import KeywordEngine, count_document_frequencies
+from benchmarks.bench_text import make_article
+
+DEFAULT_DOCS = 100_000
+CHUNK_SIZE = 5000  # rescore_all과 같은 묶음 크기
+SINGLE_SAMPLE = 2000
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def run(doc_count: int) -> None:
+    rng = random.Random(3)
+    # NewsAPI 본문은 잘린 일부(수백 자)이므로 짧은 기사 위주로 생성
+    docs = [make_article(rng, rng.randint(20, 120)) for _ in range(doc_count)]
+
+    engine = KeywordEngine()
+    _, build = timed(lambda: engine.observe(docs))
+    print(f"DF build ({doc_count} docs): {build:.2f}s, {len(engine._df)} terms")
+
+    new_docs = [make_article(rng, 80) for _ in range(100)]
+    _, incremental = timed(lambda: count_document_frequencies(new_docs))
+    print(f"DF increment (100 new docs): {incremental * 1000:.1f}ms")
+
+    def batch():
+        for i in range(0, len(docs), CHUNK_SIZE):
+            engine.score_many(docs[i:i + CHUNK_SIZE])
+
+    _, batch_time = timed(batch)
+    sample = docs[:SINGLE_SAMPLE]
+    _, single_time = timed(lambda: [engine.score_many([d]) for d in sample])
+    single_estimate = single_time * len(docs) / len(sample)
+    print(f"rescore batch: {batch_time:.2f}s, per-doc (est.): {single_estimate:.2f}s, "
+          f"speedup {single_estimate / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DOCS)
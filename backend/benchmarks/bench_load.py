@@ -0,0 +1,277 @@
+"""
+부하 테스트: 가짜 NewsAPI/OpenAI 서버(benchmarks.fake_servers)에 연결한 앱을 시나리오별 동시 클라이언트로 호출
+
+- USE_MOCK_DATA=False로 실행하므로 크롤러/분석기의 실제 HTTP 경로(커넥션 풀, 재시도, 묶음 분석, 스트리밍)를 거칩니다.
+- 시나리오마다 --warmup 후 --seconds 동안 측정하여 처리량(req/s)과 p50/p95/p99 지연을 출력합니다.
+    crawl     POST /news/search            가짜 NewsAPI 수집 -> 중복 제거 -> 저장
+    list      GET  /news                   cursor 페이지네이션 (클라이언트별로 다음 페이지를 따라감)
+    search    GET  /news/search            저장된 뉴스 전문 검색
+    analysis  POST /news/analysis/{id}     가짜 OpenAI 분석 -> 저장
+    stream    GET  /news/analysis/{id}/stream  SSE 스트리밍 분석 (done 이벤트까지)
+- 결과는 JSON(커밋, 설정, 시나리오별 지표, 가짜 서버 호출 수)으로 저장하며 --compare로 이전 결과와 비교합니다.
+- 임시 SQLite DB를 사용하며 앱 설정은 --env KEY=VALUE로 바꿀 수 있습니다. (예: --env ANALYSIS_PACK_SIZE=8)
+
+실행: (backend 디렉터리에서)
+  python -m benchmarks.bench_load
+  python -m benchmarks.bench_load --scenarios crawl analysis --llm-latency-ms 800 --error-rate 0.02
+  python -m benchmarks.bench_load --output base.json          # 변경 전 커밋
+  python -m benchmarks.bench_load --compare base.json         # 변경 후 커밋에서 비교
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.bench_db_load import SEARCH_TERMS, percentile
+from benchmarks.fake_servers import FakeServer, FakeServerOptions, fake_newsapi_app, fake_openai_app
+
+SCENARIOS = ("crawl", "list", "search", "analysis", "stream")
+CRAWL_TERMS = ("semiconductor", "inflation", "earnings", "battery", "shipping", "bank", "oil", "retail")
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# 가짜 서버 연결 및 측정 대상 외 기능 비활성화 (--env로 덮어쓰기 가능)
+APP_ENV = {
+    "USE_MOCK_DATA": "false",
+    "NEWS_API_KEY": "bench",
+    "OPENAI_API_KEY": "bench",
+    "NEWS_API_RATE_PER_SECOND": "0", # 로컬 서버이므로 속도 제한 없음
+    "HTTP_BACKOFF_BASE_SECONDS": "0.05",
+    "ANALYSIS_CACHE_ENABLED": "false", # 같은 기사를 다시 분석해도 매번 LLM 호출
+    "JOB_WORKERS": "0",
+    "SCHEDULER_ENABLED": "false",
+    "DB_ECHO": "false",
+    "LOG_LEVEL": "ERROR",
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10.0, help="시나리오별 측정 시간")
+    parser.add_argument("--warmup", type=float, default=1.0, help="측정 전 예열 시간 (결과에서 제외)")
+    parser.add_argument("--articles", type=int, default=2000, help="시작 전 적재할 기사 수")
+    parser.add_argument("--pages", type=int, default=2, help="crawl 시나리오의 키워드당 페이지 수")
+    parser.add_argument("--newsapi-latency-ms", type=float, default=50.0)
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0, help="LLM 응답(스트리밍은 첫 조각)까지 지연")
+    parser.add_argument("--token-delay-ms", type=float, default=5.0, help="LLM 스트리밍 조각 사이 지연")
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="가짜 서버 오류 응답 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--content-words", type=int, default=200, help="가짜 기사 본문 단어 수")
+    parser.add_argument("--summary-chars", type=int, default=300, help="가짜 LLM 요약 길이")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="앱 설정 덮어쓰기 (반복 가능)")
+    parser.add_argument("--output", type=Path, help=f"결과 JSON 경로 (기본: {RESULTS_DIR.name}/load_<commit>_<시각>.json)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    return parser.parse_args()
+
+
+def git_revision() -> dict:
+    def git(*cmd: str) -> str:
+        return subprocess.run(("git", *cmd), capture_output=True, text=True, check=True).stdout.strip()
+
+    try:
+        return {"commit": git("rev-parse", "--short", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": "unknown", "dirty": None}
+
+
+def summarize(samples: list, errors: int, seconds: float) -> dict:
+    ms = lambda value: round(value * 1000, 2)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "rps": round(len(samples) / seconds, 2),
+        "p50_ms": ms(percentile(samples, 0.5)),
+        "p95_ms": ms(percentile(samples, 0.95)),
+        "p99_ms": ms(percentile(samples, 0.99)),
+        "mean_ms": ms(sum(samples) / len(samples)) if samples else 0.0,
+        "max_ms": ms(max(samples, default=0.0)),
+    }
+
+
+def print_report(results: dict) -> None:
+    print(f"{'scenario':>9} {'count':>7} {'err':>5} {'req/s':>8} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'newsapi':>8} {'llm':>6}")
+    for name, r in results["scenarios"].items():
+        print(f"{name:>9} {r['requests']:>7} {r['errors']:>5} {r['rps']:>8.1f} {r['p50_ms']:>9.1f} "
+              f"{r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['upstream']['newsapi']:>8} {r['upstream']['llm']:>6}")
+
+
+def print_comparison(results: dict, baseline: dict) -> None:
+    """시나리오별 이전 결과 대비 변화율 (req/s는 높을수록, 지연은 낮을수록 좋음)"""
+    base_rev = baseline.get("meta", {}).get("git", {}).get("commit", "?")
+    print(f"\ncompared with {base_rev}:")
+    print(f"{'scenario':>9} {'req/s':>18} {'p50(ms)':>18} {'p95(ms)':>18} {'p99(ms)':>18}")
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        cells = []
+        for key in ("rps", "p50_ms", "p95_ms", "p99_ms"):
+            change = (current[key] - previous[key]) / previous[key] * 100 if previous[key] else 0.0
+            cells.append(f"{current[key]:>9.1f} ({change:+5.1f}%)")
+        print(f"{name:>9} " + " ".join(cells))
+
+
+async def run(args: argparse.Namespace, newsapi: FakeServer, openai: FakeServer) -> dict:
+    # 설정은 모듈 import 시점에 읽히므로 환경 변수 지정 후 import
+    import httpx
+    from httpx import ASGITransport, AsyncClient
+
+    from app.db.database import AsyncSessionLocal, engine
+    from app.main import app
+    from app.schemas.news import NewsCreate
+    from app.services.ingestion import bulk_upsert_news
+    from benchmarks.bench_text import make_article
+
+    rng = random.Random(args.seed)
+    results = {"scenarios": {}}
+
+    # lifespan: 마이그레이션, NewsAPI 커넥션 풀 (ASGITransport는 lifespan을 실행하지 않음)
+    async with app.router.lifespan_context(app):
+        started = time.perf_counter()
+        seeded_ids = []
+        for start in range(0, args.articles, 500):
+            batch = [
+                NewsCreate(
+                    title=make_article(rng, 12)[:200],
+                    url=f"https://bench.example.com/seed/{i}",
+                    content=make_article(rng, args.content_words),
+                )
+                for i in range(start, min(start + 500, args.articles))
+            ]
+            async with AsyncSessionLocal() as db:
+                seeded_ids.extend(n.id for n in await bulk_upsert_news(db, batch))
+        print(f"seeded {len(seeded_ids)} articles in {time.perf_counter() - started:.1f}s")
+        next_id = itertools.cycle(seeded_ids)
+
+        async def crawl(ac: AsyncClient, worker_rng: random.Random, state: dict) -> bool:
+            query = " ".join(worker_rng.sample(CRAWL_TERMS, 2))
+            response = await ac.post("/api/v1/news/search", params={"query": query, "pages": args.pages})
+            return response.status_code == 200
+
+        async def list_page(ac: AsyncClient, worker_rng: random.Random, state: dict) -> bool:
+            params = {"limit": 50, "fields": "id,title,summary,sentiment_label,published_at"}
+            if state.get("cursor"):
+                params["cursor"] = state["cursor"]
+            response = await ac.get("/api/v1/news", params=params)
+            state["cursor"] = response.headers.get("x-next-cursor")
+            return response.status_code == 200
+
+        async def search(ac: AsyncClient, worker_rng: random.Random, state: dict) -> bool:
+            response = await ac.get("/api/v1/news/search", params={"q": worker_rng.choice(SEARCH_TERMS), "limit": 20})
+            return response.status_code == 200
+
+        async def analysis(ac: AsyncClient, worker_rng: random.Random, state: dict) -> bool:
+            response = await ac.post(f"/api/v1/news/analysis/{next(next_id)}")
+            return response.status_code == 200
+
+        async def stream(ac: AsyncClient, worker_rng: random.Random, state: dict) -> bool:
+            response = await ac.get(f"/api/v1/news/analysis/{next(next_id)}/stream")
+            return response.status_code == 200 and "event: done" in response.text
+
+        operations = {"crawl": crawl, "list": list_page, "search": search, "analysis": analysis, "stream": stream}
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench", timeout=120) as ac:
+            for name in args.scenarios:
+                operation = operations[name]
+                samples, errors = [], 0
+                measure_from = time.perf_counter() + args.warmup
+                deadline = measure_from + args.seconds
+                upstream_before = None
+
+                async def client(worker: int) -> None:
+                    nonlocal errors, upstream_before
+                    worker_rng, state = random.Random(args.seed * 1000 + worker), {}
+                    while (request_start := time.perf_counter()) < deadline:
+                        if upstream_before is None and request_start >= measure_from:
+                            upstream_before = (newsapi.stats.requests, openai.stats.requests)
+                        try:
+                            ok = await operation(ac, worker_rng, state)
+                        except httpx.HTTPError:
+                            ok = False
+                        if request_start < measure_from:
+                            continue
+                        if ok:
+                            samples.append(time.perf_counter() - request_start)
+                        else:
+                            errors += 1
+
+                await asyncio.gather(*(client(worker) for worker in range(args.concurrency)))
+                newsapi_before, llm_before = upstream_before or (newsapi.stats.requests, openai.stats.requests)
+                results["scenarios"][name] = {
+                    **summarize(samples, errors, args.seconds),
+                    "upstream": {
+                        "newsapi": newsapi.stats.requests - newsapi_before,
+                        "llm": openai.stats.requests - llm_before,
+                    },
+                }
+    await engine.dispose()
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    newsapi_options = FakeServerOptions(
+        latency_ms=args.newsapi_latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        error_status=args.error_status, content_words=args.content_words, seed=args.seed,
+    )
+    openai_options = FakeServerOptions(
+        latency_ms=args.llm_latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        error_status=args.error_status, summary_chars=args.summary_chars, token_delay_ms=args.token_delay_ms,
+        seed=args.seed,
+    )
+    overrides = dict(item.split("=", 1) for item in args.env)
+
+    with tempfile.TemporaryDirectory() as tmpdir, \
+            FakeServer(fake_newsapi_app(newsapi_options)) as newsapi, \
+            FakeServer(fake_openai_app(openai_options)) as openai:
+        app_env = {
+            **APP_ENV,
+            "DATABASE_URL": f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'bench_load.db')}",
+            "NEWS_API_BASE_URL": f"{newsapi.url}/v2/everything",
+            "OPENAI_BASE_URL": f"{openai.url}/v1",
+            **overrides,
+        }
+        os.environ.update(app_env)
+        results = asyncio.run(run(args, newsapi, openai))
+
+    revision = git_revision()
+    results = {
+        "meta": {
+            "git": revision,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+            "app_env": {k: v for k, v in app_env.items() if k != "DATABASE_URL"},
+            "fake_servers": {"newsapi": vars(newsapi_options), "openai": vars(openai_options)},
+        },
+        **results,
+    }
+    print_report(results)
+
+    output = args.output
+    if output is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = RESULTS_DIR / f"load_{revision['commit']}_{stamp}.json"
+    output.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"saved: {output}")
+
+    if args.compare:
+        print_comparison(results, json.loads(args.compare.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
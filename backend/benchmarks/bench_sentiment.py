@@ -0,0 +1,95 @@
+"""
+로컬 감성 모델 벤치마크: DB에 저장된 LLM 감성 라벨 대비 정확도와 처리량
+
+- 정확도: 라벨 일치율, 라벨별 혼동 행렬, 점수 상관계수
+- prefilter: 임계값별 로컬 처리 비율(LLM 감성 생략)과 그 구간의 정확도
+- 처리량: 일괄(score_many) vs 기사별 호출 (DB 기사, 부족하면 합성 기사)
+
+실행: (backend 디렉터리에서) python -m benchmarks.bench_sentiment [최대 기사 수]
+"""
+import asyncio
+import random
+import sys
+import time
+
+import numpy as np
+from sqlalchemy import select
+
+from app.db.database import AsyncSessionLocal
+from app.db.models import News
+from app.services.sentiment import LexiconSentimentModel, get_sentiment_model
+from benchmarks.bench_text import make_article
+
+DEFAULT_LIMIT = 50_000
+THROUGHPUT_DOCS = 20_000
+SINGLE_SAMPLE = 2000
+PREFILTER_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+LABELS = ("positive", "neutral", "negative")
+
+
+async def load_labeled(limit: int) -> list:
+    """LLM이 분석한(요약이 있는) 기사의 (본문, 라벨, 점수)"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(News.title, News.content, News.sentiment_label, News.sentiment_score)
+            .where(News.summary.is_not(None), News.sentiment_label.in_(LABELS))
+            .order_by(News.id.desc())
+            .limit(limit)
+        )
+        return [(f"{title}\n{content or ''}", label, score) for title, content, label, score in result.all()]
+
+
+def report_accuracy(model: LexiconSentimentModel, rows: list) -> None:
+    texts = [text for text, _, _ in rows]
+    expected = np.array([label for _, label, _ in rows])
+    scores = model.score_many(texts)
+    predicted = np.array(model.labels(scores))
+    print(f"labeled articles: {len(rows)}, accuracy: {np.mean(predicted == expected):.3f}")
+
+    print("confusion (rows: LLM, cols: local)  " + " ".join(f"{label:>9}" for label in LABELS))
+    for label in LABELS:
+        counts = [int(np.sum((expected == label) & (predicted == other))) for other in LABELS]
+        print(f"{label:>34}  " + " ".join(f"{count:>9}" for count in counts))
+
+    llm_scores = np.array([score if score is not None else 0.0 for _, _, score in rows], dtype=np.float64)
+    if len(rows) > 1 and llm_scores.std() > 0 and scores.std() > 0:
+        print(f"score correlation (pearson): {np.corrcoef(scores, llm_scores)[0, 1]:.3f}")
+
+    for threshold in PREFILTER_THRESHOLDS:
+        local = np.abs(scores) >= threshold
+        covered = float(np.mean(local))
+        accuracy = float(np.mean(predicted[local] == expected[local])) if local.any() else float("nan")
+        print(f"prefilter |score| >= {threshold}: local {covered:.1%} of articles, accuracy {accuracy:.3f}")
+
+
+def report_throughput(model: LexiconSentimentModel, texts: list) -> None:
+    start = time.perf_counter()
+    model.score_many(texts)
+    batch = time.perf_counter() - start
+
+    sample = texts[:SINGLE_SAMPLE]
+    start = time.perf_counter()
+    for text in sample:
+        model.predict(text)
+    single = (time.perf_counter() - start) / len(sample)
+    print(f"throughput ({len(texts)} docs): batch {len(texts) / batch:,.0f} docs/s, "
+          f"per-doc {1 / single:,.0f} docs/s")
+
+
+async def main(limit: int) -> None:
+    model = get_sentiment_model()
+    rows = await load_labeled(limit)
+    if rows:
+        report_accuracy(model, rows)
+    else:
+        print("no LLM-labeled articles in DB, skipping accuracy")
+
+    texts = [text for text, _, _ in rows]
+    if len(texts) < THROUGHPUT_DOCS:
+        rng = random.Random(5)
+        texts += [make_article(rng, rng.randint(20, 120)) for _ in range(THROUGHPUT_DOCS - len(texts))]
+    report_throughput(model, texts)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_LIMIT))
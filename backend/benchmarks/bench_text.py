@@ -0,0 +1,90 @@
+"""
+TextProcessor 벤치마크: 기존 단계별 re.sub 구현 vs 사전 컴파일/단일 패스 구현, 단건 vs 일괄(프로세스 풀)
+
+실행: (backend 디렉터리에서) python -m benchmarks.bench_text
+"""
+import random
+import re
+import time
+from collections import Counter
+
+from app.utils.text import ENGLISH_STOPWORDS, KOREAN_STOPWORDS, TextProcessor
+
+DOC_COUNTS = (300, 3000)
+ROUNDS = 3
+
+EN = "the market rallied after strong earnings from chipmakers while investors weighed inflation data and central bank signals".split()
+KO = "반도체 시장이 회복세를 보이며 투자자들은 금리 인하 기대감 속에 기술주를 매수했다".split()
+PUNCT = ["—", "“", "”", "’", "…", "(", ")", "%", "$", ":", ";", "-", ",", ".", "!", "?", "&amp;", "#"]
+
+
+def make_article(rng: random.Random, words: int) -> str:
+    out = []
+    for _ in range(words):
+        r = rng.random()
+        if r < 0.03:
+            out.append("<p class='x'>")
+        elif r < 0.04:
+            out.append("https://example.com/a/b?c=1")
+        elif r < 0.1:
+            out.append(rng.choice(PUNCT))
+        elif r < 0.4:
+            out.append(rng.choice(KO))
+        else:
+            out.append(rng.choice(EN))
+        out.append(rng.choice([" ", " ", " ", "\n", "  ", "\t"]))
+    return "".join(out)
+
+
+def legacy_clean_text(text: str) -> str:
+    if not text:
+        return ""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'http\S+|www\.\S+', '', text)
+    text = re.sub(r'[^a-zA-Z0-9가-힣\s.,!?\'"]', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def legacy_extract_keywords(text: str, top_n: int = 5) -> list[str]:
+    if not text:
+        return []
+    words = []
+    for w in re.findall(r'\b[a-zA-Z가-힣]{2,}\b', text.lower()):
+        if re.match(r'[a-z]', w):
+            if len(w) < 3 or w in ENGLISH_STOPWORDS:
+                continue
+        elif w in KOREAN_STOPWORDS:
+            continue
+        words.append(w)
+    return [word for word, count in Counter(words).most_common(top_n)]
+
+
+def best_ms(fn, docs) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn(docs)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def run() -> None:
+    rng = random.Random(1)
+    variants = (
+        ("legacy", lambda docs: [legacy_extract_keywords(legacy_clean_text(d)) for d in docs]),
+        ("single", lambda docs: [TextProcessor.extract_keywords(TextProcessor.clean_text(d)) for d in docs]),
+        ("batch", lambda docs: TextProcessor.extract_keywords_many(TextProcessor.clean_many(docs, processes=False), processes=False)),
+        ("batch+pool", lambda docs: TextProcessor.extract_keywords_many(TextProcessor.clean_many(docs, processes=True), processes=True)),
+    )
+    # 프로세스 풀 기동 비용은 측정에서 제외
+    TextProcessor.clean_many(["warm up"] * 8, processes=True)
+
+    print(f"{'docs':>6} " + " ".join(f"{name + '(ms)':>15}" for name, _ in variants))
+    for count in DOC_COUNTS:
+        docs = [make_article(rng, rng.randint(40, 800)) for _ in range(count)]
+        print(f"{count:>6} " + " ".join(f"{best_ms(fn, docs):>15.1f}" for _, fn in variants))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,284 @@
+"""
+부하 테스트용 로컬 가짜 서버: NewsAPI(GET /v2/everything)와 OpenAI 호환 API(POST /v1/chat/completions)
+
+- 응답 지연(평균 ± 편차), 오류 응답 비율(500/429), 응답 크기(기사 본문 단어 수, 요약 길이)를 지정할 수 있습니다.
+- 응답 내용은 검색어/기사 인덱스/seed로 결정되므로 같은 설정이면 같은 데이터를 돌려줍니다.
+- 별도 스레드의 이벤트 루프(uvicorn)에서 실행되어 같은 프로세스의 앱/부하 클라이언트와 루프를 공유하지 않습니다.
+- 앱은 NEWS_API_BASE_URL, OPENAI_BASE_URL 설정으로 이 서버를 가리키게 합니다.
+
+단독 실행 (실제 uvicorn 앱을 가짜 서버에 연결할 때): (backend 디렉터리에서)
+  python -m benchmarks.fake_servers --latency-ms 100 --llm-latency-ms 500
+"""
+import argparse
+import asyncio
+import json
+import random
+import socket
+import threading
+import time
+import uuid
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from benchmarks.bench_text import make_article
+
+SENTIMENTS = (("positive", 0.7), ("negative", -0.6), ("neutral", 0.05))
+# 가짜 기사 발행 시각 간격 (인덱스가 클수록 오래된 기사)
+PUBLISH_INTERVAL = timedelta(minutes=5)
+
+
+@dataclass
+class FakeServerOptions:
+    latency_ms: float = 0.0 # 응답(스트리밍은 첫 조각) 전 평균 지연
+    jitter_ms: float = 0.0 # 지연 편차 (균등 분포 ±jitter)
+    error_rate: float = 0.0 # 오류 응답 비율 (0~1)
+    error_status: int = 500 # 오류 응답 코드 (429이면 Retry-After: 0 포함)
+    total_results: int = 100 # NewsAPI: 검색어당 전체 기사 수
+    content_words: int = 200 # NewsAPI: 기사 본문 단어 수
+    summary_chars: int = 300 # OpenAI: 요약 길이
+    stream_chunks: int = 20 # OpenAI: 스트리밍 응답 조각 수
+    token_delay_ms: float = 0.0 # OpenAI: 스트리밍 조각 사이 지연
+    seed: int = 0
+
+
+@dataclass
+class FakeServerStats:
+    requests: int = 0
+    errors: int = 0 # 주입한 오류 응답 수
+
+
+class _Behavior:
+    """지연/오류 주입 (요청 처리 스레드의 루프 하나에서만 사용)"""
+
+    def __init__(self, options: FakeServerOptions):
+        self.options = options
+        self.stats = FakeServerStats()
+        self._rng = random.Random(options.seed)
+
+    async def delay(self) -> None:
+        options = self.options
+        delay_ms = options.latency_ms + self._rng.uniform(-options.jitter_ms, options.jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+    def should_fail(self) -> bool:
+        self.stats.requests += 1
+        if self._rng.random() < self.options.error_rate:
+            self.stats.errors += 1
+            return True
+        return False
+
+    def error_response(self, body: dict) -> JSONResponse:
+        status = self.options.error_status
+        headers = {"Retry-After": "0"} if status == 429 else None
+        return JSONResponse(body, status_code=status, headers=headers)
+
+
+def fake_newsapi_app(options: Optional[FakeServerOptions] = None) -> FastAPI:
+    """NewsAPI /v2/everything 응답 형식 (최신순, page/pageSize/from 지원)"""
+    options = options or FakeServerOptions()
+    behavior = _Behavior(options)
+    newest = datetime.now(timezone.utc).replace(microsecond=0)
+    app = FastAPI(openapi_url=None)
+    app.state.stats = behavior.stats
+
+    def article(query: str, index: int) -> dict:
+        rng = random.Random(f"{options.seed}:{query}:{index}")
+        slug = "-".join(query.lower().split()) or "all"
+        content = make_article(rng, options.content_words)
+        return {
+            "source": {"id": None, "name": "Fake News"},
+            "author": "bench",
+            "title": f"{query} {make_article(rng, 10)}",
+            "description": content[:200],
+            "url": f"https://fake-news.local/{slug}/{index}",
+            "urlToImage": None,
+            "publishedAt": (newest - PUBLISH_INTERVAL * index).isoformat().replace("+00:00", "Z"),
+            "content": content,
+        }
+
+    @app.get("/v2/everything")
+    async def everything(request: Request):
+        params = request.query_params
+        await behavior.delay()
+        if behavior.should_fail():
+            return behavior.error_response({"status": "error", "code": "unexpectedError", "message": "injected"})
+        if not params.get("apiKey"):
+            return JSONResponse({"status": "error", "code": "apiKeyMissing"}, status_code=401)
+
+        query = params.get("q", "")
+        page = max(1, int(params.get("page", 1)))
+        page_size = max(1, min(100, int(params.get("pageSize", 100))))
+        total = options.total_results
+        if params.get("from"):
+            since = datetime.fromisoformat(params["from"].replace("Z", "+00:00"))
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            total = min(total, max(0, int((newest - since) / PUBLISH_INTERVAL) + 1))
+        start = (page - 1) * page_size
+        articles = [article(query, i) for i in range(start, min(total, start + page_size))]
+        return {"status": "ok", "totalResults": total, "articles": articles}
+
+    return app
+
+
+def _analysis(text: str, options: FakeServerOptions) -> dict:
+    """입력 텍스트로 결정되는 요약/감성"""
+    label, score = SENTIMENTS[zlib.crc32(text.encode("utf-8")) % len(SENTIMENTS)]
+    summary = ("- 가짜 요약 문장입니다. " * (options.summary_chars // 14 + 1))[:options.summary_chars]
+    return {"summary": summary, "sentiment_label": label, "sentiment_score": score}
+
+
+def _completion_content(messages: list, options: FakeServerOptions) -> str:
+    """단건 프롬프트는 분석 객체, 묶음 프롬프트(기사 JSON 배열)는 {"results": [...]}"""
+    user = messages[-1].get("content", "") if messages else ""
+    try:
+        articles = json.loads(user)
+    except json.JSONDecodeError:
+        articles = None
+    if isinstance(articles, list) and all(isinstance(a, dict) and "id" in a for a in articles):
+        results = [{"id": a["id"], **_analysis(f"{a.get('title')}\n{a.get('content')}", options)} for a in articles]
+        return json.dumps({"results": results}, ensure_ascii=False)
+    return json.dumps(_analysis(user, options), ensure_ascii=False)
+
+
+def fake_openai_app(options: Optional[FakeServerOptions] = None) -> FastAPI:
+    """OpenAI 호환 /v1/chat/completions (JSON 응답 및 stream=True SSE, usage 포함)"""
+    options = options or FakeServerOptions()
+    behavior = _Behavior(options)
+    app = FastAPI(openapi_url=None)
+    app.state.stats = behavior.stats
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        await behavior.delay()
+        if behavior.should_fail():
+            return behavior.error_response({"error": {"message": "injected", "type": "server_error"}})
+
+        messages = body.get("messages", [])
+        content = _completion_content(messages, options)
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4 + 1
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(content) // 4 + 1,
+            "total_tokens": prompt_tokens + len(content) // 4 + 1,
+        }
+        base = {"id": f"chatcmpl-{uuid.uuid4().hex}", "created": int(time.time()), "model": body.get("model", "fake")}
+
+        if not body.get("stream"):
+            return {
+                **base,
+                "object": "chat.completion",
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": usage,
+            }
+
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+        size = max(1, -(-len(content) // max(1, options.stream_chunks)))
+
+        def chunk(delta: dict, finish_reason: Optional[str] = None) -> str:
+            choice = {"index": 0, "delta": delta, "finish_reason": finish_reason}
+            return f"data: {json.dumps({**base, 'object': 'chat.completion.chunk', 'choices': [choice]}, ensure_ascii=False)}\n\n"
+
+        async def events():
+            yield chunk({"role": "assistant", "content": ""})
+            for i in range(0, len(content), size):
+                if i and options.token_delay_ms > 0:
+                    await asyncio.sleep(options.token_delay_ms / 1000)
+                yield chunk({"content": content[i:i + size]})
+            yield chunk({}, "stop")
+            if include_usage:
+                yield f"data: {json.dumps({**base, 'object': 'chat.completion.chunk', 'choices': [], 'usage': usage})}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+class FakeServer:
+    """
+    ASGI 앱을 별도 스레드의 uvicorn으로 실행합니다. (임의의 빈 포트, with 문으로 시작/종료)
+    url: http://127.0.0.1:<port>, stats: 앱의 FakeServerStats
+    """
+
+    def __init__(self, app: FastAPI, host: str = "127.0.0.1", port: int = 0):
+        self.app = app
+        self.host = host
+        self.port = port
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def stats(self) -> FakeServerStats:
+        return self.app.state.stats
+
+    def start(self, timeout: float = 10.0) -> "FakeServer":
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        self.port = sock.getsockname()[1]
+        config = uvicorn.Config(self.app, log_level="warning", access_log=False, lifespan="off", backlog=4096)
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, kwargs={"sockets": [sock]}, daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError(f"Fake server failed to start on {self.url}")
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+            self._thread.join(timeout=10)
+            self._server = None
+
+    def __enter__(self) -> "FakeServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--newsapi-port", type=int, default=8901)
+    parser.add_argument("--openai-port", type=int, default=8902)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="NewsAPI 응답 지연")
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0, help="OpenAI 응답(첫 조각) 지연")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    newsapi = FakeServer(fake_newsapi_app(FakeServerOptions(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+    )), port=args.newsapi_port)
+    openai = FakeServer(fake_openai_app(FakeServerOptions(
+        latency_ms=args.llm_latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+    )), port=args.openai_port)
+    with newsapi, openai:
+        print(f"NEWS_API_BASE_URL={newsapi.url}/v2/everything")
+        print(f"OPENAI_BASE_URL={openai.url}/v1")
+        print("NEWS_API_KEY=bench OPENAI_API_KEY=bench USE_MOCK_DATA=False  (Ctrl+C로 종료)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
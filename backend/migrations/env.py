@@ -0,0 +1,53 @@
+"""
+Alembic 실행 환경
+
+- 앱 시작/CLI(app.db.migrations.upgrade_database)는 열려 있는 커넥션을 config.attributes["connection"]으로 넘깁니다.
+- `alembic` 명령으로 직접 실행하면 앱 엔진(DATABASE_URL, DB_PROFILE)으로 연결합니다.
+"""
+import asyncio
+
+from alembic import context
+
+from app.db import models  # noqa: F401 (autogenerate 비교 대상 모델 등록)
+from app.db.database import Base, database_url, engine
+from app.core.config import settings
+from app.db.fts import PG_COLUMN, PG_INDEX
+
+target_metadata = Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    # 전문 검색 인덱스(FTS5 가상 테이블과 내부 테이블, PostgreSQL tsvector 생성 컬럼과 GIN 인덱스)는 app.db.fts가 관리
+    if type_ == "table" and name.startswith("news_fts"):
+        return False
+    if type_ == "column" and name == PG_COLUMN:
+        return False
+    return name != PG_INDEX
+
+
+def run_with_connection(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        render_as_batch=connection.dialect.name == "sqlite",  # SQLite ALTER 제약 우회
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(run_with_connection)
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    # SQL 스크립트 출력 (alembic upgrade head --sql)
+    context.configure(url=database_url(settings.DATABASE_URL), target_metadata=target_metadata, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+elif context.config.attributes.get("connection") is not None:
+    run_with_connection(context.config.attributes["connection"])
+else:
+    asyncio.run(run_async())
@@ -0,0 +1,217 @@
+"""baseline schema
+
+마이그레이션 도입 전 create_all로 만들던 스키마 (전문 검색 인덱스 포함).
+기존 DB는 app.db.migrations.upgrade_database가 이 리비전으로 표시(stamp)한 뒤 이어서 업그레이드합니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 20:37:51.562331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 전문 검색 DDL (이 리비전 시점의 app.db.fts를 고정, 이후 app.db.fts 변경은 새 리비전으로 반영)
+# SQLite: news를 외부 콘텐츠로 쓰는 FTS5 가상 테이블과 동기화 트리거
+SQLITE_FTS_CREATE = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+        title, content, summary, keywords, content='news', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS news_fts_ai AFTER INSERT ON news BEGIN
+        INSERT INTO news_fts(rowid, title, content, summary, keywords)
+        VALUES (new.id, new.title, new.content, new.summary, new.keywords);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_fts_ad AFTER DELETE ON news BEGIN
+        INSERT INTO news_fts(news_fts, rowid, title, content, summary, keywords)
+        VALUES ('delete', old.id, old.title, old.content, old.summary, old.keywords);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS news_fts_au AFTER UPDATE OF title, content, summary, keywords ON news BEGIN
+        INSERT INTO news_fts(news_fts, rowid, title, content, summary, keywords)
+        VALUES ('delete', old.id, old.title, old.content, old.summary, old.keywords);
+        INSERT INTO news_fts(rowid, title, content, summary, keywords)
+        VALUES (new.id, new.title, new.content, new.summary, new.keywords);
+    END""",
+)
+SQLITE_FTS_DROP = (
+    "DROP TRIGGER IF EXISTS news_fts_ai",
+    "DROP TRIGGER IF EXISTS news_fts_ad",
+    "DROP TRIGGER IF EXISTS news_fts_au",
+    "DROP TABLE IF EXISTS news_fts",
+)
+# PostgreSQL: 가중치 tsvector 식 GIN 인덱스 (0004에서 생성 컬럼 인덱스로 교체)
+PG_FTS_CREATE = (
+    "CREATE INDEX IF NOT EXISTS ix_news_fts ON news USING gin (("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(keywords, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(summary, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'D')"
+    "))"
+)
+
+
+def _create_fts() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(PG_FTS_CREATE)
+    elif dialect == "sqlite":
+        for stmt in SQLITE_FTS_CREATE:
+            op.execute(stmt)
+
+
+def _drop_fts() -> None:
+    # PostgreSQL 인덱스는 news 테이블과 함께 삭제
+    if op.get_bind().dialect.name == "sqlite":
+        for stmt in SQLITE_FTS_DROP:
+            op.execute(stmt)
+
+
+def upgrade() -> None:
+    op.create_table('analysis_cache',
+    sa.Column('key', sa.String(length=64), nullable=False),
+    sa.Column('summary', sa.Text(), nullable=False),
+    sa.Column('sentiment_label', sa.String(), nullable=False),
+    sa.Column('sentiment_score', sa.Float(), nullable=True),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index('ix_analysis_cache_expires_at', 'analysis_cache', ['expires_at'], unique=False)
+    op.create_table('corpus_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('document_count', sa.Integer(), nullable=False),
+    sa.Column('total_length', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('keyword_hourly_rollups',
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('keyword', sa.String(), nullable=False),
+    sa.Column('article_count', sa.Integer(), nullable=False),
+    sa.Column('sentiment_sum', sa.Float(), nullable=False),
+    sa.Column('sentiment_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('bucket_start', 'keyword')
+    )
+    op.create_table('news',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('url', sa.String(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=True),
+    sa.Column('image_url', sa.String(), nullable=True),
+    sa.Column('summary', sa.Text(), nullable=True),
+    sa.Column('sentiment_label', sa.String(), nullable=True),
+    sa.Column('sentiment_score', sa.Float(), nullable=True),
+    sa.Column('keywords', sa.Text(), nullable=True),
+    sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('minhash', sa.LargeBinary(), nullable=True),
+    sa.Column('cluster_id', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_news_cluster_id', 'news', ['cluster_id'], unique=False)
+    op.create_index('ix_news_created_at_id', 'news', ['created_at', 'id'], unique=False)
+    op.create_index('ix_news_id', 'news', ['id'], unique=False)
+    op.create_index('ix_news_title', 'news', ['title'], unique=False)
+    op.create_index('ix_news_url', 'news', ['url'], unique=True)
+    _create_fts()
+    op.create_table('sentiment_rollups',
+    sa.Column('granularity', sa.String(), nullable=False),
+    sa.Column('keyword', sa.String(), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(), nullable=False),
+    sa.Column('label', sa.String(), nullable=False),
+    sa.Column('score_bin', sa.Integer(), nullable=False),
+    sa.Column('article_count', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('granularity', 'keyword', 'bucket_start', 'label', 'score_bin')
+    )
+    op.create_table('table_versions',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_table('term_document_frequencies',
+    sa.Column('term', sa.String(), nullable=False),
+    sa.Column('df', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('term')
+    )
+    op.create_table('watch_queries',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('query', sa.String(), nullable=False),
+    sa.Column('pages', sa.Integer(), nullable=False),
+    sa.Column('interval_seconds', sa.Integer(), nullable=False),
+    sa.Column('enabled', sa.Boolean(), nullable=False),
+    sa.Column('newest_published_at', sa.DateTime(), nullable=True),
+    sa.Column('next_run_at', sa.DateTime(), nullable=True),
+    sa.Column('last_run_at', sa.DateTime(), nullable=True),
+    sa.Column('last_latency_ms', sa.Float(), nullable=True),
+    sa.Column('last_article_count', sa.Integer(), nullable=True),
+    sa.Column('last_new_count', sa.Integer(), nullable=True),
+    sa.Column('consecutive_failures', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('query')
+    )
+    op.create_index('ix_watch_queries_next_run_at', 'watch_queries', ['next_run_at'], unique=False)
+    op.create_table('analysis_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('news_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('available_at', sa.DateTime(), nullable=False),
+    sa.Column('locked_by', sa.String(), nullable=True),
+    sa.Column('locked_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['news_id'], ['news.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_analysis_jobs_news_id', 'analysis_jobs', ['news_id'], unique=False)
+    op.create_index('ix_analysis_jobs_status', 'analysis_jobs', ['status'], unique=False)
+    op.create_table('news_keywords',
+    sa.Column('news_id', sa.Integer(), nullable=False),
+    sa.Column('keyword', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['news_id'], ['news.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('news_id', 'keyword')
+    )
+    op.create_index('ix_news_keywords_keyword', 'news_keywords', ['keyword'], unique=False)
+    op.create_table('news_minhash_bands',
+    sa.Column('band', sa.Integer(), nullable=False),
+    sa.Column('value', sa.BigInteger(), nullable=False),
+    sa.Column('news_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['news_id'], ['news.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('band', 'value', 'news_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('news_minhash_bands')
+    op.drop_index('ix_news_keywords_keyword', table_name='news_keywords')
+    op.drop_table('news_keywords')
+    op.drop_index('ix_analysis_jobs_status', table_name='analysis_jobs')
+    op.drop_index('ix_analysis_jobs_news_id', table_name='analysis_jobs')
+    op.drop_table('analysis_jobs')
+    op.drop_index('ix_watch_queries_next_run_at', table_name='watch_queries')
+    op.drop_table('watch_queries')
+    op.drop_table('term_document_frequencies')
+    op.drop_table('table_versions')
+    op.drop_table('sentiment_rollups')
+    _drop_fts()
+    op.drop_index('ix_news_url', table_name='news')
+    op.drop_index('ix_news_title', table_name='news')
+    op.drop_index('ix_news_id', table_name='news')
+    op.drop_index('ix_news_created_at_id', table_name='news')
+    op.drop_index('ix_news_cluster_id', table_name='news')
+    op.drop_table('news')
+    op.drop_table('keyword_hourly_rollups')
+    op.drop_table('corpus_stats')
+    op.drop_index('ix_analysis_cache_expires_at', table_name='analysis_cache')
+    op.drop_table('analysis_cache')
@@ -0,0 +1,44 @@
+"""query indexes
+
+조회 경로별 인덱스:
+- 감성 라벨 + 발행일 범위 필터 (sentiment_label, published_at)
+- 미분석 뉴스 최신순 조회: summary IS NULL 부분 인덱스 (created_at, id)
+- 분석 작업 큐의 다음 작업 선택 (status, available_at)
+- 기본 키와 중복되는 ix_news_id 제거
+
+기존 DB를 이 리비전 이후 모델로 보완했을 수 있으므로 IF (NOT) EXISTS로 생성/삭제합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 20:38:11.281352
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UNANALYZED = sa.text('summary IS NULL')
+
+
+def upgrade() -> None:
+    op.drop_index('ix_news_id', table_name='news', if_exists=True)
+    op.create_index('ix_news_sentiment_published_at', 'news', ['sentiment_label', 'published_at'], if_not_exists=True)
+    op.create_index(
+        'ix_news_unanalyzed', 'news', ['created_at', 'id'], if_not_exists=True,
+        sqlite_where=UNANALYZED, postgresql_where=UNANALYZED,
+    )
+    op.create_index('ix_analysis_jobs_status_available_at', 'analysis_jobs', ['status', 'available_at'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_analysis_jobs_status_available_at', table_name='analysis_jobs')
+    op.drop_index('ix_news_unanalyzed', table_name='news')
+    op.drop_index('ix_news_sentiment_published_at', table_name='news')
+    op.create_index('ix_news_id', 'news', ['id'])
@@ -0,0 +1,40 @@
+"""news bodies
+
+기사 원문 본문 저장 테이블 (app.services.body_fetcher, 압축 본문)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 23:12:40.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('news_bodies',
+    sa.Column('news_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('codec', sa.String(), nullable=True),
+    sa.Column('content', sa.LargeBinary(), nullable=True),
+    sa.Column('original_length', sa.Integer(), nullable=True),
+    sa.Column('http_status', sa.Integer(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=True),
+    sa.Column('fetched_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['news_id'], ['news.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('news_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('news_bodies')
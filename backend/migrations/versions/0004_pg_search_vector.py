@@ -0,0 +1,46 @@
+"""pg search vector
+
+PostgreSQL 전문 검색: tsvector 식 GIN 인덱스를 저장 생성 컬럼(news.search_vector)의 GIN 인덱스로 교체
+(app.db.fts, SQLite는 변경 없음)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 21:40:12.331870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 이 리비전 시점의 app.db.fts DDL을 고정 (0001의 식 인덱스와 같은 가중치 tsvector)
+PG_DOCUMENT = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(keywords, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(summary, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # 이전 식 인덱스 삭제 후 생성 컬럼(기존 행은 ADD COLUMN 시 계산)과 인덱스 생성
+    op.execute("DROP INDEX IF EXISTS ix_news_fts")
+    op.execute(
+        f"ALTER TABLE news ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ({PG_DOCUMENT}) STORED"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_news_fts ON news USING gin (search_vector)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_news_fts")
+    op.execute("ALTER TABLE news DROP COLUMN IF EXISTS search_vector")
+    op.execute(f"CREATE INDEX ix_news_fts ON news USING gin (({PG_DOCUMENT}))")
@@ -0,0 +1,31 @@
+"""
+공통 테스트 설정
+
+- 앱 모듈을 불러오기 전에 DATABASE_URL을 임시 디렉터리의 SQLite DB로 바꿉니다.
+  (개발용 ./news_insight.db를 건드리지 않음)
+- 스키마는 운영과 같은 경로(upgrade_database, Alembic 마이그레이션)로 한 번 생성합니다.
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+_DB_DIR = tempfile.mkdtemp(prefix="news-insight-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_DB_DIR, 'test.db')}"
+
+from app.db.database import engine  # noqa: E402
+from app.db.migrations import upgrade_database  # noqa: E402
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_DB_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def init_db():
+    assert engine.url.database.startswith(_DB_DIR), engine.url
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_database)
+    yield
+    await engine.dispose()
@@ -0,0 +1,62 @@
+import json
+from types import SimpleNamespace
+import pytest
+from app.services.analyzer import NewsAnalyzer
+from app.services.cache import AnalysisCache, analysis_cache
+
+class FakeCompletions:
+    """OpenAI chat.completions 대역: 호출 횟수만 기록"""
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        content = json.dumps({"summary": "요약", "sentiment_label": "negative", "sentiment_score": -0.4})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+def test_cache_key_normalizes_title():
+    a = AnalysisCache.make_key("  Big  News ", "body", "gpt", "v1")
+    assert a == AnalysisCache.make_key("big news", "body", "gpt", "v1")
+    assert a != AnalysisCache.make_key("big news", "body", "gpt", "v2")
+    assert a != AnalysisCache.make_key("big news", "body", "other-model", "v1")
+    # 앞 1500자 이후의 차이는 무시
+    assert AnalysisCache.make_key("t", "x" * 1500 + "a", "gpt", "v1") == AnalysisCache.make_key("t", "x" * 1500 + "b", "gpt", "v1")
+
+@pytest.mark.asyncio
+async def test_memory_tier_lru_and_ttl():
+    cache = AnalysisCache(max_size=2, ttl_seconds=60, persistent=False)
+    for key in ("a", "b"):
+        await cache.set(key, {"summary": key, "sentiment_label": "neutral", "sentiment_score": 0.0})
+    assert (await cache.get("a"))["summary"] == "a"  # a가 최근 사용됨
+    await cache.set("c", {"summary": "c", "sentiment_label": "neutral", "sentiment_score": 0.0})
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    assert cache.stats()["memory_hits"] == 2 and cache.stats()["misses"] == 1
+
+    expired = AnalysisCache(max_size=2, ttl_seconds=-1, persistent=False)
+    await expired.set("a", {"summary": "a", "sentiment_label": "neutral", "sentiment_score": 0.0})
+    assert await expired.get("a") is None
+
+@pytest.mark.asyncio
+async def test_persistent_tier_survives_memory_reset():
+    cache = AnalysisCache(max_size=10, ttl_seconds=60)
+    value = {"summary": "s", "sentiment_label": "positive", "sentiment_score": 0.5}
+    await cache.set("persisted", value)
+    cache.clear()
+    assert await cache.get("persisted") == value
+    assert cache.stats()["persistent_hits"] == 1
+
+@pytest.mark.asyncio
+async def test_analyzer_reuses_cached_result():
+    analysis_cache.clear()
+    completions = FakeCompletions()
+    analyzer = NewsAnalyzer()
+    analyzer.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    first = await analyzer.analyze_content("Wire story", "Markets fell sharply today.")
+    # 다른 URL로 들어온 동일 기사 (제목 공백/대소문자만 다름)
+    second = await analyzer.analyze_content("wire  STORY", "Markets fell sharply today.")
+
+    assert completions.calls == 1
+    assert first.summary == second.summary == "요약"
+    assert second.sentiment_label == "negative"
@@ -1,15 +1,6 @@
 import pytest
 from httpx import AsyncClient, ASGITransport
 from app.main import app
-from app.db.database import engine, Base
-
-@pytest.fixture(scope="session", autouse=True)
-async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
 
 # event_loop fixture 제거 (pytest-asyncio가 자동 관리)
 
@@ -46,3 +37,14 @@ async def test_get_news_list():
     
     assert response.status_code == 200
     assert isinstance(response.json(), list)
+
+@pytest.mark.asyncio
+async def test_cors_exposes_pagination_headers():
+    # 프론트엔드(다른 origin)에서 X-Next-Cursor를 읽을 수 있어야 다음 페이지를 요청할 수 있음
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/api/v1/news", params={"limit": 1}, headers={"Origin": "http://localhost:5173"})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+    exposed = {h.strip().lower() for h in response.headers["access-control-expose-headers"].split(",")}
+    assert {"x-next-cursor", "etag", "x-request-id"} <= exposed
@@ -0,0 +1,38 @@
+import json
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+
+@pytest.mark.asyncio
+async def test_batch_analysis_streams_ndjson():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        search_response = await ac.post("/api/v1/news/search", params={"query": "Batch"})
+        assert search_response.status_code == 200
+        ids = [n["id"] for n in search_response.json()]
+
+        response = await ac.post("/api/v1/news/analysis", json={"ids": ids + [999999]})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        items = [json.loads(line) for line in response.text.splitlines() if line]
+        by_id = {item["news_id"]: item for item in items}
+        assert set(by_id) == set(ids) | {999999}
+        assert by_id[999999]["status"] == "not_found"
+        for news_id in ids:
+            assert by_id[news_id]["status"] == "ok"
+            assert by_id[news_id]["news"]["summary"] is not None
+
+        # 미분석 뉴스 전체 분석 후에는 남은 대상이 없어야 함
+        payload = {"all_unanalyzed": True, "limit": 1000}
+        response = await ac.post("/api/v1/news/analysis", json=payload)
+        assert response.status_code == 200
+        response = await ac.post("/api/v1/news/analysis", json=payload)
+        assert response.text == ""
+
+@pytest.mark.asyncio
+async def test_batch_analysis_requires_target():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.post("/api/v1/news/analysis", json={})
+    assert response.status_code == 400
@@ -0,0 +1,231 @@
+import asyncio
+import time
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, PlainTextResponse, RedirectResponse, Response
+from sqlalchemy import select
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.models import News, NewsBody
+from app.schemas.news import NewsAnalysisUpdate, NewsCreate
+from app.services import analysis
+from app.services.body_fetcher import BodyFetcher, compress_body, decompress_body, is_public_host, load_body
+from app.services.ingestion import bulk_upsert_news
+from app.utils.html_text import extract_main_text
+from benchmarks.fake_servers import FakeServer
+
+PARAGRAPH = "Chipmakers rallied on Tuesday after quarterly results beat analyst expectations by a wide margin."
+
+def _article_html(n: str) -> str:
+    return f"""<html><head><title>Story {n}</title><script>var ad = "<p>not text</p>";</script></head>
+<body><nav><a href="/">Home</a> <a href="/markets">Markets and economy section</a></nav>
+<article><h1>Story {n}</h1><p>{PARAGRAPH} (story {n})</p>
+<p>Second paragraph of story {n} with <a href="/x">a link</a> that is still part of the text.</p>
+<ul><li><a href="/related">Related: another story headline you might like</a></li></ul></article>
+<footer><p>Copyright 2026 Example Media, all rights reserved worldwide.</p></footer></body></html>"""
+
+class ArticleSite:
+    """robots.txt, 기사 HTML, 오류 응답을 제공하는 로컬 기사 사이트 (요청 시각/동시 요청 수 기록)"""
+
+    def __init__(self):
+        self.requests = []
+        self.article_starts = []
+        self.active = 0
+        self.max_active = 0
+        self.flaky_calls = 0
+        self.robots_hosts = []
+        self.url = ""
+        self.app = FastAPI()
+        app = self.app
+
+        @app.middleware("http")
+        async def record(request, call_next):
+            self.requests.append(request.url.path)
+            return await call_next(request)
+
+        @app.get("/robots.txt")
+        async def robots(request: Request):
+            self.robots_hosts.append(request.headers["host"])
+            return PlainTextResponse("User-agent: *\nDisallow: /private/\n")
+
+        @app.get("/articles/{n}")
+        async def article(n: str):
+            self.article_starts.append(time.monotonic())
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            await asyncio.sleep(0.05)
+            self.active -= 1
+            return HTMLResponse(_article_html(n))
+
+        @app.get("/private/{n}")
+        async def private(n: str):
+            return HTMLResponse(_article_html(n))
+
+        @app.get("/flaky")
+        async def flaky():
+            self.flaky_calls += 1
+            if self.flaky_calls == 1:
+                return Response(status_code=503)
+            return HTMLResponse(_article_html("flaky"))
+
+        @app.get("/moved/{n}")
+        async def moved(n: str):
+            return RedirectResponse(f"/articles/{n}", status_code=301)
+
+        @app.get("/to-private")
+        async def to_private():
+            return RedirectResponse("/private/2", status_code=302)
+
+        @app.get("/offsite")
+        async def offsite():
+            # 같은 서버지만 다른 호스트 이름 (robots.txt/호스트별 제한을 따로 적용해야 함)
+            return RedirectResponse(self.url.replace("127.0.0.1", "localhost") + "/articles/offsite", status_code=302)
+
+        @app.get("/loop")
+        async def loop():
+            return RedirectResponse("/loop", status_code=307)
+
+        @app.get("/image.png")
+        async def image():
+            return Response(b"\x89PNG", media_type="image/png")
+
+@pytest.fixture(autouse=True)
+def fetch_settings(monkeypatch):
+    monkeypatch.setattr(settings, "BODY_FETCH_PER_HOST", 2)
+    monkeypatch.setattr(settings, "BODY_FETCH_HOST_DELAY_SECONDS", 0.05)
+    monkeypatch.setattr(settings, "BODY_FETCH_RETRY_BACKOFF_SECONDS", 0.0)
+    # 로컬 기사 사이트(127.0.0.1) 요청 허용
+    monkeypatch.setattr(settings, "BODY_FETCH_ALLOW_PRIVATE_ADDRESSES", True)
+
+@pytest.fixture(scope="module")
+def site():
+    site = ArticleSite()
+    with FakeServer(site.app) as server:
+        site.url = server.url
+        yield site
+
+def test_extract_main_text_keeps_article_paragraphs():
+    text = extract_main_text(_article_html("1"))
+    paragraphs = text.split("\n\n")
+    assert paragraphs[0] == f"{PARAGRAPH} (story 1)"
+    assert paragraphs[1].startswith("Second paragraph of story 1 with a link")
+    # 내비게이션/스크립트/링크 목록/꼬리말 제외
+    assert len(paragraphs) == 2
+    # <article>가 없으면 문서 전체에서 충분히 긴 문단만
+    assert extract_main_text(f"<div><p>{PARAGRAPH}</p><p>Short.</p></div>") == PARAGRAPH
+
+def test_bodies_are_written_as_zstd_and_unknown_codecs_are_rejected():
+    data, codec, length = compress_body(PARAGRAPH)
+    assert codec == "zstd" and length == len(PARAGRAPH)
+    assert decompress_body(data, codec) == PARAGRAPH
+    with pytest.raises(ValueError):
+        decompress_body(data, "zlib")
+
+@pytest.mark.asyncio
+async def test_fetches_bodies_politely_and_resumes(site):
+    urls = [f"{site.url}/articles/{i}" for i in range(5)] + [
+        f"{site.url}/private/1", f"{site.url}/missing", f"{site.url}/flaky", f"{site.url}/image.png",
+    ]
+    async with AsyncSessionLocal() as db:
+        saved = await bulk_upsert_news(db, [
+            NewsCreate(title=f"Body {i}", url=url, content="Truncated NewsAPI snippet… [+2000 chars]")
+            for i, url in enumerate(urls)
+        ])
+    ids = {n.url: n.id for n in saved}
+    fetcher = BodyFetcher()
+
+    counts = await fetcher.run_pending(news_ids=list(ids.values()))
+    assert counts == {"fetched": 5, "blocked": 1, "skipped": 2, "failed": 1}
+    # robots.txt는 호스트당 한 번, 금지된 경로는 요청하지 않음
+    assert site.requests.count("/robots.txt") == 1
+    assert "/private/1" not in site.requests
+    # 호스트별 동시 요청 수와 요청 간격
+    assert site.max_active <= settings.BODY_FETCH_PER_HOST
+    starts = sorted(site.article_starts)
+    assert all(b - a >= 0.04 for a, b in zip(starts, starts[1:]))
+
+    async with AsyncSessionLocal() as db:
+        rows = {r.news_id: r for r in (await db.execute(select(NewsBody).where(NewsBody.news_id.in_(ids.values())))).scalars()}
+        body = await load_body(db, ids[f"{site.url}/articles/3"])
+        news = await db.get(News, ids[f"{site.url}/articles/3"])
+    assert body.startswith(f"{PARAGRAPH} (story 3)")
+    assert news.content.startswith("Truncated") # news 행은 그대로
+    stored = rows[ids[f"{site.url}/articles/3"]]
+    assert stored.codec == "zstd" and stored.original_length == len(body.encode())
+    assert rows[ids[f"{site.url}/missing"]].http_status == 404
+    assert rows[ids[f"{site.url}/flaky"]].status == "failed"
+    assert rows[ids[f"{site.url}/flaky"]].next_attempt_at is not None
+
+    # 다시 실행하면 일시적으로 실패한 기사만 재시도하고, 그 뒤로는 요청하지 않음
+    assert await fetcher.run_pending(news_ids=list(ids.values())) == {"fetched": 1}
+    requests = len(site.requests)
+    assert await fetcher.run_pending(news_ids=list(ids.values())) == {}
+    assert len(site.requests) == requests
+    async with AsyncSessionLocal() as db:
+        flaky = await db.get(NewsBody, ids[f"{site.url}/flaky"])
+        assert (flaky.status, flaky.attempts, flaky.next_attempt_at) == ("fetched", 2, None)
+    await fetcher.shutdown()
+
+@pytest.mark.asyncio
+async def test_redirects_are_checked_again_on_every_hop(site):
+    fetcher = BodyFetcher()
+    result = await fetcher.fetch(f"{site.url}/moved/7")
+    assert (result.status, result.http_status) == ("fetched", 200)
+    assert result.text.startswith(f"{PARAGRAPH} (story 7)")
+
+    # 리디렉션 대상이 robots.txt 금지 경로이면 요청하지 않음
+    result = await fetcher.fetch(f"{site.url}/to-private")
+    assert result.status == "blocked"
+    assert "/private/2" not in site.requests
+
+    # 다른 호스트로 리디렉션되면 그 호스트의 robots.txt를 따로 확인
+    robots_before = len(site.robots_hosts)
+    result = await fetcher.fetch(f"{site.url}/offsite")
+    assert result.status == "fetched"
+    assert site.robots_hosts[robots_before:] == [site.url.replace("http://127.0.0.1", "localhost")]
+    assert fetcher._hosts.keys() == {site.url[len("http://"):], site.url[len("http://"):].replace("127.0.0.1", "localhost")}
+
+    result = await fetcher.fetch(f"{site.url}/loop")
+    assert (result.status, result.error) == ("skipped", "too many redirects")
+    assert site.requests.count("/loop") == settings.BODY_FETCH_MAX_REDIRECTS + 1
+    await fetcher.shutdown()
+
+@pytest.mark.asyncio
+async def test_rejects_non_public_addresses(site, monkeypatch):
+    for host in ("127.0.0.1", "10.0.0.8", "192.168.1.1", "169.254.169.254", "::1", "fd00::1", "localhost"):
+        assert not await is_public_host(host, 80), host
+    assert await is_public_host("93.184.216.34", 80)
+
+    monkeypatch.setattr(settings, "BODY_FETCH_ALLOW_PRIVATE_ADDRESSES", False)
+    fetcher = BodyFetcher()
+    requests = len(site.requests)
+    result = await fetcher.fetch(f"{site.url}/articles/internal")
+    assert (result.status, result.error) == ("skipped", "non-public address: 127.0.0.1")
+    assert len(site.requests) == requests
+    await fetcher.shutdown()
+
+@pytest.mark.asyncio
+async def test_analysis_uses_fetched_body(site, monkeypatch):
+    async with AsyncSessionLocal() as db:
+        [news] = await bulk_upsert_news(db, [
+            NewsCreate(title="Body analysis", url=f"{site.url}/articles/analysis", content="short snippet")
+        ])
+    fetcher = BodyFetcher()
+    assert await fetcher.run_pending(news_ids=[news.id]) == {"fetched": 1}
+    await fetcher.shutdown()
+    seen, seen_keywords = [], []
+
+    async def fake_analysis(title, content, keywords=None, raise_on_error=False):
+        seen.append(content)
+        seen_keywords.append(keywords)
+        return NewsAnalysisUpdate(summary="full body summary", sentiment_label="positive", sentiment_score=0.4, keywords=keywords or [])
+
+    monkeypatch.setattr(settings, "USE_MOCK_DATA", False)
+    monkeypatch.setattr(analysis.analyzer, "analyze_content", fake_analysis)
+    async with AsyncSessionLocal() as db:
+        item = await db.get(News, news.id)
+        await analysis.analyze_news(db, item)
+    assert seen == [f"{PARAGRAPH} (story analysis)\n\nSecond paragraph of story analysis with a link that is still part of the text."]
+    # 키워드도 잘린 content가 아닌 본문에서 추출
+    assert "snippet" not in seen_keywords[0]
+    assert "chipmakers" in seen_keywords[0]
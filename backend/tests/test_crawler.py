@@ -0,0 +1,148 @@
+import time
+import httpx
+import pytest
+from app.core.config import settings
+from app.services.crawler import NewsCrawler
+from app.utils.ratelimit import TokenBucket
+
+ARTICLE = {
+    "title": "Pooled <b>client</b> article",
+    "url": "https://example.com/pooled/1",
+    "content": "Body text",
+    "urlToImage": None,
+    "publishedAt": "2026-01-02T03:04:05Z",
+}
+
+@pytest.fixture(autouse=True)
+def api_settings(monkeypatch):
+    monkeypatch.setattr(settings, "USE_MOCK_DATA", False)
+    monkeypatch.setattr(settings, "NEWS_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "HTTP_BACKOFF_BASE_SECONDS", 0.0)
+    monkeypatch.setattr(settings, "HTTP_MAX_RETRIES", 2)
+    monkeypatch.setattr(settings, "NEWS_API_RATE_PER_SECOND", 0)
+
+def _scripted_transport(statuses, calls, headers=None):
+    """statuses 순서대로 응답하는 로컬 NewsAPI 대역"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        if status != 200:
+            return httpx.Response(status, headers=headers or {})
+        return httpx.Response(200, json={"status": "ok", "articles": [ARTICLE]})
+    return httpx.MockTransport(handler)
+
+@pytest.mark.asyncio
+async def test_reuses_pooled_client():
+    calls = []
+    crawler = NewsCrawler(transport=_scripted_transport([200], calls))
+    await crawler.startup()
+    client = crawler.client
+    first = await crawler.search_news("pool")
+    await crawler.search_news("pool")
+    assert crawler.client is client
+    assert len(calls) == 2
+    assert calls[0].url.params["apiKey"] == "test-key"
+    assert first[0].title == "Pooled client article"
+    await crawler.shutdown()
+    assert client.is_closed
+
+@pytest.mark.asyncio
+async def test_retries_on_429_and_5xx():
+    calls = []
+    crawler = NewsCrawler(transport=_scripted_transport([429, 503, 200], calls, {"Retry-After": "0"}))
+    result = await crawler.search_news("retry")
+    assert len(calls) == 3
+    assert result[0].url == ARTICLE["url"]
+    await crawler.shutdown()
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries():
+    calls = []
+    crawler = NewsCrawler(transport=_scripted_transport([500], calls))
+    with pytest.raises(httpx.HTTPStatusError):
+        await crawler.search_news("down")
+    assert len(calls) == settings.HTTP_MAX_RETRIES + 1
+    await crawler.shutdown()
+
+@pytest.mark.asyncio
+async def test_does_not_retry_client_errors():
+    calls = []
+    crawler = NewsCrawler(transport=_scripted_transport([401], calls))
+    with pytest.raises(httpx.HTTPStatusError):
+        await crawler.search_news("unauthorized")
+    assert len(calls) == 1
+    await crawler.shutdown()
+
+def test_retry_after_http_date():
+    response = httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert NewsCrawler._retry_after_seconds(response) == 0.0
+    assert NewsCrawler._retry_after_seconds(httpx.Response(429, headers={"Retry-After": "3"})) == 3.0
+    assert NewsCrawler._retry_after_seconds(httpx.Response(429)) is None
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=20, capacity=1)
+    start = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    # 첫 요청은 즉시, 이후 3회는 각 1/20초 대기
+    assert time.monotonic() - start >= 0.14
+
+def _paged_transport(calls, total=35, shared_prefix=None):
+    """page/pageSize 파라미터에 따라 기사를 돌려주는 NewsAPI 대역"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        q = request.url.params["q"]
+        page = int(request.url.params["page"])
+        size = int(request.url.params["pageSize"])
+        start = (page - 1) * size
+        articles = [
+            {
+                "title": f"{q} article {i}",
+                # shared_prefix가 있으면 키워드와 무관한 URL (키워드 간 중복 기사)
+                "url": f"https://example.com/{shared_prefix or q}/{i}",
+                "content": "Body",
+                "publishedAt": "2026-01-02T03:04:05Z",
+            }
+            for i in range(start, min(start + size, total))
+        ]
+        return httpx.Response(200, json={"status": "ok", "articles": articles})
+    return httpx.MockTransport(handler)
+
+@pytest.mark.asyncio
+async def test_multi_page_fetch_stops_at_last_page(monkeypatch):
+    monkeypatch.setattr(settings, "NEWS_API_PAGE_SIZE", 10)
+    calls = []
+    crawler = NewsCrawler(transport=_paged_transport(calls, total=35))
+    result = await crawler.search_news("deep", pages=10)
+    assert len(result) == 35
+    # 4페이지(5건)가 마지막 페이지 -> 이후 페이지는 요청하지 않음
+    assert sorted(int(c.url.params["page"]) for c in calls) == [1, 2, 3, 4]
+    await crawler.shutdown()
+
+@pytest.mark.asyncio
+async def test_multi_query_merges_and_dedupes(monkeypatch):
+    monkeypatch.setattr(settings, "NEWS_API_PAGE_SIZE", 10)
+    calls = []
+    crawler = NewsCrawler(transport=_paged_transport(calls, total=15, shared_prefix="wire"))
+    result = await crawler.search_news(["alpha", "beta", "alpha"], pages=2)
+    assert len(calls) == 4  # 중복 키워드 제거 후 2 x 2 페이지
+    assert len(result) == 15
+    assert len({n.url for n in result}) == 15
+    await crawler.shutdown()
+
+@pytest.mark.asyncio
+async def test_stops_early_on_known_articles(monkeypatch):
+    monkeypatch.setattr(settings, "NEWS_API_PAGE_SIZE", 10)
+    monkeypatch.setattr(settings, "NEWS_API_CONCURRENCY", 2)
+    calls = []
+    crawler = NewsCrawler(transport=_paged_transport(calls, total=100))
+
+    async def known_urls(urls):
+        return {u for u in urls if u.endswith("/15")}
+
+    result = await crawler.search_news("known", pages=10, known_urls=known_urls)
+    # 첫 묶음(1~2페이지)에서 저장된 기사를 만나 중단
+    assert len(calls) == 2
+    assert len(result) == 20
+    await crawler.shutdown()
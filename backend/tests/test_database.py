@@ -0,0 +1,39 @@
+import pytest
+from pydantic import ValidationError
+from app.core.config import Settings, settings
+from app.db.database import database_url, engine_options, sqlite_pragmas
+
+def test_database_url_uses_asyncpg():
+    assert database_url("postgres://u:p@db/news") == "postgresql+asyncpg://u:p@db/news"
+    assert database_url("postgresql://u:p@db/news") == "postgresql+asyncpg://u:p@db/news"
+    assert database_url("sqlite+aiosqlite:///./news.db") == "sqlite+aiosqlite:///./news.db"
+
+def test_engine_options_by_profile(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PROFILE", "production")
+    monkeypatch.setattr(settings, "DB_ECHO", None)
+    options = engine_options("postgresql+asyncpg://u:p@db/news")
+    assert options["echo"] is False
+    assert options["pool_pre_ping"] is True
+    assert options["pool_size"] == settings.DB_POOL_SIZE
+    assert "connect_args" not in options
+
+    options = engine_options("sqlite+aiosqlite:///./news.db")
+    assert options["connect_args"] == {"check_same_thread": False}
+    assert options["pool_pre_ping"] is False
+    # 메모리 DB에는 풀 설정을 넘기지 않음
+    assert "pool_size" not in engine_options("sqlite+aiosqlite://")
+
+    monkeypatch.setattr(settings, "DB_PROFILE", "development")
+    assert engine_options("sqlite+aiosqlite:///./news.db")["echo"] is True
+    monkeypatch.setattr(settings, "DB_ECHO", False)
+    assert engine_options("sqlite+aiosqlite:///./news.db")["echo"] is False
+
+def test_sqlite_pragmas():
+    assert sqlite_pragmas(False) == [f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}"]
+    tuned = sqlite_pragmas(True)
+    assert "PRAGMA journal_mode=WAL" in tuned
+    assert f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}" in tuned
+
+def test_db_profile_is_validated():
+    with pytest.raises(ValidationError):
+        Settings(DB_PROFILE="prod")
@@ -0,0 +1,72 @@
+import pytest
+from app.db.database import AsyncSessionLocal
+from app.schemas.news import NewsCreate
+from app.services import analysis
+from app.services.analysis import analyze_batch, analyze_news
+from app.services.ingestion import bulk_upsert_news
+from app.utils.minhash import bands, minhash, similarity
+
+WIRE = (
+    "Samsung Electronics posted a record quarterly operating profit on Tuesday as demand for "
+    "high bandwidth memory chips used in artificial intelligence servers surged, and the company "
+    "said it expects supply to remain tight through the rest of the year while it expands capacity "
+    "at its Pyeongtaek plant to meet orders from cloud customers."
+)
+OTHER = (
+    "The central bank held its benchmark interest rate steady on Wednesday, citing persistent "
+    "services inflation and a cooling labour market, and signalled that cuts were unlikely before "
+    "the autumn as policymakers wait for clearer evidence that price pressures are easing."
+)
+
+def test_minhash_near_duplicates():
+    a = minhash(WIRE)
+    assert similarity(a, minhash(WIRE + " (Reporting by Wire)")) >= 0.9
+    assert similarity(a, minhash("<p>" + WIRE.replace(",", " ,") + "</p>")) == 1.0  # clean_text 결과 기준
+    assert similarity(a, minhash(OTHER)) < 0.2
+    assert minhash("too short", min_tokens=8) is None
+    # 유사한 서명은 LSH 밴드를 공유하고, 다른 기사는 공유하지 않음
+    assert set(enumerate(bands(a))) & set(enumerate(bands(minhash(WIRE + " (Reporting by Wire)"))))
+    assert not set(enumerate(bands(a))) & set(enumerate(bands(minhash(OTHER))))
+
+def _article(slug, content, title="Syndicated story"):
+    return NewsCreate(title=title, url=f"https://dedup.example.com/{slug}", content=content)
+
+async def test_ingestion_links_syndicated_copies():
+    async with AsyncSessionLocal() as db:
+        first = await bulk_upsert_news(db, [_article("a", WIRE), _article("b", WIRE + " (Reporting by Wire)")])
+    async with AsyncSessionLocal() as db:
+        later = await bulk_upsert_news(db, [_article("c", WIRE, title="Other outlet"), _article("d", OTHER)])
+
+    rep = first[0]
+    assert rep.cluster_id == rep.id
+    assert first[1].cluster_id == rep.id  # 같은 배치
+    assert later[0].cluster_id == rep.id  # 이후 수집
+    assert later[1].cluster_id == later[1].id  # 다른 기사
+
+async def test_cluster_members_reuse_analysis(monkeypatch):
+    async with AsyncSessionLocal() as db:
+        items = await bulk_upsert_news(db, [_article(f"reuse-{i}", WIRE + f" Dateline {'x' * i}.") for i in range(3)])
+    ids = [n.id for n in items]
+    assert len({n.cluster_id for n in items}) == 1
+
+    calls = []
+    original = analysis.analyzer.analyze_content
+
+    async def counting(title, content, keywords=None, raise_on_error=False):
+        calls.append(title)
+        return await original(title, content, keywords, raise_on_error)
+
+    monkeypatch.setattr(analysis.analyzer, "analyze_content", counting)
+    results = [item async for item in analyze_batch(ids)]
+    assert {r.status for r in results} == {"ok"}
+    assert len(calls) == 1
+    summaries = {r.news.summary for r in results}
+    assert len(summaries) == 1 and None not in summaries
+    assert {r.news.cluster_id for r in results} == {items[0].cluster_id}
+
+    # 단건 분석도 같은 묶음의 결과를 재사용
+    async with AsyncSessionLocal() as db:
+        extra = (await bulk_upsert_news(db, [_article("reuse-extra", WIRE + " Dateline.")]))[0]
+        assert extra.cluster_id == items[0].cluster_id
+        await analyze_news(db, extra)
+    assert len(calls) == 1
@@ -1,15 +1,6 @@
 import pytest
 from httpx import AsyncClient, ASGITransport
 from app.main import app
-from app.db.database import engine, Base
-
-@pytest.fixture(scope="session", autouse=True)
-async def init_db():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
 
 @pytest.mark.asyncio
 async def test_full_e2e_flow():
@@ -22,9 +13,9 @@ async def test_full_e2e_flow():
         news_list = search_response.json()
         assert len(news_list) > 0
         
-        target_news = news_list[0]
+        # 가짜 데이터 중 분석 전 상태로 수집된 기사 (처음엔 요약이 없어야 함)
+        target_news = next(item for item in news_list if item["summary"] is None)
         news_id = target_news["id"]
-        assert target_news["summary"] is None  # 처음엔 요약이 없어야 함
         
         # 2. 분석 (Analyze)
         analyze_response = await ac.post(f"/api/v1/news/analysis/{news_id}")
@@ -38,7 +29,7 @@ async def test_full_e2e_flow():
         assert len(analyzed_news["keywords"]) > 0
 
         # 3. 목록 조회 시에도 분석 결과가 유지되는지 확인
-        list_response = await ac.get("/api/v1/news/")
+        list_response = await ac.get("/api/v1/news")
         assert list_response.status_code == 200
         updated_list = list_response.json()
         
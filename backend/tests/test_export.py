@@ -0,0 +1,90 @@
+import csv
+import gzip
+import importlib.util
+import io
+import json
+import pytest
+import pyarrow.parquet as pq
+import zstandard
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.db.database import AsyncSessionLocal
+from app.schemas.news import NewsCreate
+from app.services.export import export_news
+from app.services.ingestion import bulk_upsert_news
+
+PREFIX = "https://example.com/export/"
+
+@pytest.fixture(scope="module")
+async def exported_news():
+    async with AsyncSessionLocal() as db:
+        return await bulk_upsert_news(db, [
+            NewsCreate(title=f"Export {i}", url=f"{PREFIX}{i}", content=f'body, with "quotes" {i}', keywords=["export", f"k{i}"])
+            for i in range(7)
+        ])
+
+async def _export(params: dict) -> tuple:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/api/v1/news/export", params=params)
+    return response, response.content
+
+@pytest.mark.asyncio
+async def test_ndjson_streams_in_chunks(exported_news):
+    chunks = [chunk async for chunk in export_news("ndjson", ("id", "url", "keywords"), chunk_size=2)]
+    rows = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+    ours = [r for r in rows if r["url"].startswith(PREFIX)]
+    assert [r["id"] for r in ours] == [n.id for n in exported_news]
+    assert ours[0] == {"id": exported_news[0].id, "url": f"{PREFIX}0", "keywords": ["export", "k0"]}
+    # 행 수 / chunk_size 만큼 나뉘어 전송
+    assert len(chunks) == -(-len(rows) // 2)
+
+@pytest.mark.asyncio
+async def test_csv_gzip_export(exported_news):
+    response, body = await _export({"format": "csv", "compression": "gzip", "fields": "id,title,content,keywords"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert 'filename="news_export.csv.gz"' in response.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(gzip.decompress(body).decode("utf-8"))))
+    assert rows[0] == ["id", "title", "content", "keywords"]
+    row = next(r for r in rows[1:] if r[1] == "Export 3")
+    assert row[2] == 'body, with "quotes" 3'
+    assert json.loads(row[3]) == ["export", "k3"]
+
+@pytest.mark.asyncio
+async def test_since_filters_by_created_at(exported_news):
+    response, body = await _export({"fields": "id,url", "since": "2999-01-01T00:00:00Z"})
+    assert response.status_code == 200
+    assert body == b""
+
+@pytest.mark.asyncio
+async def test_parquet_writes_row_group_per_chunk(exported_news, monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 3)
+    response, body = await _export({"format": "parquet", "compression": "zstd"})
+    assert response.status_code == 200
+    parquet = pq.ParquetFile(io.BytesIO(body))
+    assert parquet.metadata.num_row_groups == -(-parquet.metadata.num_rows // 3)
+    assert parquet.metadata.row_group(0).column(0).compression == "ZSTD"
+    table = parquet.read().to_pylist()
+    row = next(r for r in table if r["url"] == f"{PREFIX}5")
+    assert row["keywords"] == ["export", "k5"]
+    assert row["created_at"].tzinfo is not None
+
+@pytest.mark.asyncio
+async def test_ndjson_zstd_export(exported_news):
+    response, body = await _export({"compression": "zstd", "fields": "url"})
+    assert response.status_code == 200
+    data = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    assert f'{{"url": "{PREFIX}6"}}' in data.decode()
+
+@pytest.mark.asyncio
+async def test_export_errors(monkeypatch):
+    response, _ = await _export({"fields": "id,password"})
+    assert response.status_code == 400
+    response, _ = await _export({"format": "xml"})
+    assert response.status_code == 422
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name, *args: None)
+    response, _ = await _export({"format": "parquet"})
+    assert response.status_code == 501
+    assert "pyarrow" in response.json()["detail"]
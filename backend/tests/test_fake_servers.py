@@ -0,0 +1,81 @@
+import asyncio
+import pytest
+from openai import AsyncOpenAI
+from app.core.config import settings
+from app.services.analyzer import NewsAnalyzer
+from app.services.crawler import NewsCrawler
+from benchmarks.fake_servers import FakeServer, FakeServerOptions, fake_newsapi_app, fake_openai_app
+
+@pytest.fixture(autouse=True)
+def api_settings(monkeypatch):
+    monkeypatch.setattr(settings, "USE_MOCK_DATA", False)
+    monkeypatch.setattr(settings, "NEWS_API_KEY", "bench")
+    monkeypatch.setattr(settings, "NEWS_API_PAGE_SIZE", 10)
+    monkeypatch.setattr(settings, "NEWS_API_CONCURRENCY", 4)
+    monkeypatch.setattr(settings, "NEWS_API_RATE_PER_SECOND", 0)
+    monkeypatch.setattr(settings, "HTTP_BACKOFF_BASE_SECONDS", 0.0)
+    monkeypatch.setattr(settings, "SENTIMENT_MODE", "llm")
+
+@pytest.fixture(scope="module")
+def newsapi():
+    with FakeServer(fake_newsapi_app(FakeServerOptions(total_results=25, content_words=30))) as server:
+        yield server
+
+@pytest.fixture(scope="module")
+def openai_server():
+    with FakeServer(fake_openai_app(FakeServerOptions(summary_chars=40, stream_chunks=4))) as server:
+        yield server
+
+def _analyzer(server: FakeServer) -> NewsAnalyzer:
+    analyzer = NewsAnalyzer()
+    analyzer.client = AsyncOpenAI(api_key="bench", base_url=f"{server.url}/v1", max_retries=0)
+    return analyzer
+
+@pytest.mark.asyncio
+async def test_crawler_pages_through_fake_newsapi(newsapi, monkeypatch):
+    monkeypatch.setattr(settings, "NEWS_API_BASE_URL", f"{newsapi.url}/v2/everything")
+    crawler = NewsCrawler()
+    before = newsapi.stats.requests
+    news = await crawler.search_news("chip stocks", pages=5)
+    await crawler.shutdown()
+    # 25건 = 10 + 10 + 5, 첫 묶음(NEWS_API_CONCURRENCY=4페이지)에서 마지막 페이지를 만나 5페이지는 요청 안 함
+    assert len(news) == 25
+    assert newsapi.stats.requests - before == 4
+    assert news[0].url == "https://fake-news.local/chip-stocks/0"
+    assert news[0].published_at > news[-1].published_at
+
+@pytest.mark.asyncio
+async def test_crawler_retries_injected_errors(monkeypatch):
+    monkeypatch.setattr(settings, "HTTP_MAX_RETRIES", 1)
+    options = FakeServerOptions(error_rate=1.0, error_status=429)
+    with FakeServer(fake_newsapi_app(options)) as failing:
+        monkeypatch.setattr(settings, "NEWS_API_BASE_URL", f"{failing.url}/v2/everything")
+        crawler = NewsCrawler()
+        with pytest.raises(Exception):
+            await crawler.search_news("errors")
+        await crawler.shutdown()
+        assert failing.stats.requests == 2
+        assert failing.stats.errors == 2
+
+@pytest.mark.asyncio
+async def test_analyzer_single_and_packed_against_fake_openai(openai_server, monkeypatch):
+    monkeypatch.setattr(settings, "ANALYSIS_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "ANALYSIS_PACK_SIZE", 1)
+    analyzer = _analyzer(openai_server)
+    single = await analyzer.analyze_content("Fake title", "Fake body text")
+    assert len(single.summary) == 40
+    assert single.sentiment_label in ("positive", "negative", "neutral")
+
+    monkeypatch.setattr(settings, "ANALYSIS_PACK_SIZE", 4)
+    before = openai_server.stats.requests
+    results = await asyncio.gather(*(analyzer.analyze_content(f"title {i}", f"body {i}") for i in range(4)))
+    assert openai_server.stats.requests - before == 1
+    assert all(len(r.summary) == 40 for r in results)
+
+@pytest.mark.asyncio
+async def test_analyzer_stream_against_fake_openai(openai_server):
+    analyzer = _analyzer(openai_server)
+    parts = [part async for part in analyzer.stream_content("Fake title", "Fake body text")]
+    deltas, result = parts[:-1], parts[-1]
+    assert "".join(deltas) == result.summary
+    assert len(result.summary) == 40
@@ -0,0 +1,73 @@
+import asyncio
+import httpx
+import pytest
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.schemas.news import NewsCreate
+from app.services.crawler import NewsCrawler
+from app.services.ingestion import bulk_upsert_news, lookup_known_urls
+
+def _batch(prefix: str, n: int) -> list[NewsCreate]:
+    return [
+        NewsCreate(title=f"{prefix} {i}", url=f"https://example.com/ingest/{prefix}/{i}")
+        for i in range(n)
+    ]
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_dedupes_and_keeps_order():
+    batch = _batch("order", 5)
+    async with AsyncSessionLocal() as db:
+        first = await bulk_upsert_news(db, batch[:3])
+    assert [n.url for n in first] == [b.url for b in batch[:3]]
+    assert all(n.id is not None and n.created_at is not None for n in first)
+
+    # 기존 URL + 신규 URL + 목록 내 중복 URL
+    async with AsyncSessionLocal() as db:
+        second = await bulk_upsert_news(db, batch + [batch[4]])
+    assert [n.url for n in second] == [b.url for b in batch]
+    assert [n.id for n in second[:3]] == [n.id for n in first]
+    assert len({n.id for n in second}) == 5
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_concurrent_overlap():
+    batch = _batch("race", 20)
+
+    async def save(items):
+        async with AsyncSessionLocal() as db:
+            return await bulk_upsert_news(db, items)
+
+    a, b = await asyncio.gather(save(batch[:15]), save(batch[5:]))
+    assert len(a) == 15 and len(b) == 15
+    ids_a = {n.url: n.id for n in a}
+    ids_b = {n.url: n.id for n in b}
+    for url in set(ids_a) & set(ids_b):
+        assert ids_a[url] == ids_b[url]
+
+@pytest.mark.asyncio
+async def test_known_urls_lookup_is_safe_for_concurrent_queries(monkeypatch):
+    monkeypatch.setattr(settings, "USE_MOCK_DATA", False)
+    monkeypatch.setattr(settings, "NEWS_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "NEWS_API_RATE_PER_SECOND", 0)
+    monkeypatch.setattr(settings, "NEWS_API_PAGE_SIZE", 5)
+    monkeypatch.setattr(settings, "NEWS_API_CONCURRENCY", 2)
+    queries = [f"known{i}" for i in range(4)]
+    # 키워드마다 두 번째 페이지의 기사가 이미 저장되어 있음
+    async with AsyncSessionLocal() as db:
+        await bulk_upsert_news(db, [
+            NewsCreate(title=q, url=f"https://example.com/ingest/{q}/7") for q in queries
+        ])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        q = request.url.params["q"]
+        page = int(request.url.params["page"])
+        articles = [
+            {"title": f"{q} {i}", "url": f"https://example.com/ingest/{q}/{i}", "publishedAt": "2026-01-02T03:04:05Z"}
+            for i in range((page - 1) * 5, page * 5)
+        ]
+        return httpx.Response(200, json={"status": "ok", "articles": articles})
+
+    crawler = NewsCrawler(transport=httpx.MockTransport(handler))
+    # 키워드별 수집이 동시에 콜백을 호출해도 호출마다 전용 세션을 사용
+    result = await crawler.search_news(queries, pages=6, known_urls=lookup_known_urls)
+    await crawler.shutdown()
+    assert len(result) == 4 * 10
@@ -0,0 +1,133 @@
+import asyncio
+import httpx
+import pytest
+from httpx import AsyncClient, ASGITransport
+from openai import AsyncOpenAI
+from app.main import app
+from app.core.config import settings
+from app.services import jobs as jobs_module
+from app.services.jobs import AnalysisWorkerPool, job_queue
+
+async def _search(ac, query):
+    response = await ac.post("/api/v1/news/search", params={"query": query})
+    assert response.status_code == 200
+    return response.json()
+
+@pytest.mark.asyncio
+async def test_background_analysis_job_completes(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_POLL_INTERVAL_SECONDS", 0.05)
+    pool = AnalysisWorkerPool(job_queue)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        news = await _search(ac, "JobQueue")
+        target = next(n for n in news if n["summary"] is None)
+
+        response = await ac.post(f"/api/v1/news/analysis/{target['id']}", params={"background": True})
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] == "queued" and job["news_id"] == target["id"]
+
+        # 대기 중인 작업이 있으면 같은 작업을 재사용
+        again = await ac.post("/api/v1/jobs", json={"news_ids": [target["id"]]})
+        assert again.status_code == 202
+        assert again.json()[0]["id"] == job["id"]
+
+        await pool.start(2)
+        try:
+            response = await ac.get(f"/api/v1/jobs/{job['id']}", params={"wait": 5})
+        finally:
+            await pool.stop()
+        assert response.json()["status"] == "succeeded"
+        assert response.json()["attempts"] == 1
+
+        analyzed = await ac.get("/api/v1/news", params={"limit": 100})
+        item = next(n for n in analyzed.json() if n["id"] == target["id"])
+        assert item["summary"] is not None
+
+@pytest.mark.asyncio
+async def test_failed_job_retries_then_dead_letters(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_RETRY_BACKOFF_SECONDS", 0)
+
+    async def failing_analysis(db, news_item, raise_on_error=False):
+        raise RuntimeError("LLM unavailable")
+
+    monkeypatch.setattr(jobs_module, "analyze_news", failing_analysis)
+    pool = AnalysisWorkerPool(job_queue)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        news = await _search(ac, "DeadLetter")
+        response = await ac.post("/api/v1/jobs", json={"news_ids": [news[0]["id"]]})
+        job_id = response.json()[0]["id"]
+
+        while await pool.run_once("test-worker"):
+            pass
+
+        job = (await ac.get(f"/api/v1/jobs/{job_id}")).json()
+        assert job["status"] == "dead"
+        assert job["attempts"] == settings.JOB_MAX_ATTEMPTS
+        assert job["last_error"] == "LLM unavailable"
+
+        dead = await ac.get("/api/v1/jobs", params={"status": "dead"})
+        assert any(j["id"] == job_id for j in dead.json())
+
+        retried = await ac.post(f"/api/v1/jobs/{job_id}/retry")
+        assert retried.status_code == 202
+        assert retried.json()["status"] == "queued"
+
+@pytest.mark.asyncio
+async def test_llm_failure_dead_letters_without_saving_fallback(monkeypatch):
+    from app.services.analyzer import analyzer
+
+    monkeypatch.setattr(settings, "JOB_RETRY_BACKOFF_SECONDS", 0)
+    pool = AnalysisWorkerPool(job_queue)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        news = await _search(ac, "LLMDown")
+        target = next(n for n in news if n["summary"] is None)
+        response = await ac.post("/api/v1/jobs", json={"news_ids": [target["id"]]})
+        job_id = response.json()[0]["id"]
+
+        # OpenAI 클라이언트 자체가 실패 (500)
+        failing = AsyncOpenAI(
+            api_key="test-key",
+            base_url="http://fake-openai/v1",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(500))),
+            max_retries=0,
+        )
+        monkeypatch.setattr(analyzer, "client", failing)
+        monkeypatch.setattr(settings, "USE_MOCK_DATA", False)
+        monkeypatch.setattr(settings, "ANALYSIS_PACK_SIZE", 1)
+
+        while await pool.run_once("test-worker"):
+            pass
+
+        job = (await ac.get(f"/api/v1/jobs/{job_id}")).json()
+        # 재시도 후 dead-letter, 가짜 분석은 저장되지 않음
+        assert job["status"] == "dead"
+        assert job["attempts"] == settings.JOB_MAX_ATTEMPTS
+        assert "500" in job["last_error"]
+
+        analyzed = await ac.get("/api/v1/news", params={"limit": 100})
+        item = next(n for n in analyzed.json() if n["id"] == target["id"])
+        assert item["summary"] is None
+
+@pytest.mark.asyncio
+async def test_auto_enqueue_unanalyzed(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_AUTO_ENQUEUE", True)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        news = await _search(ac, "AutoEnqueue")
+        queued = await ac.get("/api/v1/jobs", params={"status": "queued"})
+    unanalyzed = {n["id"] for n in news if n["summary"] is None}
+    assert unanalyzed
+    assert unanalyzed <= {j["news_id"] for j in queued.json()}
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_are_exclusive():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        news = await _search(ac, "Claim")
+        await ac.post("/api/v1/jobs", json={"news_ids": [n["id"] for n in news]})
+    claimed = await asyncio.gather(*(job_queue.claim(f"w{i}") for i in range(10)))
+    ids = [job.id for job in claimed if job is not None]
+    assert len(ids) == len(set(ids))
@@ -0,0 +1,159 @@
+import asyncio
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import event, select
+from app.core.config import Settings, settings
+from app.db.database import engine, AsyncSessionLocal
+from app.db.models import CorpusStats, TermDocumentFrequency
+from app.schemas.news import NewsCreate
+from app.services.ingestion import bulk_upsert_news
+from app.services.keyword_engine import KeywordEngine, count_document_frequencies, document_terms, keyword_engine
+
+CORPUS = [
+    "Stock market update: market closes higher as investors cheer",
+    "Market watch: the market slips while investors wait",
+    "Interest rate decision: central bank holds interest rate, market calm",
+    "Market rally extends as chipmakers report record demand",
+]
+
+def test_document_terms_include_bigrams():
+    terms, length = document_terms("Central bank holds the interest rate")
+    assert length == 5
+    assert terms[:5] == ["central", "bank", "holds", "interest", "rate"]
+    assert "interest rate" in terms and "holds interest" in terms
+
+@pytest.mark.parametrize("method", ["bm25", "tfidf"])
+def test_corpus_common_terms_rank_lower(method):
+    kw = KeywordEngine()
+    kw.observe(CORPUS)
+    [keywords] = kw.score_many([CORPUS[2]], top_n=3, method=method)
+    # 모든 문서에 나오는 market보다 이 문서에만 반복되는 표현이 우선
+    assert keywords[0] == "interest rate"
+    assert "market" not in keywords
+
+def test_bigram_needs_repetition():
+    kw = KeywordEngine()
+    kw.observe(CORPUS)
+    [keywords] = kw.score_many([CORPUS[3]], top_n=10)
+    assert not any(" " in k for k in keywords)
+    [keywords] = kw.score_many([CORPUS[3]], top_n=10, bigrams=False)
+    assert "chipmakers" in keywords
+
+def test_batch_scoring_matches_single():
+    kw = KeywordEngine()
+    kw.observe(CORPUS)
+    texts = CORPUS + ["", "반도체 수요 반도체 수요 증가", "the and of"]
+    batch = kw.score_many(texts, top_n=4)
+    assert batch == [kw.score_many([t], top_n=4)[0] for t in texts]
+    assert batch[4] == [] and batch[6] == []
+    assert batch[5][0] == "반도체 수요"
+
+async def _df_snapshot():
+    async with AsyncSessionLocal() as db:
+        df = dict((await db.execute(select(TermDocumentFrequency.term, TermDocumentFrequency.df))).all())
+        stats = await db.get(CorpusStats, 1)
+        return df, (stats.document_count, stats.total_length) if stats else (0, 0)
+
+async def test_incremental_df_matches_rebuild():
+    async with AsyncSessionLocal() as db:
+        await keyword_engine.rebuild(db)
+    before, (docs_before, length_before) = await _df_snapshot()
+
+    items = [NewsCreate(title=f"DF test {i}", url=f"https://df.example.com/{i}", content=text) for i, text in enumerate(CORPUS)]
+    async with AsyncSessionLocal() as db:
+        await bulk_upsert_news(db, items)
+        await bulk_upsert_news(db, items)  # 중복 수집은 DF에 반영되지 않음
+    after, (docs_after, length_after) = await _df_snapshot()
+
+    expected, documents, total_length = count_document_frequencies(f"{n.title}\n{n.content}" for n in items)
+    assert docs_after - docs_before == documents == len(items)
+    assert length_after - length_before == total_length
+    assert {t: after[t] - before.get(t, 0) for t in after if after[t] != before.get(t, 0)} == dict(expected)
+
+    async with AsyncSessionLocal() as db:
+        await keyword_engine.rebuild(db)
+    assert await _df_snapshot() == (after, (docs_after, length_after))
+
+async def test_df_rows_locked_in_term_order_and_corpus_stats_last():
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    items = [
+        NewsCreate(title="Zebra yields", url="https://df.example.com/order/1", content="zebra apple mango yields"),
+        NewsCreate(title="Apple zebra", url="https://df.example.com/order/2", content="mango apple zebra"),
+    ]
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with AsyncSessionLocal() as db:
+            await bulk_upsert_news(db, items)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    writes = [(sql, params) for sql, params in statements if sql.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))]
+    assert "INTO corpus_stats" in writes[-1][0]
+    [(_, params)] = [(sql, params) for sql, params in writes if "INTO term_document_frequencies" in sql]
+    terms = [p for p in params if isinstance(p, str)]
+    assert terms == sorted(terms) and "zebra" in terms
+
+async def test_rolled_back_ingestion_does_not_touch_memory_df(monkeypatch):
+    from app.services import ingestion
+
+    async def fail(db, news):
+        raise RuntimeError("dedup failed")
+
+    async with AsyncSessionLocal() as db:
+        await keyword_engine.load(db)
+    documents = keyword_engine.document_count
+    monkeypatch.setattr(ingestion, "assign_clusters", fail)
+    async with AsyncSessionLocal() as db:
+        with pytest.raises(RuntimeError):
+            await bulk_upsert_news(db, [NewsCreate(title="Rolled back", url="https://df.example.com/rollback", content="never stored")])
+        await db.rollback()
+    assert keyword_engine.document_count == documents
+    assert keyword_engine._df.get("rolled") is None
+
+async def test_memory_df_skips_rare_bigrams_and_refreshes_in_background(monkeypatch):
+    items = [
+        NewsCreate(title="Rare pair", url="https://df.example.com/rare/1", content="quokka sightings rise"),
+        NewsCreate(title="Common pair", url="https://df.example.com/rare/2", content="harbour dredging resumes"),
+        NewsCreate(title="Common pair again", url="https://df.example.com/rare/3", content="harbour dredging stalls"),
+    ]
+    async with AsyncSessionLocal() as db:
+        await bulk_upsert_news(db, items)
+        await keyword_engine.load(db)
+    df, _ = await _df_snapshot()
+    assert df["quokka sightings"] == 1 and "quokka sightings" not in keyword_engine._df
+    assert keyword_engine._df["quokka"] == 1
+    assert keyword_engine._df["harbour dredging"] == df["harbour dredging"] >= 2
+    assert not any(" " in term and count < 2 for term, count in keyword_engine._df.items())
+
+    # 요청 경로에서는 오래된 사본도 다시 읽지 않고, 백그라운드 작업이 재적재
+    loads = []
+    original = keyword_engine.load
+
+    async def counting_load(db):
+        loads.append(db)
+        await original(db)
+
+    monkeypatch.setattr(keyword_engine, "load", counting_load)
+    monkeypatch.setattr(keyword_engine, "_loaded_at", 0.0)
+    async with AsyncSessionLocal() as db:
+        await keyword_engine.ensure_loaded(db)
+    assert loads == []
+
+    monkeypatch.setattr(settings, "KEYWORD_DF_REFRESH_SECONDS", 0.01)
+    await keyword_engine.start()
+    try:
+        for _ in range(100):
+            if loads:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await keyword_engine.stop()
+    assert loads and not keyword_engine.running
+
+def test_keyword_engine_is_validated():
+    with pytest.raises(ValidationError):
+        Settings(KEYWORD_ENGINE="tf-idf")
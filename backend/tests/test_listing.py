@@ -0,0 +1,43 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.db.database import AsyncSessionLocal
+from app.schemas.news import NewsCreate
+from app.services.ingestion import bulk_upsert_news
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_visits_every_row_once():
+    # 한 번의 INSERT로 저장 -> created_at이 같은 행이 여러 개 (id로 순서 결정)
+    items = [NewsCreate(title=f"Page {i}", url=f"https://example.com/page/{i}", keywords=["k"]) for i in range(25)]
+    async with AsyncSessionLocal() as db:
+        await bulk_upsert_news(db, items)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        full = (await ac.get("/api/v1/news", params={"limit": 1000})).json()
+
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 7, "fields": "id,title,keywords"}
+            if cursor:
+                params["cursor"] = cursor
+            response = await ac.get("/api/v1/news", params=params)
+            assert response.status_code == 200
+            page = response.json()
+            seen.extend(page)
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+    assert [n["id"] for n in seen] == [n["id"] for n in full]
+    assert set(seen[0]) == {"id", "title", "keywords"}
+    ours = [n for n in seen if n["title"].startswith("Page ")]
+    assert len(ours) == 25
+    assert all(n["keywords"] == ["k"] for n in ours)
+
+@pytest.mark.asyncio
+async def test_list_rejects_bad_params():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        assert (await ac.get("/api/v1/news", params={"fields": "id,secret"})).status_code == 400
+        assert (await ac.get("/api/v1/news", params={"cursor": "not-a-cursor"})).status_code == 400
@@ -0,0 +1,73 @@
+import json
+import logging
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.core.logs import JsonFormatter, RequestIdFilter, request_id_var
+from app.core.metrics import NEWS_DEDUPLICATED, NEWS_INGESTED, Registry
+from app.db.database import AsyncSessionLocal
+from app.schemas.news import NewsCreate
+from app.services.ingestion import bulk_upsert_news
+
+def test_prometheus_text_format():
+    registry = Registry()
+    counter = registry.counter("demo_total", "Demo counter.", ("kind",))
+    histogram = registry.histogram("demo_seconds", "Demo latency.", ("op",), buckets=(0.1, 1.0))
+    counter.inc(kind='a"b')
+    counter.inc(2, kind='a"b')
+    histogram.observe(0.05, op="read")
+    histogram.observe(0.5, op="read")
+    histogram.observe(5, op="read")
+    with pytest.raises(ZeroDivisionError):
+        with histogram.time(op="write"):
+            1 / 0
+    lines = registry.render().splitlines()
+    assert lines[:3] == ["# HELP demo_total Demo counter.", "# TYPE demo_total counter", 'demo_total{kind="a\\"b"} 3']
+    assert 'demo_seconds_bucket{op="read",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{op="read",le="1"} 2' in lines
+    assert 'demo_seconds_bucket{op="read",le="+Inf"} 3' in lines
+    assert 'demo_seconds_sum{op="read"} 5.55' in lines
+    assert 'demo_seconds_count{op="write"} 1' in lines
+    with pytest.raises(ValueError):
+        counter.inc()  # 라벨 누락
+    with pytest.raises(ValueError):
+        registry.counter("demo_total", "Duplicate.")
+
+async def test_metrics_endpoint_and_request_id():
+    async with AsyncSessionLocal() as db:
+        ingested = NEWS_INGESTED.value()
+        duplicates = NEWS_DEDUPLICATED.value(kind="url")
+        await bulk_upsert_news(db, [NewsCreate(title="metrics", url="https://example.com/metrics/1")] * 2)
+        assert NEWS_INGESTED.value() == ingested + 1
+        assert NEWS_DEDUPLICATED.value(kind="url") == duplicates + 1
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/api/v1/news/analysis/999999/stream", headers={"X-Request-ID": "req-123"})
+        assert response.headers["x-request-id"] == "req-123"
+        # 형식이 맞지 않는 요청 ID는 새로 발급
+        response = await ac.get("/api/v1/news", params={"limit": 1}, headers={"X-Request-ID": "bad id\n"})
+        assert len(response.headers["x-request-id"]) == 32
+
+        metrics = await ac.get("/metrics")
+        assert metrics.status_code == 200
+        assert metrics.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = metrics.text
+    # 경로 템플릿 단위로 집계 (뉴스 ID별로 라벨이 늘어나지 않음)
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/news/analysis/{news_id}/stream"}' in body
+    assert 'http_requests_total{method="GET",route="/api/v1/news",status="200"}' in body
+    assert 'pipeline_stage_duration_seconds_count{stage="upsert"}' in body
+    assert 'db_query_duration_seconds_count{operation="select"}' in body
+    assert "db_session_duration_seconds_count" in body
+
+def test_json_log_includes_request_id():
+    record = logging.LogRecord("app.test", logging.ERROR, __file__, 1, "failed for %s", ("news 1",), None)
+    token = request_id_var.set("req-456")
+    try:
+        RequestIdFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == "failed for news 1"
+    assert entry["level"] == "ERROR" and entry["logger"] == "app.test"
+    assert entry["request_id"] == "req-456"
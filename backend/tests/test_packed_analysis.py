@@ -0,0 +1,140 @@
+import asyncio
+import json
+import httpx
+import pytest
+from fastapi import FastAPI
+from openai import AsyncOpenAI
+from app.core.config import settings
+from app.core.metrics import LLM_REQUEST_DURATION, LLM_TOKENS
+from app.db.database import AsyncSessionLocal
+from app.schemas.news import NewsCreate
+from app.services import analysis
+from app.services.analysis import analyze_batch
+from app.services.analyzer import NewsAnalyzer
+from app.services.cache import analysis_cache
+from app.services.ingestion import bulk_upsert_news
+from app.services.jobs import AnalysisWorkerPool, job_queue
+
+def fake_openai_app(drop=(), corrupt=()):
+    """
+    OpenAI 호환 chat.completions 대역 서버
+    - 묶음 요청(JSON 배열): 기사별 결과를 {"results": [...]}로 반환 (drop: 누락, corrupt: 잘못된 라벨)
+    - 단건 요청: 기존 프롬프트 형식의 JSON 객체 반환
+    """
+    app = FastAPI()
+    app.state.requests = []
+
+    @app.post("/v1/chat/completions")
+    async def completions(body: dict):
+        app.state.requests.append(body)
+        user = body["messages"][-1]["content"]
+        if user.startswith("["):
+            assert body["response_format"] == {"type": "json_object"}
+            results = [
+                {
+                    "id": a["id"],
+                    "summary": f"요약: {a['title']}",
+                    "sentiment_label": "bogus" if a["title"] in corrupt else "negative",
+                    "sentiment_score": -0.5,
+                }
+                for a in json.loads(user) if a["title"] not in drop
+            ]
+            content = json.dumps({"results": results}, ensure_ascii=False)
+        else:
+            title = user.split("\n")[0].removeprefix("Title: ")
+            content = json.dumps({"summary": f"단건: {title}", "sentiment_label": "neutral", "sentiment_score": 0.0})
+        return {
+            "id": "chatcmpl-test", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+
+    return app
+
+def fake_client(app):
+    http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    return AsyncOpenAI(api_key="test-key", base_url="http://fake-openai/v1", http_client=http_client)
+
+@pytest.fixture(autouse=True)
+def pack_settings(monkeypatch):
+    monkeypatch.setattr(settings, "USE_MOCK_DATA", False)
+    monkeypatch.setattr(settings, "ANALYSIS_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "ANALYSIS_PACK_SIZE", 8)
+    monkeypatch.setattr(settings, "ANALYSIS_PACK_TOKEN_BUDGET", 3000)
+    monkeypatch.setattr(settings, "ANALYSIS_PACK_WAIT_MS", 50)
+
+def _analyzer(app):
+    analyzer = NewsAnalyzer()
+    analyzer.client = fake_client(app)
+    return analyzer
+
+async def test_concurrent_requests_share_one_completion():
+    app = fake_openai_app()
+    analyzer = _analyzer(app)
+    titles = [f"Article {i}" for i in range(5)]
+    prompt_tokens = LLM_TOKENS.value(mode="packed", type="prompt")
+    packed_calls = LLM_REQUEST_DURATION.count(mode="packed", outcome="ok")
+    results = await asyncio.gather(*(analyzer.analyze_content(t, f"Body of {t}.", ["kw"]) for t in titles))
+
+    assert len(app.state.requests) == 1
+    # 응답 usage 필드의 토큰 수와 요청 시간 기록
+    assert LLM_TOKENS.value(mode="packed", type="prompt") == prompt_tokens + 1
+    assert LLM_REQUEST_DURATION.count(mode="packed", outcome="ok") == packed_calls + 1
+    assert [r.summary for r in results] == [f"요약: {t}" for t in titles]
+    assert all(r.sentiment_label == "negative" and r.keywords == ["kw"] for r in results)
+
+async def test_invalid_items_fall_back_to_single_requests():
+    app = fake_openai_app(drop={"Article 1"}, corrupt={"Article 3"})
+    analyzer = _analyzer(app)
+    titles = [f"Article {i}" for i in range(5)]
+    results = await asyncio.gather(*(analyzer.analyze_content(t, "Body.", []) for t in titles))
+
+    # 묶음 1회 + 누락/오류 기사 2건만 기사별 요청
+    assert len(app.state.requests) == 3
+    assert [r.summary for r in results] == ["요약: Article 0", "단건: Article 1", "요약: Article 2", "단건: Article 3", "요약: Article 4"]
+
+async def test_token_budget_splits_packs(monkeypatch):
+    monkeypatch.setattr(settings, "ANALYSIS_PACK_TOKEN_BUDGET", 700)
+    app = fake_openai_app()
+    analyzer = _analyzer(app)
+    # 기사당 약 500토큰(1500자 제한) -> 요청당 1건
+    results = await asyncio.gather(*(analyzer.analyze_content(f"Long {i}", "x" * 3000, []) for i in range(3)))
+    assert len(app.state.requests) == 3
+    assert [r.summary for r in results] == [f"단건: Long {i}" for i in range(3)]
+
+async def _store(prefix, count):
+    items = [
+        NewsCreate(title=f"{prefix} {i}", url=f"https://pack.example.com/{prefix}/{i}", content=f"{prefix} story number {i} unique text {i * 7919}")
+        for i in range(count)
+    ]
+    async with AsyncSessionLocal() as db:
+        return [n.id for n in await bulk_upsert_news(db, items)]
+
+async def test_batch_path_packs_requests(monkeypatch):
+    app = fake_openai_app()
+    monkeypatch.setattr(analysis.analyzer, "client", fake_client(app))
+    ids = await _store("Batch pack", 6)
+
+    results = [item async for item in analyze_batch(ids, concurrency=1)]
+    assert {r.status for r in results} == {"ok"}
+    assert len(app.state.requests) == 1
+    assert {r.news.summary for r in results} == {f"요약: Batch pack {i}" for i in range(6)}
+
+async def test_job_path_packs_requests(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_POLL_INTERVAL_SECONDS", 0.05)
+    monkeypatch.setattr(settings, "ANALYSIS_PACK_WAIT_MS", 300)
+    app = fake_openai_app()
+    monkeypatch.setattr(analysis.analyzer, "client", fake_client(app))
+    ids = await _store("Job pack", 4)
+
+    async with AsyncSessionLocal() as db:
+        jobs = await job_queue.enqueue(db, ids)
+    pool = AnalysisWorkerPool(job_queue)
+    await pool.start(4)
+    try:
+        async with AsyncSessionLocal() as db:
+            finished = [await job_queue.wait_for(db, job.id, 10) for job in jobs]
+    finally:
+        await pool.stop()
+    assert {job.status for job in finished} == {"succeeded"}
+    assert len(app.state.requests) < len(ids)
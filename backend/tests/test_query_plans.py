@@ -0,0 +1,90 @@
+import re
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import create_engine, event
+from app.main import app
+from app.db.database import engine, Base, AsyncSessionLocal
+from app.db.migrations import upgrade_database
+from app.schemas.news import NewsCreate
+from app.services.analysis import select_unanalyzed_ids
+from app.services.ingestion import bulk_upsert_news
+from app.services.jobs import job_queue
+
+def test_migrations_match_models(tmp_path):
+    sync_engine = create_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+    with sync_engine.begin() as conn:
+        upgrade_database(conn)
+    with sync_engine.connect() as conn:
+        diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+    sync_engine.dispose()
+    # 전문 검색 테이블(news_fts*)은 모델이 아닌 app.db.fts가 관리
+    assert [d for d in diff if not (d[0] == "remove_table" and d[1].name.startswith("news_fts"))] == []
+
+# 인덱스 없이 테이블 전체를 읽는 단계 (예: "SCAN news"). "SCAN news USING INDEX ..."는 허용
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+# 전체 행을 반환하는 조회 (관심 키워드 목록)
+FULL_SCAN_ALLOWED = {"SCAN watch_queries"}
+
+async def test_endpoint_queries_use_indexes():
+    async with AsyncSessionLocal() as db:
+        saved = await bulk_upsert_news(db, [
+            NewsCreate(title=f"plan {i}", url=f"https://example.com/plan/{i}", content="query plan market")
+            for i in range(3)
+        ])
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            first = await ac.get("/api/v1/news", params={"limit": 2, "fields": "id,title"})
+            assert first.status_code == 200
+            requests = [
+                ("/api/v1/news", {"limit": 2, "cursor": first.headers["x-next-cursor"]}),
+                ("/api/v1/news", {"limit": 2, "skip": 1}),
+                ("/api/v1/news/search", {"q": "market", "sentiment": "neutral", "date_from": "2020-01-01T00:00:00"}),
+                ("/api/v1/news/keywords/trending", {}),
+                ("/api/v1/news/sentiment/timeseries", {"keyword": "market"}),
+                ("/api/v1/jobs", {"status": "dead"}),
+                ("/api/v1/watchlist", {}),
+                ("/api/v1/news/export", {"fields": "id,title", "since": "2020-01-01T00:00:00"}),
+            ]
+            for path, params in requests:
+                assert (await ac.get(path, params=params)).status_code == 200
+            [job] = (await ac.post("/api/v1/jobs", json={"news_ids": [saved[0].id]})).json()
+            assert (await ac.get(f"/api/v1/jobs/{job['id']}")).status_code == 200
+        async with AsyncSessionLocal() as db:
+            await select_unanalyzed_ids(db, 10)
+        await job_queue.claim("plan-worker")
+        await job_queue.requeue_stale()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    assert statements
+    offenders = []
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        for statement, parameters in statements:
+            cursor = await raw.driver_connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            details = [row[3] for row in await cursor.fetchall()]
+            scans = [d for d in details if FULL_SCAN.match(d) and d not in FULL_SCAN_ALLOWED]
+            if scans:
+                offenders.append((statement, scans))
+    assert offenders == []
+
+async def test_unanalyzed_query_uses_partial_index():
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        cursor = await raw.driver_connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM news WHERE summary IS NULL ORDER BY created_at DESC, id DESC LIMIT 10"
+        )
+        details = " ".join(row[3] for row in await cursor.fetchall())
+    assert "ix_news_unanalyzed" in details
+    assert "TEMP B-TREE" not in details
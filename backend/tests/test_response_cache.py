@@ -0,0 +1,77 @@
+from datetime import datetime
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.api.endpoints import news as news_endpoints
+from app.db.database import AsyncSessionLocal
+from app.db.models import News
+from app.schemas.news import NewsAnalysisUpdate, NewsCreate
+from app.services.analysis import save_analysis
+from app.services.ingestion import bulk_upsert_news
+from app.services.response_cache import ResponseCache, is_not_modified, response_cache
+
+def test_conditional_get_matching():
+    updated_at = datetime(2026, 1, 2, 3, 4, 5, 600000)
+    assert is_not_modified('"v7"', None, 7, updated_at)
+    assert is_not_modified('W/"v7", "v8"', None, 8, updated_at)
+    assert is_not_modified("*", None, 7, updated_at)
+    assert not is_not_modified('"v6"', "Fri, 02 Jan 2026 03:04:05 GMT", 7, updated_at)
+    assert is_not_modified(None, "Fri, 02 Jan 2026 03:04:05 GMT", 7, updated_at)
+    assert not is_not_modified(None, "Fri, 02 Jan 2026 03:04:04 GMT", 7, updated_at)
+    assert not is_not_modified(None, "not a date", 7, updated_at)
+    assert not is_not_modified(None, "Fri, 02 Jan 2026 03:04:05 GMT", 0, None)
+
+def test_response_cache_lru_and_versions():
+    cache = ResponseCache(max_size=2)
+    cache.set("a", 1, b"a1", {})
+    cache.set("b", 1, b"b1", {})
+    assert cache.get("a", 1).body == b"a1"
+    cache.set("c", 1, b"c1", {})  # 가장 오래 사용하지 않은 b 제거
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 2) is None  # 버전이 바뀌면 무효
+    assert cache.get("a", 1) is None
+
+async def test_news_list_etag_and_cache(monkeypatch):
+    async with AsyncSessionLocal() as db:
+        [saved] = await bulk_upsert_news(db, [NewsCreate(title="etag", url="https://example.com/etag/1")])
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        params = {"limit": 1000, "fields": "id,summary"}
+        first = await ac.get("/api/v1/news", params=params)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "no-cache"
+        assert "last-modified" in first.headers
+
+        async def no_db_rows(*args, **kwargs):
+            raise AssertionError("news rows must not be queried")
+
+        monkeypatch.setattr(news_endpoints, "fetch_news_page", no_db_rows)
+        # If-None-Match 일치: 본문 없이 304
+        not_modified = await ac.get("/api/v1/news", params=params, headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+        not_modified = await ac.get("/api/v1/news", params=params,
+                                    headers={"If-Modified-Since": first.headers["last-modified"]})
+        assert not_modified.status_code == 304
+
+        # 같은 파라미터 반복 요청: 직렬화된 응답 캐시에서 반환
+        hits = response_cache.hits
+        cached = await ac.get("/api/v1/news", params=params)
+        assert cached.status_code == 200
+        assert cached.content == first.content
+        assert cached.headers["etag"] == etag
+        assert response_cache.hits == hits + 1
+        monkeypatch.undo()
+
+        # 분석 결과 저장 시 버전 증가 -> ETag 변경, 캐시 무효화
+        async with AsyncSessionLocal() as db:
+            news = await db.get(News, saved.id)
+            await save_analysis(db, news, NewsAnalysisUpdate(
+                summary="etag summary", sentiment_label="neutral", sentiment_score=0.0, keywords=[]))
+        updated = await ac.get("/api/v1/news", params=params, headers={"If-None-Match": etag})
+        assert updated.status_code == 200
+        assert updated.headers["etag"] != etag
+        assert {"id": saved.id, "summary": "etag summary"} in updated.json()
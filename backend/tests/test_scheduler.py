@@ -0,0 +1,100 @@
+import asyncio
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.db.database import engine
+from app.main import app
+from app.services.crawler import crawler
+from app.services.scheduler import IngestionScheduler
+
+@pytest.mark.asyncio
+async def test_watchlist_crud_and_run():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.post("/api/v1/watchlist", json={"query": "Scheduler", "interval_seconds": 600})
+        assert response.status_code == 201
+        watch = response.json()
+        assert watch["next_run_at"] is None
+
+        duplicate = await ac.post("/api/v1/watchlist", json={"query": "Scheduler"})
+        assert duplicate.status_code == 409
+        # 동시 등록도 하나만 성공 (유니크 제약 위반은 409)
+        racing = await asyncio.gather(*(ac.post("/api/v1/watchlist", json={"query": "SchedulerRace"}) for _ in range(2)))
+        assert sorted(r.status_code for r in racing) == [201, 409]
+        created = next(r.json() for r in racing if r.status_code == 201)
+        assert (await ac.delete(f"/api/v1/watchlist/{created['id']}")).status_code == 204
+        too_many = await ac.post("/api/v1/watchlist", json={"query": "Deep", "pages": 1000})
+        assert too_many.status_code == 422
+
+        # 즉시 실행 (API Key 없음 -> Mock 데이터)
+        response = await ac.post(f"/api/v1/watchlist/{watch['id']}/run")
+        assert response.status_code == 200
+        ran = response.json()
+        assert ran["last_article_count"] == 3
+        assert ran["last_new_count"] == 3
+        assert ran["newest_published_at"] is not None
+        assert ran["next_run_at"] is not None
+        assert ran["last_latency_ms"] >= 0
+
+        # 두 번째 실행에서는 신규 기사가 없어야 함
+        response = await ac.post(f"/api/v1/watchlist/{watch['id']}/run")
+        assert response.json()["last_new_count"] == 0
+
+        response = await ac.patch(f"/api/v1/watchlist/{watch['id']}", json={"enabled": False})
+        assert response.json()["enabled"] is False
+
+        status = await ac.get("/api/v1/watchlist/status")
+        assert status.status_code == 200
+        assert any(w["query"] == "Scheduler" for w in status.json()["watches"])
+
+        response = await ac.delete(f"/api/v1/watchlist/{watch['id']}")
+        assert response.status_code == 204
+        response = await ac.get("/api/v1/watchlist")
+        assert all(w["id"] != watch["id"] for w in response.json())
+
+@pytest.mark.asyncio
+async def test_failed_run_backs_off(monkeypatch):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.post("/api/v1/watchlist", json={"query": "Flaky", "interval_seconds": 60})
+        watch_id = response.json()["id"]
+
+    async def failing_search(*args, **kwargs):
+        raise RuntimeError("NewsAPI down")
+
+    monkeypatch.setattr(crawler, "search_news", failing_search)
+    scheduler = IngestionScheduler()
+    assert await scheduler.run_due() >= 1
+    watch = await scheduler.run_query(watch_id)
+    assert watch.consecutive_failures == 2
+    assert watch.last_error == "NewsAPI down"
+    # 실행 간격 60초 * 2^2 (±jitter) 이후로 연기
+    assert (watch.next_run_at - watch.last_run_at).total_seconds() > 60 * 4 * 0.8
+    assert scheduler.total_failures == 2
+
+@pytest.mark.asyncio
+async def test_run_does_not_hold_db_connection_while_crawling(monkeypatch):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.post("/api/v1/watchlist", json={"query": "NoHold"})
+        watch_id = response.json()["id"]
+
+        checked_out = []
+        original = crawler.search_news
+
+        async def search(*args, **kwargs):
+            checked_out.append(engine.pool.checkedout())
+            return await original(*args, **kwargs)
+
+        monkeypatch.setattr(crawler, "search_news", search)
+        response = await ac.post(f"/api/v1/watchlist/{watch_id}/run")
+    assert response.json()["last_new_count"] == 3
+    assert checked_out == [0]
+
+@pytest.mark.asyncio
+async def test_scheduler_start_stop():
+    scheduler = IngestionScheduler()
+    await scheduler.start()
+    assert scheduler.running
+    await asyncio.sleep(0)
+    await scheduler.stop()
+    assert not scheduler.running
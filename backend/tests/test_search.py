@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import delete
+from app.main import app
+from app.db.database import engine, AsyncSessionLocal
+from app.db.fts import rebuild_fts
+from app.db.models import News
+from app.schemas.news import NewsCreate
+from app.services.ingestion import bulk_upsert_news
+from app.services.search import build_match_query
+
+@pytest.fixture(scope="module")
+async def corpus():
+    items = [
+        NewsCreate(title="Quantumcorp unveils chip", url="https://example.com/fts/1",
+                   content="The quantumcorp processor doubles qubit counts.",
+                   published_at=datetime(2026, 1, 1, tzinfo=timezone.utc), sentiment_label="positive"),
+        NewsCreate(title="Markets slide", url="https://example.com/fts/2",
+                   content="Investors worry about quantumcorp supply issues.",
+                   published_at=datetime(2026, 2, 1, tzinfo=timezone.utc), sentiment_label="negative"),
+        NewsCreate(title="반도체 시장이 회복세", url="https://example.com/fts/3",
+                   content="퀀텀코프 반도체 수요가 늘고 있습니다.",
+                   published_at=datetime(2026, 3, 1, tzinfo=timezone.utc)),
+    ]
+    async with AsyncSessionLocal() as db:
+        return {n.url: n.id for n in await bulk_upsert_news(db, items)}
+
+def test_build_match_query_escapes_operators():
+    assert build_match_query('chip OR "x" NEAR(') == '"chip"* "OR"* "x"* "NEAR"*'
+    assert build_match_query("  ") == ""
+
+@pytest.mark.asyncio
+async def test_search_ranks_and_filters(corpus):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/api/v1/news/search", params={"q": "quantumcorp"})
+        assert response.status_code == 200
+        results = response.json()
+        assert [r["url"] for r in results] == ["https://example.com/fts/1", "https://example.com/fts/2"]
+        assert results[0]["score"] >= results[1]["score"]  # 제목 일치가 더 높은 점수
+        assert "<mark>" in results[0]["snippet"]
+
+        response = await ac.get("/api/v1/news/search", params={"q": "quantumcorp", "sentiment": "negative"})
+        assert [r["url"] for r in response.json()] == ["https://example.com/fts/2"]
+
+        response = await ac.get("/api/v1/news/search", params={"q": "quantumcorp", "date_to": "2026-01-15T00:00:00"})
+        assert [r["url"] for r in response.json()] == ["https://example.com/fts/1"]
+
+        # 접두 검색으로 조사가 붙은 한국어 단어도 검색
+        response = await ac.get("/api/v1/news/search", params={"q": "회복"})
+        assert [r["url"] for r in response.json()] == ["https://example.com/fts/3"]
+
+@pytest.mark.asyncio
+async def test_index_follows_updates_and_rebuild(corpus):
+    news_id = corpus["https://example.com/fts/3"]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        # 분석 결과(요약/키워드) 업데이트가 인덱스에 반영
+        await ac.post(f"/api/v1/news/analysis/{news_id}")
+        response = await ac.get("/api/v1/news/search", params={"q": "지속적인 성장"})
+        assert news_id in [r["id"] for r in response.json()]
+
+        async with engine.begin() as conn:
+            await conn.run_sync(rebuild_fts)
+        response = await ac.get("/api/v1/news/search", params={"q": "quantumcorp"})
+        assert len(response.json()) == 2
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(News).where(News.id == corpus["https://example.com/fts/1"]))
+            await db.commit()
+        response = await ac.get("/api/v1/news/search", params={"q": "quantumcorp"})
+        assert [r["url"] for r in response.json()] == ["https://example.com/fts/2"]
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import httpx
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from openai import AsyncOpenAI
+from pydantic import ValidationError
+from app.core.config import Settings, settings
+from app.services.analyzer import PACKED_SUMMARY_SYSTEM_PROMPT, SUMMARY_SYSTEM_PROMPT, SYSTEM_PROMPT, NewsAnalyzer
+from app.services.sentiment import LexiconSentimentModel
+
+POSITIVE_EN = "Stocks rallied as strong earnings boosted investor confidence"
+NEGATIVE_EN = "Shares plunged after the company warned of weaker demand and layoffs"
+POSITIVE_KO = "반도체 수출이 급증하며 실적 개선 기대감이 커졌다"
+NEGATIVE_KO = "경기 침체 우려로 주가가 급락했다"
+NEUTRAL = "The committee will meet on Tuesday to discuss the schedule"
+
+def fake_openai_app(label="neutral", score=0.0):
+    """요약 전용 프롬프트(감성 요청 없음)에는 summary만 반환 (app.state.prompts: 시스템 프롬프트 기록)"""
+    app = FastAPI()
+    app.state.prompts = []
+
+    @app.post("/v1/chat/completions")
+    async def completions(body: dict):
+        prompt = body["messages"][0]["content"]
+        app.state.prompts.append(prompt)
+        result = {"summary": "요약"}
+        if "sentiment" in prompt:
+            result.update(sentiment_label=label, sentiment_score=score)
+        user = body["messages"][-1]["content"]
+        if user.startswith("["): # 묶음 요청
+            content = json.dumps({"results": [{"id": a["id"], **result} for a in json.loads(user)]})
+        else:
+            content = json.dumps(result)
+        return {
+            "id": "chatcmpl-test", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+        }
+
+    return app
+
+def _analyzer(app=None):
+    analyzer = NewsAnalyzer()
+    if app is None:
+        # 항상 500을 반환하는 서버 (요청 실패 경로)
+        transport = httpx.MockTransport(lambda request: httpx.Response(500))
+        http_client = httpx.AsyncClient(transport=transport)
+    else:
+        http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    analyzer.client = AsyncOpenAI(api_key="test-key", base_url="http://fake-openai/v1",
+                                  http_client=http_client, max_retries=0)
+    return analyzer
+
+@pytest.fixture(autouse=True)
+def sentiment_settings(monkeypatch):
+    monkeypatch.setattr(settings, "USE_MOCK_DATA", False)
+    monkeypatch.setattr(settings, "ANALYSIS_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "ANALYSIS_PACK_SIZE", 1)
+
+def test_lexicon_model_scores_english_and_korean():
+    model = LexiconSentimentModel.from_lexicon()
+    results = model.predict_many([POSITIVE_EN, NEGATIVE_EN, POSITIVE_KO, NEGATIVE_KO, NEUTRAL, ""])
+    assert [label for label, _ in results] == ["positive", "negative", "positive", "negative", "neutral", "neutral"]
+    assert all(-1.0 <= score <= 1.0 for _, score in results)
+
+def test_batch_matches_single():
+    model = LexiconSentimentModel.from_lexicon()
+    texts = [POSITIVE_EN, NEGATIVE_KO, NEUTRAL] * 50
+    batch = model.score_many(texts)
+    single = np.array([model.score_many([text])[0] for text in texts])
+    assert np.allclose(batch, single)
+
+def test_save_and_load(tmp_path):
+    model = LexiconSentimentModel.from_lexicon({"gain": 1.0, "하락": -1.0})
+    path = tmp_path / "sentiment.npz"
+    model.save(str(path))
+    loaded = LexiconSentimentModel.load(str(path))
+    assert loaded.terms == ["gain", "하락"]
+    assert loaded.predict("profits gained") == model.predict("profits gained")
+    assert loaded.predict("주가 하락세")[0] == "negative"
+
+async def test_fallback_mode_uses_local_model_when_llm_fails(monkeypatch):
+    monkeypatch.setattr(settings, "SENTIMENT_MODE", "fallback")
+    result = await _analyzer().analyze_content("Market crash", NEGATIVE_EN)
+    assert result.sentiment_label == "negative"
+
+    # LLM 성공 시에는 LLM 결과 유지
+    result = await _analyzer(fake_openai_app("neutral", 0.0)).analyze_content("Market crash", NEGATIVE_EN)
+    assert (result.summary, result.sentiment_label) == ("요약", "neutral")
+
+async def test_llm_mode_keeps_mock_on_failure(monkeypatch):
+    monkeypatch.setattr(settings, "SENTIMENT_MODE", "llm")
+    result = await _analyzer().analyze_content("Market crash", NEGATIVE_EN)
+    assert result.sentiment_label == "positive"
+
+async def test_unexpected_llm_label_is_not_saved(monkeypatch):
+    monkeypatch.setattr(settings, "SENTIMENT_MODE", "llm")
+    result = await _analyzer(fake_openai_app("bullish", 0.8)).analyze_content("Market crash", NEGATIVE_EN)
+    assert (result.summary, result.sentiment_label, result.sentiment_score) == ("요약", "neutral", 0.0)
+
+    # fallback 모드에서는 로컬 모델로 감성을 채움
+    monkeypatch.setattr(settings, "SENTIMENT_MODE", "fallback")
+    result = await _analyzer(fake_openai_app("bullish", 0.8)).analyze_content("Market crash", NEGATIVE_EN)
+    assert (result.summary, result.sentiment_label) == ("요약", "negative")
+
+async def test_primary_mode_asks_llm_for_summary_only(monkeypatch):
+    monkeypatch.setattr(settings, "SENTIMENT_MODE", "primary")
+    app = fake_openai_app("positive", 0.9)
+    result = await _analyzer(app).analyze_content("Market crash", NEGATIVE_EN)
+    assert result.summary == "요약"
+    assert result.sentiment_label == "negative"
+    assert app.state.prompts == [SUMMARY_SYSTEM_PROMPT]
+
+async def test_prefilter_mode_uses_llm_only_for_uncertain(monkeypatch):
+    monkeypatch.setattr(settings, "SENTIMENT_MODE", "prefilter")
+    monkeypatch.setattr(settings, "SENTIMENT_PREFILTER_THRESHOLD", 0.5)
+    analyzer = _analyzer(fake_openai_app("positive", 0.4))
+    confident = await analyzer.analyze_content("Market crash", NEGATIVE_EN)
+    uncertain = await analyzer.analyze_content("Board meeting", NEUTRAL)
+    assert confident.sentiment_label == "negative"
+    assert (uncertain.sentiment_label, uncertain.sentiment_score) == ("positive", 0.4)
+
+async def test_prefilter_packs_summary_only_and_full_prompts_separately(monkeypatch):
+    monkeypatch.setattr(settings, "SENTIMENT_MODE", "prefilter")
+    monkeypatch.setattr(settings, "SENTIMENT_PREFILTER_THRESHOLD", 0.5)
+    monkeypatch.setattr(settings, "ANALYSIS_PACK_SIZE", 3)
+    app = fake_openai_app("positive", 0.4)
+    analyzer = _analyzer(app)
+    crash, rally, meeting = await asyncio.gather(
+        analyzer.analyze_content("Market crash", NEGATIVE_EN),
+        analyzer.analyze_content("Rally", POSITIVE_EN),
+        analyzer.analyze_content("Board meeting", NEUTRAL),
+    )
+    # 로컬 점수가 확실한 두 기사는 요약 전용 묶음 요청, 애매한 기사만 감성 포함 프롬프트
+    assert sorted(app.state.prompts) == sorted([PACKED_SUMMARY_SYSTEM_PROMPT, SYSTEM_PROMPT])
+    assert [(r.summary, r.sentiment_label) for r in (crash, rally)] == [("요약", "negative"), ("요약", "positive")]
+    assert (meeting.sentiment_label, meeting.sentiment_score) == ("positive", 0.4)
+
+def test_sentiment_mode_is_validated():
+    with pytest.raises(ValidationError):
+        Settings(SENTIMENT_MODE="local")
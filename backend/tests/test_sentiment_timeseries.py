@@ -0,0 +1,128 @@
+from datetime import datetime
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event, select
+from app.main import app
+from app.db.database import engine, AsyncSessionLocal
+from app.db.models import News, SentimentRollup
+from app.schemas.news import NewsAnalysisUpdate, NewsCreate
+from app.services.analysis import save_analysis
+from app.services.ingestion import bulk_upsert_news
+from app.services import keyword_index, sentiment_rollup
+from app.services.keyword_index import rebuild_keyword_index
+from app.services.sentiment_rollup import BIN_COUNT, _percentile, score_bin
+
+def test_score_bins_and_percentiles():
+    assert score_bin(None) == -1
+    assert score_bin(-1.0) == 0
+    assert score_bin(1.0) == BIN_COUNT - 1
+    histogram = [0] * BIN_COUNT
+    for score in (-0.5, 0.0, 0.5):
+        histogram[score_bin(score)] += 1
+    assert _percentile(histogram, 3, 50) == pytest.approx(0.05, abs=0.05)
+    assert _percentile(histogram, 3, 10) < 0 < _percentile(histogram, 3, 90)
+
+async def _analyze(news_id, label, score, keywords):
+    async with AsyncSessionLocal() as db:
+        news = await db.get(News, news_id)
+        await save_analysis(db, news, NewsAnalysisUpdate(
+            summary="s", sentiment_label=label, sentiment_score=score, keywords=keywords))
+
+async def _snapshot():
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(
+            select(
+                SentimentRollup.granularity, SentimentRollup.keyword, SentimentRollup.bucket_start,
+                SentimentRollup.label, SentimentRollup.score_bin, SentimentRollup.article_count,
+                SentimentRollup.score_sum,
+            ).where(
+                SentimentRollup.article_count > 0,
+                # 다른 테스트의 기사와 겹치지 않는 기간만 비교
+                SentimentRollup.bucket_start.between(datetime(2020, 3, 1), datetime(2020, 3, 4)),
+            )
+        )).all()
+    return sorted((*r[:6], round(r[6], 6)) for r in rows)
+
+async def test_sentiment_timeseries_rollups():
+    day = datetime(2020, 3, 2)
+    items = [
+        NewsCreate(title=f"ts{i}", url=f"https://example.com/ts/{i}", published_at=day.replace(hour=hour))
+        for i, hour in enumerate((1, 1, 5, 23))
+    ]
+    async with AsyncSessionLocal() as db:
+        saved = await bulk_upsert_news(db, items)
+    ids = [n.id for n in saved]
+    await _analyze(ids[0], "positive", 0.8, ["tschip"])
+    await _analyze(ids[1], "negative", -0.6, ["tschip", "tsai"])
+    await _analyze(ids[2], "positive", 0.4, ["tschip"])
+    # 분석되지 않은 기사(ids[3])는 집계에서 제외
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        params = {"keyword": " TSChip ", "bucket": "day", "start": "2020-03-01T00:00:00Z", "end": "2020-03-03T00:00:00Z"}
+        response = await ac.get("/api/v1/news/sentiment/timeseries", params=params)
+        assert response.status_code == 200
+        series = response.json()
+        assert [b["bucket_start"] for b in series] == ["2020-03-01T00:00:00", "2020-03-02T00:00:00", "2020-03-03T00:00:00"]
+        assert series[0]["count"] == 0 and series[0]["p50"] is None
+        bucket = series[1]
+        assert bucket["count"] == 3
+        assert bucket["label_counts"] == {"positive": 2, "negative": 1, "neutral": 0}
+        assert bucket["avg_sentiment_score"] == pytest.approx(0.2)
+        assert bucket["p10"] <= bucket["p50"] <= bucket["p90"]
+        assert 0.3 <= bucket["p50"] <= 0.5
+
+        params = {"keyword": "tschip", "bucket": "hour", "start": "2020-03-02T00:00:00", "end": "2020-03-02T23:00:00"}
+        series = (await ac.get("/api/v1/news/sentiment/timeseries", params=params)).json()
+        assert len(series) == 24
+        assert {b["bucket_start"][11:13]: b["count"] for b in series if b["count"]} == {"01": 2, "05": 1}
+
+        # 재분석: 이전 기여분이 빠지고 새 라벨/키워드가 반영
+        await _analyze(ids[1], "neutral", 0.0, ["tsai"])
+        params = {"keyword": "tschip", "start": "2020-03-02T00:00:00", "end": "2020-03-02T00:00:00"}
+        [bucket] = (await ac.get("/api/v1/news/sentiment/timeseries", params=params)).json()
+        assert bucket["label_counts"] == {"positive": 2, "negative": 0, "neutral": 0}
+        assert bucket["avg_sentiment_score"] == pytest.approx(0.6)
+
+        # 키워드 없이 조회하면 전체 기사
+        params = {"start": "2020-03-02T00:00:00", "end": "2020-03-02T00:00:00"}
+        [bucket] = (await ac.get("/api/v1/news/sentiment/timeseries", params=params)).json()
+        assert bucket["label_counts"] == {"positive": 2, "negative": 0, "neutral": 1}
+
+        params = {"bucket": "hour", "start": "2020-01-01T00:00:00", "end": "2021-01-01T00:00:00"}
+        assert (await ac.get("/api/v1/news/sentiment/timeseries", params=params)).status_code == 400
+
+    # 전체 재생성 결과가 증분 갱신 결과와 같아야 함
+    incremental = await _snapshot()
+    async with AsyncSessionLocal() as db:
+        await rebuild_keyword_index(db, chunk_size=2)
+    assert await _snapshot() == incremental
+
+async def test_rollup_upserts_lock_rows_in_primary_key_order():
+    # 동시 save_analysis 트랜잭션이 같은 집계 행을 같은 순서로 잠그도록 기본 키 순으로 갱신
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    sentiment_delta, keyword_delta = {}, {}
+    for hour, keywords in ((5, ["zinc", "alpha"]), (1, ["mango"])):
+        timestamp = datetime(2026, 3, 1, hour)
+        sentiment_rollup.accumulate(sentiment_delta, timestamp, keywords, "positive", 0.4, +1)
+        keyword_index._accumulate(keyword_delta, timestamp, keywords, 0.4, +1)
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with AsyncSessionLocal() as db:
+            await sentiment_rollup.apply_delta(db, sentiment_delta)
+            await keyword_index._apply_rollup_delta(db, keyword_delta)
+            await db.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    # VALUES는 테이블 컬럼 순서 (기본 키 granularity, keyword, bucket_start, label, score_bin 먼저)
+    [sentiment_params] = [p for sql, p in statements if "INTO sentiment_rollups" in sql]
+    keys = [tuple(sentiment_params[i:i + 5]) for i in range(0, len(sentiment_params), 7)]
+    assert len(keys) == 9 and keys == sorted(keys)
+    [keyword_params] = [p for sql, p in statements if "INTO keyword_hourly_rollups" in sql]
+    rollup_keys = [tuple(keyword_params[i:i + 2]) for i in range(0, len(keyword_params), 5)]
+    assert len(rollup_keys) == 3 and rollup_keys == sorted(rollup_keys)
@@ -0,0 +1,107 @@
+import asyncio
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.schemas.news import NewsAnalysisUpdate, NewsCreate
+from app.services import analysis, crawl_cache as crawl_cache_module
+from app.services.crawl_cache import crawl_cache, crawl_key, crawl_news
+from app.services.ingestion import bulk_upsert_news
+from app.utils.singleflight import SingleFlight
+
+@pytest.fixture(autouse=True)
+def clear_crawl_cache():
+    crawl_cache.clear()
+    yield
+    crawl_cache.clear()
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+    assert results == [1] * 5
+    assert flight.stats() == {"in_flight": 0, "executions": 1, "shared": 4}
+    # 완료 후에는 결과를 보관하지 않음
+    assert await flight.do("k", work) == 2
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_cancelled_waiter_does_not_cancel_others():
+    flight = SingleFlight("test")
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise RuntimeError("upstream down")
+
+    first = asyncio.create_task(flight.do("k", failing))
+    second = asyncio.create_task(flight.do("k", failing))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+    with pytest.raises(RuntimeError, match="upstream down"):
+        await second
+    assert first.cancelled()
+    assert flight.in_flight() == 0
+
+def test_crawl_key_normalizes_queries():
+    assert crawl_key(["AI  Chips", "nvidia"], 1) == crawl_key(["Nvidia", "ai chips", "NVIDIA "], 1)
+    assert crawl_key("ai chips", 1) != crawl_key("ai chips", 2)
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_call_newsapi_once_and_cache(monkeypatch):
+    calls = []
+
+    async def slow_search(query, pages=1, known_urls=None, from_date=None):
+        calls.append(query)
+        await asyncio.sleep(0.05)
+        return [NewsCreate(title="Coalesced", url="https://example.com/coalesced/1", content="single flight body")]
+
+    monkeypatch.setattr(crawl_cache_module.crawler, "search_news", slow_search)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        responses = await asyncio.gather(*(
+            ac.post("/api/v1/news/search", params={"query": q}) for q in ("Coalesce", "coalesce", " COALESCE ")
+        ))
+        assert [r.status_code for r in responses] == [200] * 3
+        assert {r.json()[0]["url"] for r in responses} == {"https://example.com/coalesced/1"}
+        assert calls == [["Coalesce"]]
+
+        # TTL 이내의 같은 검색은 캐시 사용
+        assert (await ac.post("/api/v1/news/search", params={"query": "coalesce"})).status_code == 200
+        assert len(calls) == 1
+
+    monkeypatch.setattr(crawl_cache, "ttl_seconds", 0)
+    crawl_cache.clear()
+    await crawl_news("coalesce")
+    await crawl_news("coalesce")
+    assert len(calls) == 3
+
+@pytest.mark.asyncio
+async def test_concurrent_analysis_requests_call_llm_once(monkeypatch):
+    async with AsyncSessionLocal() as db:
+        [news] = await bulk_upsert_news(db, [
+            NewsCreate(title="Double click", url="https://example.com/coalesced/analysis", content="double click analysis body")
+        ])
+    calls = []
+
+    async def slow_analysis(title, content, keywords=None, raise_on_error=False):
+        calls.append(title)
+        await asyncio.sleep(0.05)
+        return NewsAnalysisUpdate(summary="shared summary", sentiment_label="positive", sentiment_score=0.5, keywords=keywords or [])
+
+    monkeypatch.setattr(settings, "USE_MOCK_DATA", False)
+    monkeypatch.setattr(analysis.analyzer, "analyze_content", slow_analysis)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        responses = await asyncio.gather(*(ac.post(f"/api/v1/news/analysis/{news.id}") for _ in range(3)))
+    assert [r.status_code for r in responses] == [200] * 3
+    assert {r.json()["summary"] for r in responses} == {"shared summary"}
+    assert calls == ["Double click"]
@@ -0,0 +1,129 @@
+import json
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from openai import AsyncOpenAI
+from app.main import app
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.models import News
+from app.schemas.news import NewsCreate
+from app.services import analysis
+from app.services.ingestion import bulk_upsert_news
+from app.utils.json_stream import JsonStringFieldExtractor
+
+SUMMARY = '- 첫째 "인용" 줄\n- 둘째 줄 \U0001F600\n- 셋째 줄'
+
+def fake_streaming_openai_app(chunk_size=5):
+    """stream=True 요청에 chat.completion.chunk SSE로 응답하는 OpenAI 호환 대역 서버"""
+    fake = FastAPI()
+    fake.state.requests = []
+
+    @fake.post("/v1/chat/completions")
+    async def completions(body: dict):
+        fake.state.requests.append(body)
+        assert body["stream"] is True
+        # ensure_ascii=True: \uXXXX 이스케이프와 서로게이트 쌍이 청크 경계에 걸리도록
+        content = json.dumps({"summary": SUMMARY, "sentiment_label": "positive", "sentiment_score": 0.6})
+
+        def chunk(delta, finish_reason=None):
+            payload = {
+                "id": "chatcmpl-test", "object": "chat.completion.chunk", "created": 0, "model": body["model"],
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        async def events():
+            yield chunk({"role": "assistant", "content": ""})
+            for i in range(0, len(content), chunk_size):
+                yield chunk({"content": content[i:i + chunk_size]})
+            yield chunk({}, "stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return fake
+
+def parse_sse(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+@pytest.fixture
+def streaming_client(monkeypatch):
+    fake = fake_streaming_openai_app()
+    http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake))
+    client = AsyncOpenAI(api_key="test-key", base_url="http://fake-openai/v1", http_client=http_client)
+    monkeypatch.setattr(settings, "USE_MOCK_DATA", False)
+    monkeypatch.setattr(settings, "ANALYSIS_CACHE_ENABLED", False)
+    monkeypatch.setattr(analysis.analyzer, "client", client)
+    return fake
+
+async def _create_news(title):
+    async with AsyncSessionLocal() as db:
+        [news] = await bulk_upsert_news(db, [NewsCreate(
+            title=title,
+            content=f"{title} 본문입니다. 반도체 수출이 크게 늘었습니다.",
+            url=f"http://example.com/stream/{title}",
+            source="Test",
+        )])
+        return news.id
+
+def test_extractor_handles_escapes_split_across_chunks():
+    text = json.dumps({"sentiment_label": "neutral", "summary": SUMMARY, "sentiment_score": 0.1})
+    for size in (1, 2, 3, 7):
+        extractor = JsonStringFieldExtractor("summary")
+        out = "".join(extractor.feed(text[i:i + size]) for i in range(0, len(text), size))
+        assert out == SUMMARY
+        assert extractor.done
+
+def test_extractor_ignores_text_before_field():
+    extractor = JsonStringFieldExtractor("summary")
+    assert extractor.feed('{"title": "summary", "sum') == ""
+    assert extractor.feed('mary": "ab') == "ab"
+    assert extractor.feed('c", "summary": "x"}') == "c"
+    assert extractor.done
+
+async def test_stream_endpoint_forwards_summary_tokens(streaming_client):
+    news_id = await _create_news("스트리밍 분석")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get(f"/api/v1/news/analysis/{news_id}/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(response.text)
+    deltas = [data["delta"] for event, data in events if event == "summary"]
+    assert len(deltas) > 1
+    assert "".join(deltas) == SUMMARY
+    assert [event for event, _ in events[-2:]] == ["sentiment", "done"]
+    assert events[-2][1] == {"sentiment_label": "positive", "sentiment_score": 0.6}
+    assert events[-1][1]["summary"] == SUMMARY
+    assert len(streaming_client.state.requests) == 1
+
+    async with AsyncSessionLocal() as db:
+        news = await db.get(News, news_id)
+        assert news.summary == SUMMARY
+        assert news.sentiment_label == "positive"
+        assert news.keywords
+
+async def test_stream_endpoint_mock_mode(monkeypatch):
+    monkeypatch.setattr(settings, "USE_MOCK_DATA", True)
+    news_id = await _create_news("모의 스트리밍")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get(f"/api/v1/news/analysis/{news_id}/stream")
+
+    events = parse_sse(response.text)
+    summary = "".join(data["delta"] for event, data in events if event == "summary")
+    assert events[-1][0] == "done"
+    assert events[-1][1]["summary"] == summary
+
+async def test_stream_endpoint_not_found():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/api/v1/news/analysis/999999/stream")
+    assert response.status_code == 404
@@ -0,0 +1,68 @@
+import random
+import re
+from collections import Counter
+from app.utils.text import ENGLISH_STOPWORDS, KOREAN_STOPWORDS, TextProcessor
+
+# 기존(단계별 re.sub) 구현 - 결과 동일성 비교용
+def legacy_clean_text(text):
+    if not text:
+        return ""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'http\S+|www\.\S+', '', text)
+    text = re.sub(r'[^a-zA-Z0-9가-힣\s.,!?\'"]', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+def legacy_extract_keywords(text, top_n=5):
+    if not text:
+        return []
+    words = []
+    for w in re.findall(r'\b[a-zA-Z가-힣]{2,}\b', text.lower()):
+        if re.match(r'[a-z]', w):
+            if len(w) < 3 or w in ENGLISH_STOPWORDS:
+                continue
+        elif w in KOREAN_STOPWORDS:
+            continue
+        words.append(w)
+    return [word for word, count in Counter(words).most_common(top_n)]
+
+PIECES = (
+    "the market rallied after strong earnings from chipmakers while investors weighed inflation data".split()
+    + "반도체 시장이 회복세를 보이며 투자자들은 금리 인하 기대감 속에 기술주를 매수했다 있는 관련".split()
+    + ["<p class='x'>", "</b>", "https://example.com/a?b=1", "www.test.org/x", "—", "“", "’", "…",
+       "%", "$", "&amp;", "#", "AI", "Ab", "x2y", "Élan", "naïve", "co-op", "123", " ", "　"]
+)
+
+def _random_doc(rng):
+    return "".join(
+        rng.choice(PIECES) + rng.choice([" ", "  ", "\n", "\t", "", "\r\n"])
+        for _ in range(rng.randint(0, 60))
+    )
+
+def test_clean_text_golden():
+    assert TextProcessor.clean_text("") == ""
+    assert TextProcessor.clean_text(None) == ""
+    assert TextProcessor.clean_text("  <b>Hello</b>,\n\n  world!  ") == "Hello, world!"
+    assert TextProcessor.clean_text("see https://x.com/a?b=1 and www.y.org now") == "see and now"
+    assert TextProcessor.clean_text("가격 — 10% 상승…  “확정”") == "가격 10 상승 확정"
+
+def test_extract_keywords_golden():
+    text = "Chip chip CHIP demand rises; 반도체 반도체 수요 관련 the AI is up"
+    assert TextProcessor.extract_keywords(text, top_n=3) == ["chip", "반도체", "demand"]
+    assert TextProcessor.tokenize("AI and 관련 수요") == ["수요"]
+
+def test_matches_legacy_implementation():
+    rng = random.Random(11)
+    docs = [_random_doc(rng) for _ in range(500)]
+    for doc in docs:
+        assert TextProcessor.clean_text(doc) == legacy_clean_text(doc)
+        assert TextProcessor.extract_keywords(doc) == legacy_extract_keywords(doc)
+
+def test_batch_api_matches_single():
+    rng = random.Random(7)
+    docs = [_random_doc(rng) for _ in range(50)]
+    assert TextProcessor.clean_many(docs, processes=False) == [TextProcessor.clean_text(d) for d in docs]
+    assert TextProcessor.clean_many(docs, processes=True) == [TextProcessor.clean_text(d) for d in docs]
+    expected = [TextProcessor.extract_keywords(d, 3) for d in docs]
+    assert TextProcessor.extract_keywords_many(docs, 3, processes=False) == expected
+    assert TextProcessor.extract_keywords_many(docs, 3, processes=True) == expected
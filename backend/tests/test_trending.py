@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import select
+from app.main import app
+from app.db.database import AsyncSessionLocal
+from app.db.models import KeywordHourlyRollup, NewsKeyword
+from app.schemas.news import NewsAnalysisUpdate, NewsCreate
+from app.services.analysis import save_analysis
+from app.services.ingestion import bulk_upsert_news
+from app.services.keyword_index import normalize_keywords, rebuild_keyword_index
+
+def test_normalize_keywords():
+    assert normalize_keywords([" Chip ", "chip", "AI  Boom", ""]) == ["chip", "ai boom"]
+
+async def _snapshot():
+    async with AsyncSessionLocal() as db:
+        keywords = (await db.execute(select(NewsKeyword.news_id, NewsKeyword.keyword))).all()
+        rollups = (await db.execute(
+            select(
+                KeywordHourlyRollup.bucket_start, KeywordHourlyRollup.keyword,
+                KeywordHourlyRollup.article_count, KeywordHourlyRollup.sentiment_count,
+                KeywordHourlyRollup.sentiment_sum,
+            ).where(KeywordHourlyRollup.article_count > 0)
+        )).all()
+    return sorted(keywords), sorted((r[0], r[1], r[2], r[3], round(r[4], 6)) for r in rollups)
+
+@pytest.mark.asyncio
+async def test_trending_keywords_incremental_rollups():
+    now = datetime.now(timezone.utc)
+    items = [
+        NewsCreate(title="t1", url="https://example.com/trend/1", published_at=now,
+                   keywords=["trendchip", "trendai"], sentiment_score=0.5),
+        NewsCreate(title="t2", url="https://example.com/trend/2", published_at=now - timedelta(hours=2),
+                   keywords=["TrendChip"], sentiment_score=-0.1),
+        NewsCreate(title="t3", url="https://example.com/trend/3", published_at=now - timedelta(days=3),
+                   keywords=["trendchip", "trendold"]),
+    ]
+    async with AsyncSessionLocal() as db:
+        saved = await bulk_upsert_news(db, items)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/api/v1/news/keywords/trending", params={"hours": 24, "limit": 100})
+        assert response.status_code == 200
+        trending = {t["keyword"]: t for t in response.json()}
+        assert trending["trendchip"]["count"] == 2
+        assert trending["trendchip"]["avg_sentiment_score"] == pytest.approx(0.2)
+        assert trending["trendai"]["count"] == 1
+        assert "trendold" not in trending
+
+        # 재분석: 이전 기여분이 빠지고 새 키워드/점수가 반영
+        async with AsyncSessionLocal() as db:
+            news = await db.get(type(saved[1]), saved[1].id)
+            await save_analysis(db, news, NewsAnalysisUpdate(
+                summary="s", sentiment_label="negative", sentiment_score=-0.9, keywords=["trendai"]))
+
+        response = await ac.get("/api/v1/news/keywords/trending", params={"hours": 24, "limit": 100})
+        trending = {t["keyword"]: t for t in response.json()}
+        assert trending["trendchip"]["count"] == 1
+        assert trending["trendchip"]["avg_sentiment_score"] == pytest.approx(0.5)
+        assert trending["trendai"]["count"] == 2
+        assert trending["trendai"]["avg_sentiment_score"] == pytest.approx(-0.2)
+
+        response = await ac.get("/api/v1/news/keywords/trending", params={"hours": 24 * 7, "limit": 100})
+        assert "trendold" in {t["keyword"] for t in response.json()}
+
+    # 전체 재생성 결과가 증분 갱신 결과와 같아야 함
+    incremental = await _snapshot()
+    async with AsyncSessionLocal() as db:
+        await rebuild_keyword_index(db, chunk_size=2)
+    assert await _snapshot() == incremental